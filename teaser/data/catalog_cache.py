@@ -0,0 +1,554 @@
+"""This module holds the binary cache of the JSON catalogs.
+
+The JSON catalogs (type elements, materials and use conditions) are compiled
+into a directory of numpy arrays, one directory per catalog. Every record of
+a catalog is split into columns, one column per field: numeric fields are
+stored as float, integer or boolean arrays, lists of numbers (e.g. profiles,
+thickness lists or building age groups) as flat arrays with offsets, strings
+as indices into a string table and the layer stacks of type elements as
+index arrays into the string table together with the layer thicknesses. All
+arrays are loaded memory-mapped. A manifest holds the fingerprint of the
+source file (modification time and size), the cache is recompiled as soon as
+the source file changes.
+
+By default only the large catalogs shipped with TEASER (data/input/
+inputdata) are cached (see DEFAULT_CATALOGS and is_default_catalog()),
+caching other catalogs is opt-in.
+Caches of catalogs that were removed or changed are evicted whenever a
+catalog is compiled, clear_cache() removes the caches of a cache folder.
+"""
+
+import os
+import stat
+import shutil
+import json
+import hashlib
+import tempfile
+import warnings
+import collections
+import numpy as np
+import teaser.logic.utilities as utils
+
+CACHE_FORMAT = 1
+MANIFEST = "manifest.json"
+
+DEFAULT_CATALOGS = (
+    "MaterialTemplates.json",
+    "TypeElements_TABULA_DE.json",
+    "TypeElements_TABULA_DK.json",
+)
+"""Shipped catalogs that are loaded faster from the cache than with json"""
+
+# the umask can only be read by setting it, thus it is read once on import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def get_cache_dir(path, cache_path=None):
+    """Return the cache directory of a JSON catalog.
+
+    The directory name consists of the file name of the catalog and a hash
+    of its full path, thus catalogs with the same file name in different
+    folders do not share a cache.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON catalog
+    cache_path : str
+        Folder of the catalog caches, default is utilities.
+        get_default_cache_path()
+
+    Returns
+    ----------
+    cache_dir : str
+        Full path to the cache directory of the catalog
+
+    """
+    if cache_path is None:
+        cache_path = utils.get_default_cache_path()
+    path = os.path.normcase(os.path.abspath(path))
+    name = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_path, "{}_{}".format(name, digest))
+
+
+def is_shipped_catalog(path):
+    """Check if a file lies in the input data folder shipped with TEASER."""
+    input_path = utils.get_full_path(os.path.join("data", "input", "inputdata"))
+    return os.path.normcase(os.path.dirname(os.path.abspath(path))) == (
+        os.path.normcase(os.path.abspath(input_path))
+    )
+
+
+def is_default_catalog(path):
+    """Check if a file is one of the shipped DEFAULT_CATALOGS."""
+    return is_shipped_catalog(path) and (
+        os.path.basename(path) in DEFAULT_CATALOGS
+    )
+
+
+def clear_cache(cache_path=None, outdated_only=False, manifest_name=MANIFEST):
+    """Remove cache directories from a cache folder.
+
+    Parameters
+    ----------
+    cache_path : str
+        Folder of the caches, default is utilities.get_default_cache_path()
+    outdated_only : bool
+        If True, only caches whose source file was removed or changed since
+        the cache was compiled are removed (eviction). Default is False,
+        which removes all caches
+    manifest_name : str
+        File name of the manifest identifying the kind of caches to remove,
+        default is the manifest of the catalog caches
+
+    Returns
+    ----------
+    removed : list
+        Full paths of the removed cache directories
+
+    """
+    if cache_path is None:
+        cache_path = utils.get_default_cache_path()
+    if not os.path.isdir(cache_path):
+        return []
+    removed = []
+    for name in sorted(os.listdir(cache_path)):
+        cache_dir = os.path.join(cache_path, name)
+        manifest_path = os.path.join(cache_dir, manifest_name)
+        if not os.path.isfile(manifest_path):
+            continue
+        if outdated_only:
+            try:
+                with open(manifest_path, "r") as f:
+                    manifest = json.load(f)
+                if manifest.get("fingerprint") == get_fingerprint(
+                    manifest["source"]
+                ):
+                    continue
+            except (IOError, OSError, ValueError, KeyError, TypeError):
+                pass
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        removed.append(cache_dir)
+    return removed
+
+
+def get_fingerprint(path):
+    """Return the fingerprint (modification time and size) of a file."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def compile_catalog(path, binding=None, cache_path=None):
+    """Compile a JSON catalog into the binary cache.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON catalog
+    binding : collections.OrderedDict
+        Already loaded binding of the catalog, if None the JSON file is
+        parsed
+    cache_path : str
+        Folder of the catalog caches, default is utilities.
+        get_default_cache_path()
+
+    Returns
+    ----------
+    cache_dir : str
+        Full path to the cache directory of the catalog
+
+    """
+    fingerprint = get_fingerprint(path)
+    if binding is None:
+        with open(path, "r") as f:
+            binding = json.load(f, object_pairs_hook=collections.OrderedDict)
+
+    manifest, arrays = _encode(binding)
+    if _decode(manifest, _unpack(manifest, arrays)) != binding:
+        raise ValueError(
+            "The catalog {} can not be stored in the binary cache".format(path)
+        )
+    manifest["format"] = CACHE_FORMAT
+    manifest["source"] = os.path.abspath(path)
+    manifest["fingerprint"] = fingerprint
+
+    clear_cache(cache_path, outdated_only=True)
+    cache_dir = get_cache_dir(path, cache_path)
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    # arrays are replaced instead of overwritten, as other processes may
+    # hold memory maps of the former files, the manifest is written last
+    for name, array in arrays.items():
+        replace_file(
+            os.path.join(cache_dir, name + ".npy"),
+            lambda f, array=array: np.save(f, array, allow_pickle=False),
+        )
+    replace_file(
+        os.path.join(cache_dir, MANIFEST),
+        lambda f: f.write(json.dumps(manifest).encode("utf-8")),
+    )
+    return cache_dir
+
+
+def compile_catalogs(cache_path=None):
+    """Compile the DEFAULT_CATALOGS shipped with TEASER into the binary cache.
+
+    Parameters
+    ----------
+    cache_path : str
+        Folder of the catalog caches, default is utilities.
+        get_default_cache_path()
+
+    Returns
+    ----------
+    cache_dirs : list
+        Full paths to the cache directories of the catalogs
+
+    """
+    input_path = utils.get_full_path(os.path.join("data", "input", "inputdata"))
+    return [
+        compile_catalog(os.path.join(input_path, name), cache_path=cache_path)
+        for name in DEFAULT_CATALOGS
+    ]
+
+
+def load_catalog(path, cache_path=None):
+    """Load a JSON catalog from the binary cache.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON catalog
+    cache_path : str
+        Folder of the catalog caches, default is utilities.
+        get_default_cache_path()
+
+    Returns
+    ----------
+    binding : collections.OrderedDict
+        Ordered dictionary of the catalog, None if there is no cache of the
+        catalog or the cache is outdated
+
+    """
+    cache_dir = get_cache_dir(path, cache_path)
+    try:
+        with open(os.path.join(cache_dir, MANIFEST), "r") as f:
+            manifest = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if (
+        manifest.get("format") != CACHE_FORMAT
+        or manifest.get("fingerprint") != get_fingerprint(path)
+    ):
+        return None
+    try:
+        arrays = {
+            group: np.load(
+                os.path.join(cache_dir, group + ".npy"),
+                mmap_mode="r",
+                allow_pickle=False,
+            )
+            for group in manifest["groups"]
+        }
+        return _decode(manifest, _unpack(manifest, arrays))
+    except (IOError, OSError, ValueError, KeyError, IndexError):
+        return None
+
+
+def load_or_compile_catalog(path, cache_path=None):
+    """Load a JSON catalog from the cache, compile the cache if outdated.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON catalog
+    cache_path : str
+        Folder of the catalog caches, default is utilities.
+        get_default_cache_path()
+
+    Returns
+    ----------
+    binding : collections.OrderedDict
+        Ordered dictionary of the catalog
+
+    """
+    binding = load_catalog(path, cache_path)
+    if binding is not None:
+        return binding
+
+    with open(path, "r") as f:
+        binding = json.load(f, object_pairs_hook=collections.OrderedDict)
+    try:
+        compile_catalog(path, binding, cache_path)
+    except (IOError, OSError, ValueError, OverflowError) as error:
+        warnings.warn("Catalog cache not written: {}".format(error))
+    return binding
+
+
+def copy_file_mode(tmp_path, path):
+    """Give a temporary file the permissions of the file it replaces.
+
+    Files created with tempfile.mkstemp() are only accessible by their
+    owner. If path exists, its permission bits are copied to tmp_path,
+    otherwise tmp_path gets the permissions of a file created with open().
+
+    Parameters
+    ----------
+    tmp_path : str
+        Full path to the temporary file
+    path : str
+        Full path to the file that is replaced by the temporary file
+
+    """
+    if os.path.exists(path):
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    else:
+        mode = 0o666 & ~_UMASK
+    os.chmod(tmp_path, mode)
+
+
+def replace_file(path, write):
+    """Write a file to a unique temporary file and replace the target with it.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the target file
+    write : function
+        Function writing the content to the binary file object it is called
+        with
+
+    """
+    file_handle, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_handle, "wb") as f:
+            write(f)
+        copy_file_mode(tmp_path, path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _column_kind(values):
+    """Return the storage kind of all values of one field."""
+    if all(isinstance(v, bool) for v in values):
+        return "bool"
+    if all(isinstance(v, float) for v in values):
+        return "float"
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        return "int"
+    if all(isinstance(v, str) for v in values):
+        return "str"
+    if all(isinstance(v, list) for v in values):
+        items = [item for v in values for item in v]
+        if all(isinstance(item, float) for item in items):
+            return "float_list"
+        if all(isinstance(i, int) and not isinstance(i, bool) for i in items):
+            return "int_list"
+    if all(_is_layer_stack(v) for v in values):
+        return "layer"
+    return "json"
+
+
+def _is_layer_stack(value):
+    """Check if a value is a layer stack of a type element."""
+    if not isinstance(value, dict):
+        return False
+    for layer in value.values():
+        if (
+            not isinstance(layer, dict)
+            or list(layer.keys()) != ["thickness", "material"]
+            or not isinstance(layer["thickness"], float)
+            or not isinstance(layer["material"], dict)
+            or list(layer["material"].keys()) != ["name", "material_id"]
+            or not all(isinstance(v, str) for v in layer["material"].values())
+        ):
+            return False
+    return True
+
+
+def _encode(binding):
+    """Split a binding into a manifest and a dictionary of numpy arrays."""
+    header = collections.OrderedDict()
+    keys = []
+    records = []
+    for key, value in binding.items():
+        if isinstance(value, dict):
+            keys.append(key)
+            records.append(value)
+        else:
+            header[key] = value
+
+    strings = {}
+
+    def string_index(value):
+        return strings.setdefault(value, len(strings))
+
+    schemas = {}
+    schema_index = [
+        schemas.setdefault(tuple(record.keys()), len(schemas)) for record in records
+    ]
+    fields = []
+    for schema in schemas:
+        fields.extend(field for field in schema if field not in fields)
+
+    arrays = collections.OrderedDict()
+    arrays["keys"] = np.array([string_index(k) for k in keys], dtype=np.int64)
+    arrays["schema"] = np.array(schema_index, dtype=np.int64)
+    columns = []
+    for number, field in enumerate(fields):
+        values = [record[field] for record in records if field in record]
+        rows = [i for i, record in enumerate(records) if field in record]
+        kind = _column_kind(values)
+        name = "col{}".format(number)
+        columns.append([field, kind, name])
+        if kind in ("float", "int", "bool"):
+            dtype = {"float": np.float64, "int": np.int64, "bool": np.bool_}[kind]
+            column = np.zeros(len(records), dtype=dtype)
+            column[rows] = values
+            arrays[name] = column
+        elif kind in ("str", "json"):
+            if kind == "json":
+                values = [json.dumps(v) for v in values]
+            column = np.full(len(records), -1, dtype=np.int64)
+            column[rows] = [string_index(v) for v in values]
+            arrays[name] = column
+        elif kind in ("float_list", "int_list"):
+            lists = [record.get(field, []) for record in records]
+            dtype = np.float64 if kind == "float_list" else np.int64
+            arrays[name] = np.array(
+                [item for v in lists for item in v], dtype=dtype
+            )
+            arrays[name + "_offsets"] = _offsets(lists)
+        else:
+            stacks = [list(record.get(field, {}).items()) for record in records]
+            layers = [layer for stack in stacks for layer in stack]
+            arrays[name] = np.array(
+                [layer["thickness"] for _, layer in layers], dtype=np.float64
+            )
+            arrays[name + "_offsets"] = _offsets(stacks)
+            arrays[name + "_index"] = np.array(
+                [
+                    [
+                        string_index(layer_key),
+                        string_index(layer["material"]["name"]),
+                        string_index(layer["material"]["material_id"]),
+                    ]
+                    for layer_key, layer in layers
+                ],
+                dtype=np.int64,
+            ).reshape(-1, 3)
+
+    string_table = sorted(strings, key=strings.get)
+    arrays["strings"] = np.array(string_table, dtype=np.str_)
+    if any(s.endswith("\x00") for s in string_table):
+        raise ValueError("Strings ending with a null character are not supported")
+
+    manifest = collections.OrderedDict()
+    manifest["header"] = list(header.items())
+    manifest["header_first"] = bool(keys) and next(iter(binding)) not in keys
+    manifest["schemas"] = [list(schema) for schema in schemas]
+    manifest["columns"] = columns
+    return _pack(manifest, arrays)
+
+
+def _pack(manifest, arrays):
+    """Concatenate all arrays of the same data type into one array.
+
+    Fewer files make loading faster, the manifest keeps the position of each
+    array in its group.
+    """
+    groups = collections.OrderedDict()
+    positions = collections.OrderedDict()
+    for name, array in arrays.items():
+        group = "strings" if name == "strings" else array.dtype.kind
+        parts = groups.setdefault(group, [])
+        start = sum(part.size for part in parts)
+        positions[name] = [group, start, start + array.size, list(array.shape)]
+        parts.append(array.ravel())
+    manifest["groups"] = list(groups.keys())
+    manifest["arrays"] = positions
+    return manifest, {
+        group: np.concatenate(parts) for group, parts in groups.items()
+    }
+
+
+def _unpack(manifest, groups):
+    """Return views of all arrays of a catalog in their groups."""
+    return {
+        name: groups[group][start:stop].reshape(shape)
+        for name, (group, start, stop, shape) in manifest["arrays"].items()
+    }
+
+
+def _offsets(lists):
+    """Return the offsets of ragged lists in their flat array."""
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(v) for v in lists])
+    return offsets
+
+
+def _decode(manifest, arrays):
+    """Build the binding of a catalog from its manifest and arrays."""
+    strings = arrays["strings"].tolist()
+    keys = [strings[i] for i in arrays["keys"].tolist()]
+    n_records = len(keys)
+
+    values = {}
+    for field, kind, name in manifest["columns"]:
+        if kind in ("float", "int", "bool"):
+            values[field] = arrays[name].tolist()
+        elif kind == "str":
+            values[field] = [strings[i] for i in arrays[name].tolist()]
+        elif kind == "json":
+            values[field] = [
+                json.loads(strings[i], object_pairs_hook=collections.OrderedDict)
+                if i >= 0
+                else None
+                for i in arrays[name].tolist()
+            ]
+        elif kind in ("float_list", "int_list"):
+            flat = arrays[name].tolist()
+            offsets = arrays[name + "_offsets"].tolist()
+            values[field] = [
+                flat[offsets[i]:offsets[i + 1]] for i in range(n_records)
+            ]
+        else:
+            thickness = arrays[name].tolist()
+            index = arrays[name + "_index"].tolist()
+            offsets = arrays[name + "_offsets"].tolist()
+            layers = []
+            for thick, (layer_key, mat_name, mat_id) in zip(thickness, index):
+                material = collections.OrderedDict()
+                material["name"] = strings[mat_name]
+                material["material_id"] = strings[mat_id]
+                layer = collections.OrderedDict()
+                layer["thickness"] = thick
+                layer["material"] = material
+                layers.append((strings[layer_key], layer))
+            values[field] = [
+                collections.OrderedDict(layers[offsets[i]:offsets[i + 1]])
+                for i in range(n_records)
+            ]
+
+    schemas = [
+        [(field, values[field]) for field in schema]
+        for schema in manifest["schemas"]
+    ]
+    binding = collections.OrderedDict()
+    if manifest["header_first"]:
+        binding.update(manifest["header"])
+    for i, (key, schema) in enumerate(zip(keys, arrays["schema"].tolist())):
+        record = collections.OrderedDict()
+        for field, column in schemas[schema]:
+            record[field] = column[i]
+        binding[key] = record
+    if not manifest["header_first"]:
+        binding.update(manifest["header"])
+    return binding
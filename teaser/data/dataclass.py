@@ -1,7 +1,15 @@
 """This module holds file paths and bindings for json data."""
 import os
 import sys
+import copy
+import time
+import tempfile
+import contextlib
+import bisect
+import threading
 import teaser.logic.utilities as utils
+import teaser.data.catalog_cache as catalog_cache
+import teaser.data.input.material_input_json as material_input
 import json
 import collections
 
@@ -12,6 +20,67 @@ if v >= (2, 7):
     except NameError:
         FileNotFoundError = IOError
 
+_binding_registry = {}
+_binding_registry_lock = threading.Lock()
+
+
+def load_shared_binding(path, use_cache=False, cache_path=None):
+    """Load a JSON binding through the process-wide binding registry.
+
+    Parsed bindings are cached for the whole process, keyed by the full path
+    of the JSON file, and reused as long as modification time and size of
+    the file are unchanged. All DataClass instances loading the same file
+    therefore share one read-only binding instead of parsing the file again,
+    e.g. when a Project switches between 'iwu' and 'tabula_de'. A DataClass
+    copies a shared binding before changing it (see
+    DataClass.detach_binding()).
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON file
+    use_cache : bool
+        If True, the binding is loaded from the binary catalog cache (see
+        teaser.data.catalog_cache), which is compiled from the JSON file if
+        it does not exist or is outdated. If None, only the large catalogs
+        shipped with TEASER are loaded from the cache (see
+        catalog_cache.is_default_catalog()). Default is False.
+    cache_path : str
+        Folder of the catalog caches, default is utilities.
+        get_default_cache_path()
+
+    Returns
+    ----------
+    binding : collections.OrderedDict
+        Shared ordered dictionary of the JSON file, must not be changed
+
+    """
+    path = os.path.normcase(os.path.abspath(path))
+    stat = os.stat(path)
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+    with _binding_registry_lock:
+        cached = _binding_registry.get(path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    if use_cache is None:
+        use_cache = catalog_cache.is_default_catalog(path)
+    if use_cache:
+        binding = catalog_cache.load_or_compile_catalog(path, cache_path)
+    else:
+        with open(path, "r") as f:
+            binding = json.load(f, object_pairs_hook=collections.OrderedDict)
+    with _binding_registry_lock:
+        _binding_registry[path] = (fingerprint, binding)
+    return binding
+
+
+def clear_binding_registry():
+    """Remove all bindings from the process-wide binding registry."""
+    with _binding_registry_lock:
+        _binding_registry.clear()
+
 
 class DataClass(object):
     """Class for JSON data.
@@ -19,6 +88,18 @@ class DataClass(object):
     This class loads all JSON files with statistic or template data needed
     for statistical data enrichment.
 
+    Bindings of JSON files are shared with all other DataClass instances of
+    the process that load the same file (see load_shared_binding()), which
+    makes a new DataClass cheap. Shared bindings are read-only, a binding is
+    copied to this instance on the first change through the functions saving
+    type elements, materials or use conditions (copy-on-write).
+
+    The bindings are loaded lazily on first access of element_bind,
+    material_bind or conditions_bind, thus a DataClass that is only used to
+    load a saved project or to export computed buildings never parses the
+    catalogs. Loading is thread-safe, the time needed for each loaded
+    binding is recorded in load_times.
+
     Parameters
     ----------
     used_statistics : str
@@ -32,98 +113,510 @@ class DataClass(object):
     path_tb : str
         Full path to TypeBuildingElements.json. Default is
         teaser/data/input/inputdata/TypeBuildingElements.json.
+    element_index : dict
+        Lookup index of element_bind, keyed by element class and
+        construction type, holding the building age groups sorted by their
+        lower bound. The index is built on first use and reset whenever
+        element_bind is loaded or changed (see build_element_index()).
     material_bind : collections.OrderedDict
         Ordered dictionary of the Material binding.
     path_mat : str
         Full path to MaterialTemplates.json. Default is
         teaser/data/input/inputdata/MaterialTemplates.json.
+    material_index : dict
+        Lookup index of material_bind with the keys 'name' (material name
+        to material id), 'id' (material id to its record in material_bind)
+        and 'record' (interned immutable material records, see
+        find_material_record()). The index is built on first use and reset
+        whenever material_bind is loaded or changed (see
+        build_material_index()).
     conditions_bind : collections.OrderedDict
         Ordered dictionary of the UseConditions binding.
     path_uc : str
         Full path to UseConditions.json. Default is
         teaser/data/input/inputdata/UseConditions.json
+    shared_bindings : set
+        Names of the bindings ('element_bind', 'material_bind',
+        'conditions_bind') that are shared through the process-wide binding
+        registry and thus must not be changed in place.
+    use_cache : bool
+        If True, the bindings are loaded from the binary catalog cache,
+        which is compiled automatically when the JSON file has changed (see
+        teaser.data.catalog_cache). If None (default), only the large
+        catalogs shipped with TEASER (catalog_cache.DEFAULT_CATALOGS) are
+        cached, other JSON files are parsed. False disables the cache.
+    cache_path : str
+        Folder of the catalog caches, default is None, which uses
+        utilities.get_default_cache_path()
+    load_times : collections.OrderedDict
+        Time in seconds needed to load each binding, in order of first
+        access. Bindings that have never been accessed are not listed.
+    pending_writes : list
+        Names of the bindings changed in the current write session, which
+        are written to their JSON files when the session ends (see
+        write_session()). None outside of a write session.
 
     """
 
     def __init__(self, used_statistic="iwu"):
         """Construct DataClass."""
         self.used_statistic = used_statistic
-        self.element_bind = None
+        self.shared_bindings = set()
+        self.use_cache = None
+        self.cache_path = None
+        self.load_times = collections.OrderedDict()
+        self.pending_writes = None
+        self._load_lock = threading.RLock()
+        self._pending_bindings = set()
+        self._element_bind = None
+        self.element_index = None
         if self.used_statistic == "iwu":
             self.path_tb = utils.get_full_path(
                 "data/input/inputdata/TypeBuildingElements.json"
             )
-            self.load_tb_binding()
+            self._pending_bindings.add("element_bind")
         elif self.used_statistic == "tabula_de":
             self.path_tb = utils.get_full_path(
                 os.path.join(
                     "data", "input", "inputdata", "TypeElements_TABULA_DE.json"
                 )
             )
-            self.load_tb_binding()
+            self._pending_bindings.add("element_bind")
         elif self.used_statistic == "tabula_dk":
             self.path_tb = utils.get_full_path(
                 os.path.join(
                     "data", "input", "inputdata", "TypeElements_TABULA_DK.json"
                 )
             )
-            self.load_tb_binding()
+            self._pending_bindings.add("element_bind")
         elif self.used_statistic is None:
             pass
-        self.material_bind = None
+        self._material_bind = None
+        self.material_index = None
         self.path_mat = utils.get_full_path(
             "data/input/inputdata/MaterialTemplates.json"
         )
-        self.conditions_bind = None
+        self._conditions_bind = None
         self.path_uc = utils.get_full_path("data/input/inputdata/UseConditions.json")
-
-        self.load_uc_binding()
-        self.load_mat_binding()
+        self._pending_bindings.update(["material_bind", "conditions_bind"])
 
     def load_tb_binding(self):
         """Load TypeBuildingElement json into binding classes."""
+        with self._load_lock:
+            start = time.perf_counter()
+            try:
+                self._load_tb_binding()
+            finally:
+                self._pending_bindings.discard("element_bind")
+            self.load_times["element_bind"] = time.perf_counter() - start
+
+    def _load_tb_binding(self):
+        """Load TypeBuildingElement json, see load_tb_binding()."""
         if self.path_tb.endswith("json"):
             if os.path.isfile(self.path_tb):
                 try:
-                    with open(self.path_tb, "r+") as f:
-                        self.element_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.element_bind = load_shared_binding(
+                        self.path_tb,
+                        use_cache=self.use_cache,
+                        cache_path=self.cache_path,
+                    )
+                    self.shared_bindings.add("element_bind")
                 except json.decoder.JSONDecodeError:
                     print("Your TypeElements file seems to be broken.")
             else:
-                with open(self.path_tb, "w") as f:
+                with open(self.path_tb, "w"):
                     self.element_bind = collections.OrderedDict()
                     self.element_bind["version"] = "0.7"
 
+    def build_element_index(self):
+        """Build lookup index for TypeBuildingElements.
+
+        Groups all entries of element_bind by element class (the key prefix,
+        e.g. 'OuterWall') and construction type. Each group holds the lower
+        bounds of the building age groups in ascending order, to find the
+        matching type elements of a construction year with bisect instead of
+        scanning the whole binding.
+        """
+        index = {}
+        for position, (key, element_in) in enumerate(self.element_bind.items()):
+            if key == "version":
+                continue
+            group = index.setdefault(
+                (key.split("_")[0], element_in["construction_type"]), []
+            )
+            group.append(
+                (
+                    element_in["building_age_group"][0],
+                    position,
+                    element_in["building_age_group"][1],
+                    key,
+                )
+            )
+        for group_key, group in index.items():
+            group.sort()
+            index[group_key] = ([entry[0] for entry in group], group)
+        self.element_index = index
+
+    def find_type_elements(self, element_type, year, construction):
+        """Find keys of type elements in element_bind.
+
+        Looks up all type elements of the given class and construction type
+        whose building age group includes the year of construction.
+
+        Parameters
+        ----------
+        element_type : str
+            Class name of the building element (e.g. 'OuterWall')
+        year : int
+            Year of construction
+        construction : str
+            Construction type, code list ('heavy', 'light', tabula, ...)
+
+        Returns
+        ----------
+        keys : list
+            Keys of all matching type elements, in the order of element_bind
+
+        """
+        if self.element_index is None:
+            self.build_element_index()
+        group = self.element_index.get((element_type, construction))
+        if group is None:
+            return []
+        lower_bounds, entries = group
+        matches = [
+            entry
+            for entry in entries[: bisect.bisect_right(lower_bounds, year)]
+            if year <= entry[2]
+        ]
+        return [entry[3] for entry in sorted(matches, key=lambda e: e[1])]
+
+    def build_material_index(self):
+        """Build lookup index for MaterialTemplates.
+
+        Maps material names and material ids to the records of
+        material_bind. If a name is used by several materials, the last one
+        in the binding is indexed, as it was done by the former scan of the
+        binding.
+        """
+        name_index = {}
+        id_index = {}
+        for mat_id, mat in self.material_bind.items():
+            if mat_id == "version":
+                continue
+            name_index[mat["name"]] = mat_id
+            id_index[mat_id] = mat
+        self.material_index = {"name": name_index, "id": id_index, "record": {}}
+
+    def find_material_id(self, mat_name):
+        """Find the material id of a material name in material_bind.
+
+        Parameters
+        ----------
+        mat_name : str
+            Code list for Material
+
+        Returns
+        ----------
+        mat_id : str
+            Id of the material, None if the name is not in material_bind
+
+        """
+        if self.material_index is None:
+            self.build_material_index()
+        return self.material_index["name"].get(mat_name)
+
+    def find_material(self, mat_id):
+        """Find the record of a material id in material_bind.
+
+        Parameters
+        ----------
+        mat_id : str
+            Id of the material
+
+        Returns
+        ----------
+        material : collections.OrderedDict
+            Record of the material, None if the id is not in material_bind
+
+        """
+        if self.material_index is None:
+            self.build_material_index()
+        return self.material_index["id"].get(mat_id)
+
+    def find_material_record(self, mat_id):
+        """Find the immutable record of a material id in material_bind.
+
+        Records are created on first use and interned, so all materials
+        loaded from the same catalog entry share one record (see the record
+        argument of Material). Records are dropped together with
+        material_index whenever material_bind is loaded or changed.
+
+        Parameters
+        ----------
+        mat_id : str
+            Id of the material
+
+        Returns
+        ----------
+        record : MaterialRecord
+            Record of the material, None if the id is not in material_bind
+
+        """
+        if self.material_index is None:
+            self.build_material_index()
+        records = self.material_index["record"]
+        record = records.get(mat_id)
+        if record is None:
+            mat = self.material_index["id"].get(mat_id)
+            if mat is None:
+                return None
+            record = material_input.create_material_record(mat_id, mat)
+            records[mat_id] = record
+        return record
+
     def load_uc_binding(self):
         """Load UseConditions json into binding classes."""
+        with self._load_lock:
+            start = time.perf_counter()
+            try:
+                self._load_uc_binding()
+            finally:
+                self._pending_bindings.discard("conditions_bind")
+            self.load_times["conditions_bind"] = time.perf_counter() - start
+
+    def _load_uc_binding(self):
+        """Load UseConditions json, see load_uc_binding()."""
         if self.path_uc.endswith("json"):
             if os.path.isfile(self.path_uc):
                 try:
-                    with open(self.path_uc, "r+") as f:
-                        self.conditions_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.conditions_bind = load_shared_binding(
+                        self.path_uc,
+                        use_cache=self.use_cache,
+                        cache_path=self.cache_path,
+                    )
+                    self.shared_bindings.add("conditions_bind")
                 except json.decoder.JSONDecodeError:
                     raise IOError("Your UseConditions.json file seems to be broken.")
             else:
-                with open(self.path_uc, "w") as f:
+                with open(self.path_uc, "w"):
                     self.conditions_bind = collections.OrderedDict()
                     self.conditions_bind["version"] = "0.7"
 
     def load_mat_binding(self):
         """Load MaterialTemplates json into binding classes."""
+        with self._load_lock:
+            start = time.perf_counter()
+            try:
+                self._load_mat_binding()
+            finally:
+                self._pending_bindings.discard("material_bind")
+            self.load_times["material_bind"] = time.perf_counter() - start
+
+    def _load_mat_binding(self):
+        """Load MaterialTemplates json, see load_mat_binding()."""
         if self.path_mat.endswith("json"):
             if os.path.isfile(self.path_mat):
                 try:
-                    with open(self.path_mat, "r+") as f:
-                        self.material_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.material_bind = load_shared_binding(
+                        self.path_mat,
+                        use_cache=self.use_cache,
+                        cache_path=self.cache_path,
+                    )
+                    self.shared_bindings.add("material_bind")
                 except json.decoder.JSONDecodeError:
                     print("Your Materials file seems to be broken.")
             else:
-                with open(self.path_mat, "w") as f:
+                with open(self.path_mat, "w"):
                     self.material_bind = collections.OrderedDict()
                     self.material_bind["version"] = "0.7"
+
+    def write_binding(self, binding):
+        """Write a binding to its JSON file.
+
+        The file is written to a temporary file first, which then replaces
+        the JSON file, thus an interrupted write never leaves a broken
+        catalog. Within a write session, the binding is only marked and
+        written once at the end of the session (see write_session()).
+
+        Parameters
+        ----------
+        binding : str
+            Name of the binding ('element_bind', 'material_bind' or
+            'conditions_bind')
+
+        """
+        if self.pending_writes is not None:
+            if binding not in self.pending_writes:
+                self.pending_writes.append(binding)
+            return
+
+        path = utils.get_full_path(
+            {
+                "element_bind": self.path_tb,
+                "material_bind": self.path_mat,
+                "conditions_bind": self.path_uc,
+            }[binding]
+        )
+        file_handle, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_handle, "w") as file:
+                file.write(
+                    json.dumps(
+                        getattr(self, binding), indent=4, separators=(",", ": ")
+                    )
+                )
+                file.flush()
+                os.fsync(file.fileno())
+            catalog_cache.copy_file_mode(tmp_path, path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @contextlib.contextmanager
+    def write_session(self):
+        """Collect all changes of the catalogs and write them once.
+
+        Within the session, saving or deleting type elements, materials and
+        use conditions only changes the bindings in memory. When the session
+        ends, every changed binding is written to its JSON file once (see
+        write_binding()). If the session ends with an exception, all
+        bindings are reset to their state before the session and no file is
+        written. Nested sessions are part of the outermost session.
+
+        Example
+        ----------
+        >>> with prj.data.write_session():
+        ...     for wall in walls:
+        ...         wall.save_type_element(data_class=prj.data)
+
+        """
+        if self.pending_writes is not None:
+            yield self
+            return
+
+        bindings = ["element_bind", "material_bind", "conditions_bind"]
+        pending = set(self._pending_bindings)
+        backup = {}
+        for binding in bindings:
+            if binding not in pending:
+                backup[binding] = (
+                    getattr(self, "_" + binding),
+                    binding in self.shared_bindings,
+                )
+                # the first change copies the binding (see detach_binding())
+                # and keeps the former binding for a reset
+                self.shared_bindings.add(binding)
+        self.pending_writes = []
+        try:
+            yield self
+        except BaseException:
+            self.pending_writes = None
+            for binding in bindings:
+                if binding in backup:
+                    value, shared = backup[binding]
+                    if getattr(self, "_" + binding) is not value:
+                        setattr(self, binding, value)
+                elif binding not in self._pending_bindings:
+                    setattr(self, binding, None)
+                    self._pending_bindings.add(binding)
+                    shared = False
+                else:
+                    continue
+                if shared:
+                    self.shared_bindings.add(binding)
+                else:
+                    self.shared_bindings.discard(binding)
+            raise
+        else:
+            pending_writes = self.pending_writes
+            self.pending_writes = None
+            for binding, (value, shared) in backup.items():
+                if getattr(self, "_" + binding) is value and not shared:
+                    self.shared_bindings.discard(binding)
+            for binding in pending_writes:
+                self.write_binding(binding)
+
+    def detach_binding(self, binding):
+        """Make a binding private to this instance before changing it.
+
+        Copies a binding that is shared through the process-wide binding
+        registry, so that changes of this DataClass are not visible to other
+        DataClass instances. Bindings that are already private are kept.
+
+        Parameters
+        ----------
+        binding : str
+            Name of the binding ('element_bind', 'material_bind' or
+            'conditions_bind')
+
+        """
+        if binding in self.shared_bindings:
+            setattr(self, binding, copy.deepcopy(getattr(self, binding)))
+
+    def _load_pending(self, binding, load):
+        """Load a binding on first access.
+
+        Parameters
+        ----------
+        binding : str
+            Name of the binding ('element_bind', 'material_bind' or
+            'conditions_bind')
+        load : function
+            Bound load function of the binding, e.g. self.load_tb_binding
+
+        """
+        if binding in self._pending_bindings:
+            with self._load_lock:
+                if binding in self._pending_bindings:
+                    load()
+
+    def __getstate__(self):
+        """Remove the lock from the state for pickling and copying."""
+        state = self.__dict__.copy()
+        del state["_load_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state and create a new lock."""
+        self.__dict__.update(state)
+        self._load_lock = threading.RLock()
+
+    @property
+    def element_bind(self):
+        self._load_pending("element_bind", self.load_tb_binding)
+        return self._element_bind
+
+    @element_bind.setter
+    def element_bind(self, value):
+        self._element_bind = value
+        self.element_index = None
+        self.shared_bindings.discard("element_bind")
+        self._pending_bindings.discard("element_bind")
+
+    @property
+    def material_bind(self):
+        self._load_pending("material_bind", self.load_mat_binding)
+        return self._material_bind
+
+    @material_bind.setter
+    def material_bind(self, value):
+        self._material_bind = value
+        self.material_index = None
+        self.shared_bindings.discard("material_bind")
+        self._pending_bindings.discard("material_bind")
+
+    @property
+    def conditions_bind(self):
+        self._load_pending("conditions_bind", self.load_uc_binding)
+        return self._conditions_bind
+
+    @conditions_bind.setter
+    def conditions_bind(self, value):
+        self._conditions_bind = value
+        self.shared_bindings.discard("conditions_bind")
+        self._pending_bindings.discard("conditions_bind")
@@ -2,7 +2,6 @@
 
 from teaser.logic.buildingobjects.buildingphysics.layer import Layer
 from teaser.logic.buildingobjects.buildingphysics.material import Material
-import teaser.data.input.material_input_json as mat_input
 
 
 def load_type_element(element, year, construction, data_class):
@@ -34,24 +33,36 @@ def load_type_element(element, year, construction, data_class):
     """
     element_binding = data_class.element_bind
 
-    for key, element_in in element_binding.items():
-        if key != "version":
-            if (
-                element_in["building_age_group"][0]
-                <= year
-                <= element_in["building_age_group"][1]
-                and element_in["construction_type"] == construction
-                and key.startswith(type(element).__name__)
-            ):
-                _set_basic_data(element=element, element_in=element_in)
-                for id, layer_in in element_in["layer"].items():
-                    layer = Layer(element)
-                    layer.id = id
-                    layer.thickness = layer_in["thickness"]
-                    material = Material(layer)
-                    mat_input.load_material_id(
-                        material, layer_in["material"]["material_id"], data_class
-                    )
+    keys = data_class.find_type_elements(
+        element_type=type(element).__name__, year=year, construction=construction
+    )
+
+    for key in keys:
+        element_in = element_binding[key]
+        _set_basic_data(element=element, element_in=element_in)
+        for id, layer_in in element_in["layer"].items():
+            layer = Layer(element)
+            layer.id = id
+            layer.thickness = layer_in["thickness"]
+            # the material is filled before it is assigned to the layer, so
+            # the UA-Value is calculated once for the complete element and
+            # not for each layer
+            record = data_class.find_material_record(
+                layer_in["material"]["material_id"]
+            )
+            if record is not None:
+                Material(parent=layer, record=record)
+            else:
+                material = Material()
+                material.parent = layer
+
+    if (
+        keys
+        and element.inner_convection is not None
+        and element.inner_radiation is not None
+        and element.area is not None
+    ):
+        element.calc_ua_value()
 
 
 def _set_basic_data(element, element_in):
@@ -67,7 +78,7 @@ def _set_basic_data(element, element_in):
         json string of input data
 
     """
-    element.building_age_group = element_in["building_age_group"]
+    element.building_age_group = list(element_in["building_age_group"])
     element.construction_type = element_in["construction_type"]
     element.inner_radiation = element_in["inner_radiation"]
     element.inner_convection = element_in["inner_convection"]
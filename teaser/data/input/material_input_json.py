@@ -1,5 +1,36 @@
 """This module contains function to load material classes."""
 
+import re
+import collections
+
+
+class MaterialRecord(
+    collections.namedtuple(
+        "MaterialRecord",
+        [
+            "material_id",
+            "name",
+            "density",
+            "thermal_conduc",
+            "heat_capac",
+            "solar_absorp",
+            "ir_emissivity",
+            "transmittance",
+            "thickness_default",
+            "thickness_list",
+        ],
+    )
+):
+    """Immutable record of a material in the material binding.
+
+    Records are interned per DataClass (see DataClass.find_material_record())
+    and shared by all Material instances loaded from the same catalog entry
+    (see the record argument of Material). The values are converted as done by the
+    setters of Material.
+    """
+
+    __slots__ = ()
+
 
 def load_material(material, mat_name, data_class):
     """Material loader with name as identification.
@@ -23,20 +54,12 @@ def load_material(material, mat_name, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
-
-    for id, mat in binding.items():
-        if id != "version":
-            if mat["name"] == mat_name:
+    mat_id = data_class.find_material_id(mat_name)
 
-                material.material_id = id
-                material.name = mat["name"]
-                material.density = mat["density"]
-                material.thermal_conduc = mat["thermal_conduc"]
-                material.heat_capac = mat["heat_capac"]
-                material.solar_absorp = mat["solar_absorp"]
-                material.thickness_default = mat["thickness_default"]
-                material.thickness_list = mat["thickness_list"]
+    if mat_id is not None:
+        _set_material_data(
+            material=material, mat_id=mat_id, mat=data_class.find_material(mat_id)
+        )
 
 
 def load_material_id(material, mat_id, data_class):
@@ -58,17 +81,72 @@ def load_material_id(material, mat_id, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
-
-    for id, mat in binding.items():
-        if id != "version":
-            if id == mat_id:
-
-                material.material_id = id
-                material.name = mat["name"]
-                material.density = mat["density"]
-                material.thermal_conduc = mat["thermal_conduc"]
-                material.heat_capac = mat["heat_capac"]
-                material.solar_absorp = mat["solar_absorp"]
-                material.thickness_default = mat["thickness_default"]
-                material.thickness_list = mat["thickness_list"]
+    mat = data_class.find_material(mat_id)
+
+    if mat is not None:
+        _set_material_data(material=material, mat_id=mat_id, mat=mat)
+
+
+def _set_material_data(material, mat_id, mat):
+    """Set material data from a record of the material binding.
+
+    Helper function to set all data of a material template to the Material
+    class.
+
+    Parameters
+    ----------
+    material : Material()
+        instance of TEASERS Material class
+    mat_id : str
+        id of material from JSON
+    mat : collections.OrderedDict
+        record of the material in the material binding
+
+    """
+    material.material_id = mat_id
+    material.name = mat["name"]
+    material.density = mat["density"]
+    material.thermal_conduc = mat["thermal_conduc"]
+    material.heat_capac = mat["heat_capac"]
+    material.solar_absorp = mat["solar_absorp"]
+    material.thickness_default = mat["thickness_default"]
+    material.thickness_list = list(mat["thickness_list"])
+
+
+def create_material_record(mat_id, mat):
+    """Create the immutable record of a material in the material binding.
+
+    Parameters
+    ----------
+    mat_id : str
+        id of material from JSON
+    mat : collections.OrderedDict
+        record of the material in the material binding
+
+    Returns
+    ----------
+    record : MaterialRecord
+        Immutable record of the material
+
+    """
+
+    def _to_float(value):
+        return None if value is None else float(value)
+
+    return MaterialRecord(
+        material_id=mat_id,
+        # same conversion as in the name setter of Material
+        name=re.compile("[^a-zA-z0-9]").sub("", str(mat["name"])),
+        density=_to_float(mat["density"]),
+        thermal_conduc=_to_float(mat["thermal_conduc"]),
+        heat_capac=_to_float(mat["heat_capac"]),
+        solar_absorp=0.7
+        if mat["solar_absorp"] is None
+        else float(mat["solar_absorp"]),
+        ir_emissivity=0.9,
+        transmittance=0.0,
+        thickness_default=0.0
+        if mat["thickness_default"] is None
+        else float(mat["thickness_default"]),
+        thickness_list=tuple(mat["thickness_list"] or ()),
+    )
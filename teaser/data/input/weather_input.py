@@ -0,0 +1,287 @@
+"""This module contains functions to load weather data from .mos files.
+
+The table of a .mos file is parsed into a numpy structured array with one
+float field per column (named as in MOS_COLUMNS). As parsing the text of a
+weather file takes much longer than loading binary data, the structured
+array is stored in the cache folder of TEASER (see
+catalog_cache.get_cache_dir()) together with a manifest holding the
+fingerprint of the weather file. Later calls load the cache memory-mapped,
+the columns are views into the mapped file without any copy. The cache is
+written anew as soon as the weather file changes, caches of weather files
+that were removed or changed are evicted whenever a cache is written and
+clear_weather_cache() removes the caches of a cache folder.
+"""
+
+import os
+import json
+import warnings
+import collections
+import numpy as np
+import teaser.data.catalog_cache as catalog_cache
+
+WEATHER_CACHE_FORMAT = 1
+WEATHER_MANIFEST = "weather.json"
+WEATHER_TABLE = "weather.npy"
+
+MOS_COLUMNS = (
+    "time",
+    "temp_dry_bulb",
+    "temp_dew_point",
+    "relative_humidity",
+    "pressure",
+    "irr_extraterrestrial_horizontal",
+    "irr_extraterrestrial_direct_normal",
+    "irr_horizontal_infrared",
+    "irr_global_horizontal",
+    "irr_direct_normal",
+    "irr_diffuse_horizontal",
+    "illuminance_global_horizontal",
+    "illuminance_direct_normal",
+    "illuminance_diffuse_horizontal",
+    "luminance_zenith",
+    "wind_direction",
+    "wind_speed",
+    "sky_cover_total",
+    "sky_cover_opaque",
+    "visibility",
+    "ceiling_height",
+    "present_weather_observation",
+    "present_weather_codes",
+    "precipitable_water",
+    "aerosol_optical_depth",
+    "snow_depth",
+    "days_since_last_snowfall",
+    "albedo",
+    "liquid_precipitation_depth",
+    "liquid_precipitation_quantity")
+
+
+def _column_names(nr_of_columns):
+    """Names of the columns of a table, see MOS_COLUMNS."""
+    return MOS_COLUMNS[:nr_of_columns] + tuple(
+        "column_" + str(count + 1)
+        for count in range(len(MOS_COLUMNS), nr_of_columns))
+
+
+def load_location(weather_file_path):
+    """Loads the location of the #LOCATION line of a .mos file.
+
+    Parameters
+    ----------
+    weather_file_path : str
+        Path to the weather file in Modelica .mos (TMY3) format
+
+    Returns
+    ----------
+    location : collections.OrderedDict
+        Dictionary with city, latitude [degree], longitude [degree],
+        time_zone [h] and elevation [m]. Values missing in the file are None
+    """
+
+    location = collections.OrderedDict(
+        [("city", None), ("latitude", None), ("longitude", None),
+         ("time_zone", None), ("elevation", None)])
+    with open(weather_file_path, "r", errors="replace") as weather_file:
+        for line in weather_file:
+            if line.startswith("#LOCATION"):
+                fields = line.strip().split(",")
+                location["city"] = fields[1]
+                for key, index in (("latitude", 6), ("longitude", 7),
+                                   ("time_zone", 8), ("elevation", 9)):
+                    try:
+                        location[key] = float(fields[index])
+                    except (IndexError, ValueError):
+                        pass
+                break
+            if not line.startswith("#") and not line.startswith("double"):
+                break
+    return location
+
+
+def parse_weather(weather_file_path):
+    """Parses the table of a Modelica .mos weather file.
+
+    The file holds one table (e.g. double tab1(8760,30)) with the hourly
+    values of a TMY3 weather file, the column descriptions are given in the
+    comment lines #C1 to #C30.
+
+    Parameters
+    ----------
+    weather_file_path : str
+        Path to the weather file in Modelica .mos (TMY3) format
+
+    Returns
+    ----------
+    table : np.array
+        Structured numpy array with one record per row of the table and one
+        float field per column, named as in MOS_COLUMNS (e.g. time in s,
+        temp_dry_bulb in degree Celsius, irr_direct_normal in Wh/m2)
+    """
+
+    with open(weather_file_path, "r", errors="replace") as weather_file:
+        shape = None
+        for line in weather_file:
+            if line.startswith("double"):
+                shape = tuple(
+                    int(value) for value in
+                    line.split("(")[1].split(")")[0].split(","))
+                break
+        if shape is None:
+            raise ValueError(
+                "No table found in weather file " + str(weather_file_path))
+        data = np.loadtxt(
+            (line for line in weather_file if not line.startswith("#")),
+            ndmin=2)
+
+    if data.shape != shape:
+        raise ValueError(
+            "Table of weather file " + str(weather_file_path) + " has "
+            "shape " + str(data.shape) + " instead of " + str(shape))
+
+    dtype = np.dtype(
+        [(name, np.float64) for name in _column_names(data.shape[1])])
+    return np.ascontiguousarray(data, dtype=np.float64).view(dtype)[:, 0]
+
+
+def compile_weather(weather_file_path, table=None, cache_path=None):
+    """Stores the table of a weather file in the binary cache.
+
+    Parameters
+    ----------
+    weather_file_path : str
+        Path to the weather file in Modelica .mos (TMY3) format
+    table : np.array
+        Already parsed table of the weather file, if None the weather file
+        is parsed
+    cache_path : str
+        Folder of the caches, default is utilities.get_default_cache_path()
+
+    Returns
+    ----------
+    cache_dir : str
+        Full path to the cache directory of the weather file
+    """
+
+    fingerprint = catalog_cache.get_fingerprint(weather_file_path)
+    if table is None:
+        table = parse_weather(weather_file_path)
+
+    manifest = collections.OrderedDict()
+    manifest["format"] = WEATHER_CACHE_FORMAT
+    manifest["source"] = os.path.abspath(weather_file_path)
+    manifest["fingerprint"] = fingerprint
+    manifest["columns"] = list(table.dtype.names)
+    manifest["rows"] = len(table)
+
+    clear_weather_cache(cache_path, outdated_only=True)
+    cache_dir = catalog_cache.get_cache_dir(weather_file_path, cache_path)
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    # the table is replaced instead of overwritten, as other processes may
+    # hold memory maps of the former file, the manifest is written last
+    for name, write in (
+            (WEATHER_TABLE, lambda f: np.save(f, table, allow_pickle=False)),
+            (WEATHER_MANIFEST,
+             lambda f: f.write(json.dumps(manifest).encode("utf-8")))):
+        catalog_cache.replace_file(os.path.join(cache_dir, name), write)
+    return cache_dir
+
+
+def clear_weather_cache(cache_path=None, outdated_only=False):
+    """Removes the caches of weather files from a cache folder.
+
+    Parameters
+    ----------
+    cache_path : str
+        Folder of the caches, default is utilities.get_default_cache_path()
+    outdated_only : bool
+        If True, only caches of weather files that were removed or changed
+        since the cache was written are removed. Default is False, which
+        removes the caches of all weather files
+
+    Returns
+    ----------
+    removed : list
+        Full paths of the removed cache directories
+    """
+
+    return catalog_cache.clear_cache(
+        cache_path=cache_path,
+        outdated_only=outdated_only,
+        manifest_name=WEATHER_MANIFEST)
+
+
+def read_weather(weather_file_path, cache=True, cache_path=None):
+    """Reads the table of a weather file, using the binary cache.
+
+    Parameters
+    ----------
+    weather_file_path : str
+        Path to the weather file in Modelica .mos (TMY3) format
+    cache : bool
+        If True (default), the table is loaded memory-mapped from the cache
+        and the cache is written if it is missing or outdated. If False, the
+        weather file is parsed
+    cache_path : str
+        Folder of the caches, default is utilities.get_default_cache_path()
+
+    Returns
+    ----------
+    table : np.array
+        Structured numpy array of the table, see parse_weather(). If loaded
+        from the cache, the array is a read-only memory map
+    """
+
+    if cache is False:
+        return parse_weather(weather_file_path)
+
+    cache_dir = catalog_cache.get_cache_dir(weather_file_path, cache_path)
+    try:
+        with open(os.path.join(cache_dir, WEATHER_MANIFEST), "r") as f:
+            manifest = json.load(f)
+        if manifest.get("format") == WEATHER_CACHE_FORMAT and \
+                manifest.get("fingerprint") == catalog_cache.get_fingerprint(
+                    weather_file_path):
+            table = np.load(
+                os.path.join(cache_dir, WEATHER_TABLE),
+                mmap_mode="r",
+                allow_pickle=False)
+            if list(table.dtype.names or ()) == manifest["columns"] and \
+                    len(table) == manifest["rows"]:
+                return table
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        pass
+
+    table = parse_weather(weather_file_path)
+    try:
+        compile_weather(weather_file_path, table, cache_path)
+    except (IOError, OSError) as error:
+        warnings.warn("Weather cache not written: {}".format(error))
+    return table
+
+
+def load_weather(weather_file_path, cache=True, cache_path=None):
+    """Loads the columns of the table of a Modelica .mos weather file.
+
+    Parameters
+    ----------
+    weather_file_path : str
+        Path to the weather file in Modelica .mos (TMY3) format
+    cache : bool
+        Use the binary cache, see read_weather() (default True)
+    cache_path : str
+        Folder of the caches, default is utilities.get_default_cache_path()
+
+    Returns
+    ----------
+    weather : collections.OrderedDict
+        Dictionary with one numpy array per column of the table, named as in
+        MOS_COLUMNS (e.g. time in s, temp_dry_bulb in degree Celsius,
+        irr_direct_normal in Wh/m2). The arrays are views of the table of
+        read_weather()
+    """
+
+    table = read_weather(
+        weather_file_path, cache=cache, cache_path=cache_path)
+    return collections.OrderedDict(
+        (name, table[name]) for name in table.dtype.names)
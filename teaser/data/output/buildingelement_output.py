@@ -1,9 +1,7 @@
 """This module contains function to save building element classes."""
 
-import teaser.logic.utilities as utilities
 import warnings
 import collections
-import json
 
 
 def save_type_element(element, data_class):
@@ -27,6 +25,7 @@ def save_type_element(element, data_class):
         but the user can individually change that.
 
     """
+    data_class.detach_binding("element_bind")
     data_class.element_bind["version"] = "0.7"
     add_to_json = True
 
@@ -56,10 +55,9 @@ def save_type_element(element, data_class):
             element=element, wall_out=data_class.element_bind[check_str]
         )
 
-    with open(utilities.get_full_path(data_class.path_tb), "w") as file:
-        file.write(
-            json.dumps(data_class.element_bind, indent=4, separators=(",", ": "))
-        )
+        data_class.element_index = None
+
+    data_class.write_binding("element_bind")
 
 
 def delete_type_element(element, data_class):
@@ -85,12 +83,11 @@ def delete_type_element(element, data_class):
         type(element).__name__, element.building_age_group, element.construction_type
     )
 
+    data_class.detach_binding("element_bind")
     del data_class.element_bind[check_str]
+    data_class.element_index = None
 
-    with open(utilities.get_full_path(data_class.path_tb), "w") as file:
-        file.write(
-            json.dumps(data_class.element_bind, indent=4, separators=(",", ": "))
-        )
+    data_class.write_binding("element_bind")
 
 
 def _set_basic_data_json(element, wall_out):
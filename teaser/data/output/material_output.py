@@ -1,7 +1,5 @@
 """This module contains function to save material classes."""
 import warnings
-import json
-import teaser.logic.utilities as utilities
 import collections
 
 
@@ -24,6 +22,7 @@ def save_material(material, data_class):
         but the user can individually change that.
 
     """
+    data_class.detach_binding("material_bind")
     data_class.material_bind["version"] = "0.7"
     add_to_json = True
 
@@ -65,8 +64,45 @@ def save_material(material, data_class):
         data_class.material_bind[
             material.material_id]["solar_absorp"] = material.solar_absorp
 
-    with open(utilities.get_full_path(data_class.path_mat), 'w') as file:
-        file.write(json.dumps(
-            data_class.material_bind,
-            indent=4,
-            separators=(',', ': ')))
+        data_class.material_index = None
+
+    data_class.write_binding("material_bind")
+
+
+def modify_material(material, data_class):
+    """Material modifier.
+
+    Modifies the properties of a material that is already stored in the
+    JSON file for materials (identified by material_id) and saves the file.
+    If the material is not part of the JSON, nothing is changed.
+
+    Parameters
+    ----------
+    material : Material()
+        instance of TEASERS Material class
+
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material (typically this is the data class stored in prj.data,
+        but the user can individually change that.
+
+    """
+    if material.material_id not in data_class.material_bind.keys():
+        warnings.warn("Material with id " + str(material.material_id) +
+                      " does not exist in JSON and can't be modified, "
+                      "consider saving it as new material")
+        return
+
+    data_class.detach_binding("material_bind")
+    mat_out = data_class.material_bind[material.material_id]
+    mat_out["name"] = material.name
+    mat_out["density"] = material.density
+    mat_out["thermal_conduc"] = material.thermal_conduc
+    mat_out["heat_capac"] = material.heat_capac
+    mat_out["thickness_default"] = material.thickness_default
+    mat_out["thickness_list"] = material.thickness_list
+    mat_out["solar_absorp"] = material.solar_absorp
+
+    data_class.material_index = None
+
+    data_class.write_binding("material_bind")
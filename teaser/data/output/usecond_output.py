@@ -1,9 +1,7 @@
 """This module contains function to save UseConditions classes."""
 
 import collections
-import json
 import warnings
-import teaser.logic.utilities as utilities
 
 
 def save_use_conditions(use_cond, data_class):
@@ -36,6 +34,7 @@ def save_use_conditions(use_cond, data_class):
     else:
         add_to_json = True
 
+    data_class.detach_binding("conditions_bind")
     data_class.conditions_bind["version"] = "0.7"
 
     if add_to_json is True:
@@ -124,7 +123,4 @@ def save_use_conditions(use_cond, data_class):
             "with_ideal_thresholds"
         ] = use_cond.with_ideal_thresholds
 
-    with open(utilities.get_full_path(data_class.path_uc), "w") as file:
-        file.write(
-            json.dumps(data_class.conditions_bind, indent=4, separators=(",", ": "))
-        )
+    data_class.write_binding("conditions_bind")
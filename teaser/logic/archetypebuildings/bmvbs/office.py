@@ -174,6 +174,7 @@ class Office(NonResidential):
             internal_gains_mode,
         )
 
+        self.used_statistic = "iwu"
         self.office_layout = office_layout
         self.window_layout = window_layout
         self.construction_type = construction_type
@@ -303,7 +304,7 @@ class Office(NonResidential):
             zone.area = type_bldg_area * value[0]
             zone.name = key
             use_cond = UseCond(zone)
-            use_cond.load_use_conditions(value[1], data_class=self.parent.data)
+            use_cond.load_use_conditions(value[1], data_class=self.data)
             zone.use_conditions = use_cond
 
         # statistical estimation of the facade
@@ -352,7 +353,7 @@ class Office(NonResidential):
                 outer_wall.load_type_element(
                     year=self.year_of_construction,
                     construction=self.construction_type,
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 outer_wall.name = key
                 outer_wall.tilt = value[0]
@@ -381,7 +382,7 @@ class Office(NonResidential):
                 window.load_type_element(
                     self.year_of_construction,
                     "Kunststofffenster, " "Isolierverglasung",
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 window.name = key
                 window.tilt = value[0]
@@ -396,7 +397,7 @@ class Office(NonResidential):
                 roof.load_type_element(
                     year=self.year_of_construction,
                     construction=self.construction_type,
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 roof.name = key
                 roof.tilt = value[0]
@@ -411,7 +412,7 @@ class Office(NonResidential):
                 ground_floor.load_type_element(
                     year=self.year_of_construction,
                     construction=self.construction_type,
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 ground_floor.name = key
                 ground_floor.tilt = value[0]
@@ -424,7 +425,7 @@ class Office(NonResidential):
                 inner_wall.load_type_element(
                     year=self.year_of_construction,
                     construction=self.construction_type,
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 inner_wall.name = key
                 inner_wall.tilt = value[0]
@@ -439,7 +440,7 @@ class Office(NonResidential):
                     ceiling.load_type_element(
                         year=self.year_of_construction,
                         construction=self.construction_type,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     ceiling.name = key
                     ceiling.tilt = value[0]
@@ -453,7 +454,7 @@ class Office(NonResidential):
                     floor.load_type_element(
                         year=self.year_of_construction,
                         construction=self.construction_type,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     floor.name = key
                     floor.tilt = value[0]
@@ -182,6 +182,7 @@ class SingleFamilyDwelling(Residential):
             internal_gains_mode,
         )
 
+        self.used_statistic = "iwu"
         self.residential_layout = residential_layout
         self.neighbour_buildings = neighbour_buildings
         self.attic = attic
@@ -375,7 +376,7 @@ class SingleFamilyDwelling(Residential):
             zone.name = key
             zone.area = type_bldg_area * value[0]
             use_cond = UseCond(zone)
-            use_cond.load_use_conditions(value[1], data_class=self.parent.data)
+            use_cond.load_use_conditions(value[1], data_class=self.data)
 
             zone.use_conditions = use_cond
             zone.use_conditions.with_ahu = False
@@ -400,7 +401,7 @@ class SingleFamilyDwelling(Residential):
                 outer_wall.load_type_element(
                     year=self.year_of_construction,
                     construction=self.construction_type,
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 outer_wall.name = key
                 outer_wall.tilt = value[0]
@@ -426,7 +427,7 @@ class SingleFamilyDwelling(Residential):
                 window.load_type_element(
                     self.year_of_construction,
                     "Kunststofffenster, " "Isolierverglasung",
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 window.name = key
                 window.tilt = value[0]
@@ -441,7 +442,7 @@ class SingleFamilyDwelling(Residential):
                 roof.load_type_element(
                     year=self.year_of_construction,
                     construction=self.construction_type,
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 roof.name = key
                 roof.tilt = value[0]
@@ -456,7 +457,7 @@ class SingleFamilyDwelling(Residential):
                 ground_floor.load_type_element(
                     year=self.year_of_construction,
                     construction=self.construction_type,
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 ground_floor.name = key
                 ground_floor.tilt = value[0]
@@ -469,7 +470,7 @@ class SingleFamilyDwelling(Residential):
                 inner_wall.load_type_element(
                     year=self.year_of_construction,
                     construction=self.construction_type,
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 inner_wall.name = key
                 inner_wall.tilt = value[0]
@@ -485,7 +486,7 @@ class SingleFamilyDwelling(Residential):
                     ceiling.load_type_element(
                         year=self.year_of_construction,
                         construction=self.construction_type,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     ceiling.name = key
                     ceiling.tilt = value[0]
@@ -499,7 +500,7 @@ class SingleFamilyDwelling(Residential):
                     floor.load_type_element(
                         year=self.year_of_construction,
                         construction=self.construction_type,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     floor.name = key
                     floor.tilt = value[0]
@@ -118,6 +118,7 @@ class SingleFamilyHouse(Residential):
             internal_gains_mode
         )
 
+        self.used_statistic = "tabula_de"
         self.construction_type = construction_type
         self.number_of_floors = number_of_floors
         self.height_of_floors = height_of_floors
@@ -372,7 +373,7 @@ class SingleFamilyHouse(Residential):
                     outer_wall.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     outer_wall.name = key
                     outer_wall.tilt = value[0]
@@ -389,7 +390,7 @@ class SingleFamilyHouse(Residential):
                     outer_wall.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_2,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     outer_wall.name = key
                     outer_wall.tilt = value[0]
@@ -406,7 +407,7 @@ class SingleFamilyHouse(Residential):
                     window.load_type_element(
                         self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     window.name = key
                     window.tilt = value[0]
@@ -423,7 +424,7 @@ class SingleFamilyHouse(Residential):
                     window.load_type_element(
                         self.year_of_construction,
                         construction=self._construction_type_2,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     window.name = key
                     window.tilt = value[0]
@@ -441,7 +442,7 @@ class SingleFamilyHouse(Residential):
                     gf.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     gf.name = key
                     gf.tilt = value[0]
@@ -459,7 +460,7 @@ class SingleFamilyHouse(Residential):
                     gf.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_2,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     gf.name = key
                     gf.tilt = value[0]
@@ -477,7 +478,7 @@ class SingleFamilyHouse(Residential):
                     rt.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     rt.name = key
                     rt.tilt = value[0]
@@ -495,7 +496,7 @@ class SingleFamilyHouse(Residential):
                     rt.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_2,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     rt.name = key
                     rt.tilt = value[0]
@@ -513,7 +514,7 @@ class SingleFamilyHouse(Residential):
                     door.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     door.name = key
                     door.tilt = value[0]
@@ -530,7 +531,7 @@ class SingleFamilyHouse(Residential):
                 inner_wall.load_type_element(
                     year=self.year_of_construction,
                     construction="tabula_standard",
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 inner_wall.name = key
                 inner_wall.tilt = value[0]
@@ -545,7 +546,7 @@ class SingleFamilyHouse(Residential):
                     ceiling.load_type_element(
                         year=self.year_of_construction,
                         construction="tabula_standard",
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     ceiling.name = key
                     ceiling.tilt = value[0]
@@ -558,7 +559,7 @@ class SingleFamilyHouse(Residential):
                     floor.load_type_element(
                         year=self.year_of_construction,
                         construction="tabula_standard",
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     floor.name = key
                     floor.tilt = value[0]
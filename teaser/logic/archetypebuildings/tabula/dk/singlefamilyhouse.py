@@ -118,6 +118,7 @@ class SingleFamilyHouse(Residential):
             internal_gains_mode,
         )
 
+        self.used_statistic = "tabula_dk"
         self.construction_type = construction_type
         self.number_of_floors = number_of_floors
         self.height_of_floors = height_of_floors
@@ -339,7 +340,7 @@ class SingleFamilyHouse(Residential):
                     outer_wall.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     outer_wall.name = key
                     outer_wall.tilt = value[0]
@@ -356,7 +357,7 @@ class SingleFamilyHouse(Residential):
                     outer_wall.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_2,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     outer_wall.name = key
                     outer_wall.tilt = value[0]
@@ -373,7 +374,7 @@ class SingleFamilyHouse(Residential):
                     window.load_type_element(
                         self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     window.name = key
                     window.tilt = value[0]
@@ -390,7 +391,7 @@ class SingleFamilyHouse(Residential):
                     window.load_type_element(
                         self.year_of_construction,
                         construction=self._construction_type_2,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     window.name = key
                     window.tilt = value[0]
@@ -408,7 +409,7 @@ class SingleFamilyHouse(Residential):
                     gf.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     gf.name = key
                     gf.tilt = value[0]
@@ -426,7 +427,7 @@ class SingleFamilyHouse(Residential):
                     gf.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_2,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     gf.name = key
                     gf.tilt = value[0]
@@ -444,7 +445,7 @@ class SingleFamilyHouse(Residential):
                     rt.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     rt.name = key
                     rt.tilt = value[0]
@@ -462,7 +463,7 @@ class SingleFamilyHouse(Residential):
                     rt.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_2,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     rt.name = key
                     rt.tilt = value[0]
@@ -480,7 +481,7 @@ class SingleFamilyHouse(Residential):
                     door.load_type_element(
                         year=self.year_of_construction,
                         construction=self._construction_type_1,
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     door.name = key
                     door.tilt = value[0]
@@ -497,7 +498,7 @@ class SingleFamilyHouse(Residential):
                 inner_wall.load_type_element(
                     year=self.year_of_construction,
                     construction="tabula_standard",
-                    data_class=self.parent.data,
+                    data_class=self.data,
                 )
                 inner_wall.name = key
                 inner_wall.tilt = value[0]
@@ -512,7 +513,7 @@ class SingleFamilyHouse(Residential):
                     ceiling.load_type_element(
                         year=self.year_of_construction,
                         construction="tabula_standard",
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     ceiling.name = key
                     ceiling.tilt = value[0]
@@ -525,7 +526,7 @@ class SingleFamilyHouse(Residential):
                     floor.load_type_element(
                         year=self.year_of_construction,
                         construction="tabula_standard",
-                        data_class=self.parent.data,
+                        data_class=self.data,
                     )
                     floor.name = key
                     floor.tilt = value[0]
@@ -91,6 +91,7 @@ class TerracedHouse(SingleFamilyHouse):
             internal_gains_mode,
             construction_type)
 
+        self.used_statistic = "tabula_dk"
         self.construction_type = construction_type
         self.number_of_floors = number_of_floors
         self.height_of_floors = height_of_floors
@@ -134,6 +134,7 @@ class EST1a(Residential):
             with_ahu,
             internal_gains_mode)
 
+        self.used_statistic = "iwu"
         self.neighbour_buildings = neighbour_buildings
         self.construction_type = construction_type
         self.number_of_apartments = 1
@@ -3,6 +3,7 @@
 
 """This module includes the Building class
 """
+import contextlib
 import inspect
 import random
 import re
@@ -113,6 +114,11 @@ class Building(object):
     library_attr : Annex() or AixLib() instance
         Classes with specific functions and attributes for building models in
         IBPSA and AixLib. Python classes can be found in calculation package.
+    used_statistic : str
+        Statistic of type elements used by the archetype method of this
+        building ('iwu', 'tabula_de' or 'tabula_dk'). It determines the
+        DataClass of the parent Project used for this building (see
+        Building.data). Default is None, which uses Project.data.
 
     """
 
@@ -154,6 +160,14 @@ class Building(object):
         self._thermal_zones = []
         self._outer_area = {}
         self._window_area = {}
+        self._outer_area_dirty = False
+        self._window_area_dirty = False
+        self._outer_area_orientations = set()
+        self._window_area_orientations = set()
+        self._outer_area_filled = None
+        self._window_area_filled = None
+        self._inner_wall_area = None
+        self._bulk_edit_depth = 0
 
         self.bldg_height = None
         self.volume = 0
@@ -164,6 +178,7 @@ class Building(object):
         self._used_library_calc = "AixLib"
 
         self.library_attr = None
+        self.used_statistic = None
 
     def set_outer_wall_area(self, new_area, orientation):
         """Outer area wall setter
@@ -244,24 +259,12 @@ class Building(object):
 
         sum_area = 0.0
         for zone_count in self.thermal_zones:
-            for wall_count in zone_count.outer_walls:
-                if (
-                    wall_count.orientation == orientation
-                    and wall_count.area is not None
-                ):
-                    sum_area += wall_count.area
-            for roof_count in zone_count.rooftops:
-                if (
-                    roof_count.orientation == orientation
-                    and roof_count.area is not None
+            for name in ("outer_walls", "rooftops", "ground_floors"):
+                for wall_count in zone_count.find_by_orientation(
+                    name, orientation
                 ):
-                    sum_area += roof_count.area
-            for ground_count in zone_count.ground_floors:
-                if (
-                    ground_count.orientation == orientation
-                    and ground_count.area is not None
-                ):
-                    sum_area += ground_count.area
+                    if wall_count.area is not None:
+                        sum_area += wall_count.area
         return sum_area
 
     def get_window_area(self, orientation):
@@ -281,8 +284,8 @@ class Building(object):
 
         sum_area = 0.0
         for zone_count in self.thermal_zones:
-            for win_count in zone_count.windows:
-                if win_count.orientation == orientation and win_count.area is not None:
+            for win_count in zone_count.find_by_orientation("windows", orientation):
+                if win_count.area is not None:
                     sum_area += win_count.area
         return sum_area
 
@@ -299,15 +302,17 @@ class Building(object):
 
         """
 
-        sum_area = 0.0
-        for zone_count in self.thermal_zones:
-            for wall_count in zone_count.inner_walls:
-                sum_area += wall_count.area
-            for floor in zone_count.floors:
-                sum_area += floor.area
-            for ceiling in zone_count.ceilings:
-                sum_area += ceiling.area
-        return sum_area
+        if self._inner_wall_area is None:
+            sum_area = 0.0
+            for zone_count in self.thermal_zones:
+                for wall_count in zone_count.inner_walls:
+                    sum_area += wall_count.area
+                for floor in zone_count.floors:
+                    sum_area += floor.area
+                for ceiling in zone_count.ceilings:
+                    sum_area += ceiling.area
+            self._inner_wall_area = sum_area
+        return self._inner_wall_area
 
     def fill_outer_area_dict(self):
         """Fills the attribute outer_area
@@ -317,17 +322,19 @@ class Building(object):
         covers OuterWalls, GroundFloors and Rooftops.
 
         """
-        self.outer_area = {}
+        outer_area = {}
         for zone_count in self.thermal_zones:
             for wall_count in zone_count.outer_walls:
-                self.outer_area[wall_count.orientation] = None
+                outer_area[wall_count.orientation] = None
             for roof in zone_count.rooftops:
-                self.outer_area[roof.orientation] = None
+                outer_area[roof.orientation] = None
             for ground in zone_count.ground_floors:
-                self.outer_area[ground.orientation] = None
+                outer_area[ground.orientation] = None
 
-        for key in self.outer_area:
-            self.outer_area[key] = self.get_outer_wall_area(key)
+        for key in outer_area:
+            outer_area[key] = self.get_outer_wall_area(key)
+        self.outer_area = outer_area
+        self._outer_area_filled = (list(self.thermal_zones), dict(outer_area))
 
     def fill_window_area_dict(self):
         """Fills the attribute
@@ -336,13 +343,170 @@ class Building(object):
         corresponding to the orientations of the building.
 
         """
-        self.window_area = {}
+        window_area = {}
         for zone_count in self.thermal_zones:
             for win_count in zone_count.windows:
-                self.window_area[win_count.orientation] = None
+                window_area[win_count.orientation] = None
 
-        for key in self.window_area:
-            self.window_area[key] = self.get_window_area(key)
+        for key in window_area:
+            window_area[key] = self.get_window_area(key)
+        self.window_area = window_area
+        self._window_area_filled = (list(self.thermal_zones), dict(window_area))
+
+    def invalidate_outer_area(self, orientation=None):
+        """Marks the attribute outer_area for recalculation
+
+        Changing area or orientation of an outer wall only marks outer_area,
+        which is then updated once on the next read instead of on every
+        change. If only the area of walls of one orientation changed, only
+        the sum of this orientation is updated, otherwise outer_area is
+        filled with fill_outer_area_dict().
+
+        Parameters
+        ----------
+        orientation : float
+            orientation of the changed walls, default is None, which marks
+            all orientations
+
+        """
+        if orientation is None:
+            self._outer_area_dirty = True
+        elif not self._outer_area_dirty:
+            self._outer_area_orientations.add(orientation)
+
+    def invalidate_window_area(self, orientation=None):
+        """Marks the attribute window_area for recalculation
+
+        Changing area or orientation of a window only marks window_area,
+        which is then updated once on the next read instead of on every
+        change. If only the area of windows of one orientation changed, only
+        the sum of this orientation is updated, otherwise window_area is
+        filled with fill_window_area_dict().
+
+        Parameters
+        ----------
+        orientation : float
+            orientation of the changed windows, default is None, which marks
+            all orientations
+
+        """
+        if orientation is None:
+            self._window_area_dirty = True
+        elif not self._window_area_dirty:
+            self._window_area_orientations.add(orientation)
+
+    def invalidate_inner_wall_area(self):
+        """Marks the inner wall area of get_inner_wall_area() for recalculation
+
+        """
+        self._inner_wall_area = None
+
+    def _update_area_dict(self, area_dict, filled, orientations, get_area):
+        """Updates the sums of single orientations in outer_area/window_area
+
+        The sums of the given orientations are summed up again in the same
+        order as in the fill functions. This is only possible as long as the
+        dictionary and the thermal zones did not change since the last fill,
+        e.g. by archetypes writing estimated areas into the dictionary.
+
+        Parameters
+        ----------
+        area_dict : dict
+            outer_area or window_area
+        filled : tuple
+            thermal zones and a copy of the dictionary of the last fill
+        orientations : set
+            orientations with changed areas
+        get_area : function
+            get_outer_wall_area() or get_window_area()
+
+        Returns
+        ----------
+        updated : bool
+            False if the dictionary needs to be filled again
+        """
+        if filled is None:
+            return False
+        zones, values = filled
+        if len(zones) != len(self.thermal_zones) or any(
+            zone is not thermal_zone
+            for zone, thermal_zone in zip(zones, self.thermal_zones)
+        ):
+            return False
+        if list(values.items()) != list(area_dict.items()):
+            return False
+        if any(orientation not in area_dict for orientation in orientations):
+            return False
+        for orientation in orientations:
+            area_dict[orientation] = values[orientation] = get_area(orientation)
+        return True
+
+    def _update_outer_area(self):
+        """Updates outer_area if marked for recalculation"""
+        if self._outer_area_orientations and not self._outer_area_dirty:
+            if not self._update_area_dict(
+                self._outer_area,
+                self._outer_area_filled,
+                self._outer_area_orientations,
+                self.get_outer_wall_area,
+            ):
+                self._outer_area_dirty = True
+        self._outer_area_orientations = set()
+        if self._outer_area_dirty:
+            self.fill_outer_area_dict()
+
+    def _update_window_area(self):
+        """Updates window_area if marked for recalculation"""
+        if self._window_area_orientations and not self._window_area_dirty:
+            if not self._update_area_dict(
+                self._window_area,
+                self._window_area_filled,
+                self._window_area_orientations,
+                self.get_window_area,
+            ):
+                self._window_area_dirty = True
+        self._window_area_orientations = set()
+        if self._window_area_dirty:
+            self.fill_window_area_dict()
+
+    @contextlib.contextmanager
+    def bulk_edit(self):
+        """Context manager to edit many building elements at once
+
+        Derived values (outer_area, window_area and the U*A values and
+        resistances of all building elements) are recalculated lazily on
+        their next read anyway. At the end of the outermost bulk edit all
+        values still marked for recalculation are updated in one pass.
+        Nested bulk edits join the outer one.
+
+        Example
+        ----------
+        with bldg.bulk_edit():
+            for wall in bldg.thermal_zones[0].outer_walls:
+                wall.area = wall.area * 1.1
+
+        """
+        self._bulk_edit_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_edit_depth -= 1
+
+        if self._bulk_edit_depth == 0:
+            for zone in self.thermal_zones:
+                for element in (
+                    zone.outer_walls
+                    + zone.rooftops
+                    + zone.ground_floors
+                    + zone.doors
+                    + zone.windows
+                    + zone.inner_walls
+                    + zone.floors
+                    + zone.ceilings
+                ):
+                    element.update_ua_value()
+            self._update_outer_area()
+            self._update_window_area()
 
     def calc_building_parameter(
         self, number_of_elements=2, merge_windows=False, used_library="AixLib"
@@ -524,6 +688,21 @@ class Building(object):
 
             self.__parent = None
 
+    @property
+    def data(self):
+        """DataClass of the parent Project for the statistic of this building.
+
+        Returns
+        ----------
+        data_class : DataClass()
+            DataClass of used_statistic in the parent Project (see
+            Project.get_data_class()), None if the building has no parent.
+
+        """
+        if self.parent is None:
+            return None
+        return self.parent.get_data_class(self.used_statistic)
+
     @property
     def name(self):
         return self.__name
@@ -628,18 +807,26 @@ class Building(object):
 
     @property
     def outer_area(self):
+        self._update_outer_area()
         return self._outer_area
 
     @outer_area.setter
     def outer_area(self, value):
+        self._outer_area_dirty = False
+        self._outer_area_orientations = set()
+        self._outer_area_filled = None
         self._outer_area = value
 
     @property
     def window_area(self):
+        self._update_window_area()
         return self._window_area
 
     @window_area.setter
     def window_area(self, value):
+        self._window_area_dirty = False
+        self._window_area_orientations = set()
+        self._window_area_filled = None
         self._window_area = value
 
     @property
@@ -8,6 +8,29 @@ import random
 import re
 
 
+def _ua_property(name):
+    """Property of a value calculated in calc_ua_value().
+
+    Reading or overwriting the value first recalculates all values of
+    calc_ua_value() if an input changed since the last calculation (see
+    BuildingElement.invalidate_ua_value()).
+    """
+
+    attr = "_" + name
+
+    def getter(self):
+        if self._ua_dirty:
+            self.calc_ua_value()
+        return getattr(self, attr)
+
+    def setter(self, value):
+        if self._ua_dirty:
+            self.calc_ua_value()
+        setattr(self, attr, value)
+
+    return property(getter, setter)
+
+
 class BuildingElement(object):
     """Building element class.
 
@@ -115,6 +138,8 @@ class BuildingElement(object):
         """Constructor for BuildingElement
         """
 
+        self._ua_dirty = False
+
         self.parent = parent
 
         self.internal_id = random.random()
@@ -150,6 +175,17 @@ class BuildingElement(object):
         self.r_outer_rad = 0.0
         self.r_outer_comb = 0.0
         self.wf_out = 0.0
+        self._u_value = None
+
+    ua_value = _ua_property("ua_value")
+    u_value = _ua_property("u_value")
+    r_conduc = _ua_property("r_conduc")
+    r_inner_conv = _ua_property("r_inner_conv")
+    r_inner_rad = _ua_property("r_inner_rad")
+    r_inner_comb = _ua_property("r_inner_comb")
+    r_outer_conv = _ua_property("r_outer_conv")
+    r_outer_rad = _ua_property("r_outer_rad")
+    r_outer_comb = _ua_property("r_outer_comb")
 
     def calc_ua_value(self):
         """U*A value for building element.
@@ -158,6 +194,7 @@ class BuildingElement(object):
         convective heat transfer of a building element.
         """
 
+        self._ua_dirty = False
         self.ua_value = 0.0
         self.r_conduc = 0.0
         self.r_inner_conv = 0.0
@@ -188,6 +225,26 @@ class BuildingElement(object):
             self.r_inner_comb + self.r_conduc + self.r_outer_comb))
         self.u_value = self.ua_value / self.area
 
+    def invalidate_ua_value(self):
+        """Marks the U*A value and resistances for recalculation.
+
+        Instead of calling calc_ua_value() on every change of an input (e.g.
+        area, coefficients of heat transfer, layer thickness), the values are
+        recalculated once on the next read of one of them.
+        """
+
+        self._ua_dirty = True
+
+    def update_ua_value(self):
+        """Recalculates the U*A value and resistances if marked.
+
+        Calls calc_ua_value() if an input changed since the last
+        calculation, see invalidate_ua_value().
+        """
+
+        if self._ua_dirty:
+            self.calc_ua_value()
+
     def gather_element_properties(self):
         """Helper function for matrix calculation.
 
@@ -292,13 +349,13 @@ class BuildingElement(object):
             DataClass containing the bindings for TypeBuildingElement and
             Material (typically this is the data class stored in prj.data,
             but the user can individually change that. Default is
-            self.parent.parent.parent.data (which is data_class in current
-            project)
+            self.parent.parent.data (which is the DataClass of the building
+            in current project, see Building.data)
 
         """
 
         if data_class is None:
-            data_class = self.parent.parent.parent.data
+            data_class = self.parent.parent.data
         else:
             data_class = data_class
 
@@ -330,13 +387,13 @@ class BuildingElement(object):
             DataClass containing the bindings for TypeBuildingElement and
             Material (typically this is the data class stored in prj.data,
             but the user can individually change that. Default is
-            self.parent.parent.parent.data (which is data_class in current
-            project)
+            self.parent.parent.data (which is the DataClass of the building
+            in current project, see Building.data)
 
         """
 
         if data_class is None:
-            data_class = self.parent.parent.parent.data
+            data_class = self.parent.parent.data
         else:
             data_class = data_class
 
@@ -363,13 +420,13 @@ class BuildingElement(object):
             DataClass containing the bindings for TypeBuildingElement and
             Material (typically this is the data class stored in prj.data,
             but the user can individually change that. Default is
-            self.parent.parent.parent.data (which is data_class in current
-            project)
+            self.parent.parent.data (which is the DataClass of the building
+            in current project, see Building.data)
 
         """
 
         if data_class is None:
-            data_class = self.parent.parent.parent.data
+            data_class = self.parent.parent.data
         else:
             data_class = data_class
 
@@ -451,13 +508,16 @@ class BuildingElement(object):
     @orientation.setter
     def orientation(self, value):
 
+        orientation = self._orientation
         self._orientation = value
         if type(self).__name__ == "OuterWall":
             if self.parent.parent is not None and self.area is not None:
-                self.parent.parent.fill_outer_area_dict()
+                self.parent.parent.invalidate_outer_area()
         elif type(self).__name__ == "Window":
             if self.parent.parent is not None and self.area is not None:
-                self.parent.parent.fill_window_area_dict()
+                self.parent.parent.invalidate_window_area()
+        if self.parent is not None:
+            self.parent.reindex_element(self, orientation, self.tilt)
 
     @property
     def layer(self):
@@ -472,7 +532,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.invalidate_ua_value()
 
     @property
     def inner_convection(self):
@@ -496,7 +556,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.invalidate_ua_value()
 
     @property
     def inner_radiation(self):
@@ -520,7 +580,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.invalidate_ua_value()
 
     @property
     def outer_convection(self):
@@ -544,7 +604,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.invalidate_ua_value()
 
     @property
     def outer_radiation(self):
@@ -568,7 +628,7 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.invalidate_ua_value()
 
     @property
     def area(self):
@@ -589,18 +649,25 @@ class BuildingElement(object):
 
         if value is not None:
             self._area = value
+            if self.parent is not None:
+                self.parent.invalidate_element_area(self)
         if type(self).__name__ == "OuterWall"\
                 or type(self).__name__ == "Rooftop" \
                 or type(self).__name__ == "GroundFloor":
             if self.parent.parent is not None and self.orientation is not None:
-                self.parent.parent.fill_outer_area_dict()
+                self.parent.parent.invalidate_outer_area(self.orientation)
         elif type(self).__name__ == "Window":
             if self.parent is not None and self.orientation is not None:
-                self.parent.parent.fill_window_area_dict()
+                self.parent.parent.invalidate_window_area(self.orientation)
+        elif type(self).__name__ == "InnerWall"\
+                or type(self).__name__ == "Ceiling" \
+                or type(self).__name__ == "Floor":
+            if self.parent is not None and self.parent.parent is not None:
+                self.parent.parent.invalidate_inner_wall_area()
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            self.invalidate_ua_value()
 
     @property
     def tilt(self):
@@ -609,6 +676,7 @@ class BuildingElement(object):
     @tilt.setter
     def tilt(self, value):
 
+        tilt = self._tilt
         if isinstance(value, float):
             self._tilt = value
         elif value is None:
@@ -619,6 +687,8 @@ class BuildingElement(object):
                 self._tilt = value
             except:
                 raise ValueError("Can't convert tilt to float")
+        if self.parent is not None:
+            self.parent.reindex_element(self, self.orientation, tilt)
 
     @property
     def year_of_construction(self):
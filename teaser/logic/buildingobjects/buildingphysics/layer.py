@@ -99,5 +99,5 @@ class Layer(object):
             self._thickness = float(value)
 
         if self.material is not None and self.parent is not None:
-            if vars(self.material)['_thermal_conduc'] != 0:
-                self.parent.calc_ua_value()
+            if self.material.thermal_conduc != 0:
+                self.parent.invalidate_ua_value()
@@ -21,6 +21,10 @@ class Material(object):
         belongs to. Allows for better control of hierarchical structures. If
         not None this adds this Material to Layer.material.
         Default is None
+    record : MaterialRecord
+        Interned record of a catalog entry (see
+        DataClass.find_material_record()) the material reads its values
+        from. Default is None
 
     Attributes
     ----------
@@ -46,12 +50,38 @@ class Material(object):
         UUID of material, this is used to have similar behaviour like foreign
         key in SQL data bases for use in TypeBuildingElements and Material json
 
+    Materials of type elements are created with a record and share one
+    immutable MaterialRecord per catalog entry: all attributes that have not
+    been set on the material itself are read from the record. Setting an
+    attribute only changes this material (copy-on-modify), detach_record()
+    copies all values of the record to the material.
+
     """
 
-    def __init__(self, parent=None):
+    _record_fields = {
+        "_name": "name",
+        "_density": "density",
+        "_thermal_conduc": "thermal_conduc",
+        "_heat_capac": "heat_capac",
+        "_solar_absorp": "solar_absorp",
+        "_ir_emissivity": "ir_emissivity",
+        "_transmittance": "transmittance",
+        "_thickness_default": "thickness_default",
+        "_thickness_list": "thickness_list",
+    }
+
+    def __init__(self, parent=None, record=None):
         """Constructor of Material.
         """
 
+        self._record = record
+        if record is not None:
+            # no values are copied, they are read from the record until they
+            # are set on the material
+            self.__material_id = None
+            self.parent = parent
+            return
+
         self.parent = parent
         self._name = ""
         self._density = 0.0
@@ -68,6 +98,39 @@ class Material(object):
 
         self.material_id = str(uuid.uuid1())
 
+    def detach_record(self):
+        """Copy all values of the shared record to this material."""
+        record = self._record
+        if record is None:
+            return
+        for attr, field in self._record_fields.items():
+            if attr not in self.__dict__:
+                value = getattr(record, field)
+                if field == "thickness_list":
+                    value = list(value)
+                self.__dict__[attr] = value
+        self.__material_id = self.material_id
+        self._record = None
+
+    def __getattr__(self, attr):
+        """Read values that are not set on the material from its record.
+
+        Only called for attributes that are not found on the material. The
+        thickness_list is copied on first access, as lists can be changed in
+        place.
+        """
+        field = Material._record_fields.get(attr)
+        record = self.__dict__.get("_record")
+        if field is None or record is None:
+            raise AttributeError(
+                "'Material' object has no attribute '{}'".format(attr)
+            )
+        value = getattr(record, field)
+        if field == "thickness_list":
+            value = list(value)
+            self.__dict__[attr] = value
+        return value
+
     def load_material_template(self, mat_name, data_class=None):
         """Material loader.
 
@@ -83,7 +146,8 @@ class Material(object):
             DataClass containing the bindings for TypeBuildingElement and
             Material (typically this is the data class stored in prj.data,
             but the user can individually change that. Default is
-            self.parent.parent.parent.parent.data which is data in project
+            self.parent.parent.parent.parent.data which is the DataClass of the
+            building in project
 
         """
 
@@ -108,7 +172,8 @@ class Material(object):
             DataClass containing the bindings for TypeBuildingElement and
             Material (typically this is the data class stored in prj.data,
             but the user can individually change that. Default is
-            self.parent.parent.parent.parent.data which is data in project
+            self.parent.parent.parent.parent.data which is the DataClass of the
+            building in project
 
         """
 
@@ -132,7 +197,8 @@ class Material(object):
             DataClass containing the bindings for TypeBuildingElement and
             Material (typically this is the data class stored in prj.data,
             but the user can individually change that. Default is
-            self.parent.parent.parent.parent.data which is data in project
+            self.parent.parent.parent.parent.data which is the DataClass of the
+            building in project
 
         """
 
@@ -145,6 +211,8 @@ class Material(object):
 
     @property
     def material_id(self):
+        if self.__material_id is None and self._record is not None:
+            return self._record.material_id
         return self.__material_id
 
     @material_id.setter
@@ -214,7 +282,7 @@ class Material(object):
                             self.parent.parent.inner_radiation is \
                             not None and \
                             self.parent.parent.area is not None:
-                        self.parent.parent.calc_ua_value()
+                        self.parent.parent.invalidate_ua_value()
 
     @property
     def density(self):
@@ -3,7 +3,9 @@ from teaser.logic.buildingobjects.buildingphysics.buildingelement \
     import BuildingElement
 from teaser.logic.buildingobjects.buildingphysics.layer import Layer
 from teaser.logic.buildingobjects.buildingphysics.material import Material
-import numpy as np
+import teaser.logic.buildingobjects.calculation.equivalent_res as \
+    equivalent_res
+import teaser.logic.buildingobjects.calculation.sensitivity as sensitivity
 import warnings
 
 
@@ -125,106 +127,68 @@ class Wall(BuildingElement):
             Time constant according to VDI 6007 (default t_bt = 7)
         """
 
-        nr_of_layer, density, thermal_conduc, heat_capac, thickness = \
-            self.gather_element_properties()
-
-        omega = 2 * np.pi / (86400 * t_bt)
-
-        r_layer = thickness / thermal_conduc
-        c_layer = heat_capac * density * thickness * 1000
-
-        re11 = np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            np.cos(np.sqrt(0.5 * omega * r_layer * c_layer))
-        im11 = np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            np.sin(np.sqrt(0.5 * omega * r_layer * c_layer))
-        re12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) +
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        im12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) -
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        re21 = (-1 / r_layer) * (np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) -
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        im21 = (1 / r_layer) * (np.sqrt(0.5 * omega * r_layer * c_layer)) * \
-            (np.cosh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.sin(np.sqrt(0.5 * omega * r_layer * c_layer)) +
-                np.sinh(np.sqrt(0.5 * omega * r_layer * c_layer)) *
-                np.cos(np.sqrt(0.5 * omega * r_layer * c_layer)))
-        re22 = re11
-        im22 = im11
-
-        # -----setting up the matrix for each layer
-        a_layer = np.zeros((nr_of_layer, 4, 4))
-
-        for i, r in enumerate(re11):
-            a_layer[i][0][0] = r
-            a_layer[i][0][1] = im11[i]
-            a_layer[i][0][2] = re12[i]
-            a_layer[i][0][3] = im12[i]
-            a_layer[i][1][0] = -im11[i]
-            a_layer[i][1][1] = re11[i]
-            a_layer[i][1][2] = -im12[i]
-            a_layer[i][1][3] = re12[i]
-            a_layer[i][2][0] = re21[i]
-            a_layer[i][2][1] = im21[i]
-            a_layer[i][2][2] = re22[i]
-            a_layer[i][2][3] = im22[i]
-            a_layer[i][3][0] = -im21[i]
-            a_layer[i][3][1] = re21[i]
-            a_layer[i][3][2] = -im22[i]
-            a_layer[i][3][3] = re22[i]
-
-        # -----multiplication of the matrix
-        new_mat = np.diag(np.ones(4))
-
-        for count_layer in a_layer:
-            new_mat = np.dot(new_mat, count_layer)
-
-        # calculation of equivalent Resistance and capacities of each element
-        self.r1 = (1 / self.area) * ((new_mat[3][3] - 1) *
-                                     new_mat[0][2] + new_mat[2][3] *
-                                     new_mat[0][3]) / \
-                  ((new_mat[3][3] - 1) ** 2 + new_mat[2][3] ** 2)
-        self.r2 = (1 / self.area) * ((new_mat[0][0] - 1) *
-                                     new_mat[0][2] + new_mat[0][1] *
-                                     new_mat[0][3]) / \
-                  ((new_mat[0][0] - 1) ** 2 + new_mat[0][1] ** 2)
-        self.c1 = self.area * ((new_mat[3][3] - 1) ** 2 +
-                               (new_mat[2][3]) ** 2) / \
-            (omega * (new_mat[0][2] * new_mat[2][3] -
-                      (new_mat[3][3] - 1) * new_mat[0][3]))
-        self.c2 = self.area * ((new_mat[0][0] - 1) ** 2 +
-                               (new_mat[0][1]) ** 2) / (
-            omega * (new_mat[0][2] *
-                     new_mat[0][1] -
-                     (new_mat[0][0] - 1) *
-                     new_mat[0][3]))
-        self.r3 = (1 / self.area) * (np.sum(r_layer)) - self.r1 - self.r2
-
-        r_wall = self.r1 + self.r2 + self.r3
-
-        self.c1_korr = (1 / (omega * self.r1)) * ((r_wall * self.area -
-                                                   new_mat[0][2] * new_mat[3][
-                                                       3] -
-                                                   new_mat[0][3] * new_mat[2][
-                                                       3]) /
-                                                  (new_mat[3][3] * new_mat[0][
-                                                      3] -
-                                                   new_mat[0][2] * new_mat[2][
-                                                       3]))
+        equivalent_res.calc_equivalent_res(elements=[self], t_bt=t_bt)
+
+    def set_equivalent_res(self, r1, r2, r3, c1, c2, c1_korr):
+        """Sets the equivalent resistances and capacities of the wall.
+
+        Used by calc_equivalent_res() to set the results of the vectorized
+        calculation. For OuterWalls, Rooftops and GroundFloors c1 is replaced
+        by the corrected capacity c1_korr.
+
+        Parameters
+        ----------
+        r1 : float [K/W]
+            equivalent resistance R1 of the analogous model given in VDI 6007
+        r2 : float [K/W]
+            equivalent resistance R2 of the analogous model given in VDI 6007
+        r3 : float [K/W]
+            equivalent resistance R3 of the analogous model given in VDI 6007
+        c1 : float [J/K]
+            equivalent capacity C1 of the analogous model given in VDI 6007
+        c2 : float [J/K]
+            equivalent capacity C2 of the analogous model given in VDI 6007
+        c1_korr : float [J/K]
+            corrected capacity C1,korr for building elements in the case of
+            asymmetrical thermal load given in VDI 6007
+        """
+
+        self.r1 = r1
+        self.r2 = r2
+        self.r3 = r3
+        self.c1 = c1
+        self.c2 = c2
+        self.c1_korr = c1_korr
 
         if type(self).__name__ == "OuterWall" \
                 or type(self).__name__ == "Rooftop" \
                 or type(self).__name__ == "GroundFloor":
             self.c1 = self.c1_korr
 
+    def calc_sensitivities(self, t_bt=7):
+        """Derivatives of the equivalent resistances to layer properties.
+
+        Calculates the derivatives of the values of calc_equivalent_res() and
+        calc_ua_value() with respect to thermal_conduc, thickness,
+        heat_capac and density of each layer, see
+        sensitivity.calc_element_sensitivities().
+
+        Parameters
+        ----------
+        t_bt : int
+            Time constant according to VDI 6007 (default t_bt = 7)
+
+        Returns
+        ----------
+        sensitivities : collections.OrderedDict
+            Dictionary with numpy arrays of shape (number of layer, 4) for
+            the keys of sensitivity.WALL_RESULTS. Entry [j, k] is the
+            derivative with respect to sensitivity.PARAMETERS[k] of layer j
+        """
+
+        return sensitivity.calc_element_sensitivities(
+            elements=[self], t_bt=t_bt)[0]
+
     def insulate_wall(
             self,
             material=None,
@@ -250,7 +214,7 @@ class Wall(BuildingElement):
         new_material = Material(ext_layer)
         new_material.load_material_template(
             material,
-            data_class=self.parent.parent.parent.data)
+            data_class=self.parent.parent.data)
 
         if thickness is None:
             pass
@@ -4,6 +4,7 @@
 
 from teaser.logic.buildingobjects.buildingphysics.buildingelement \
     import BuildingElement
+import teaser.logic.buildingobjects.calculation.sensitivity as sensitivity
 import warnings
 
 
@@ -156,6 +157,24 @@ class Window(BuildingElement):
         for layer_count in c_layer:
             self.c1 += layer_count
 
+    def calc_sensitivities(self):
+        """Derivatives of the equivalent resistance to layer properties
+
+        Calculates the derivatives of the values of calc_equivalent_res() and
+        calc_ua_value() with respect to thermal_conduc, thickness,
+        heat_capac and density of each layer, see
+        sensitivity.calc_element_sensitivities().
+
+        Returns
+        ----------
+        sensitivities : collections.OrderedDict
+            Dictionary with numpy arrays of shape (number of layer, 4) for
+            the keys of sensitivity.WINDOW_RESULTS. Entry [j, k] is the
+            derivative with respect to sensitivity.PARAMETERS[k] of layer j
+        """
+
+        return sensitivity.calc_element_sensitivities(elements=[self])[0]
+
     def replace_window(self, year_of_retrofit, window_type=None):
         """Replace a window, with a newer one.
 
@@ -183,7 +202,7 @@ class Window(BuildingElement):
         self.layer = None
         self.load_type_element(year_of_retrofit,
                                window_type,
-                               self.parent.parent.parent.data)
+                               self.parent.parent.data)
 
     @property
     def parent(self):
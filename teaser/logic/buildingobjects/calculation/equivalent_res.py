@@ -0,0 +1,677 @@
+# created October 2026
+
+"""Vectorized calculation of equivalent resistances and capacities.
+
+This module holds the transfer matrix kernel behind
+Wall.calc_equivalent_res(). The calculation is split into an area
+independent stage (calc_transfer_matrices) and an area scaling stage
+(scale_equivalent_res), both working on arrays of many walls at once. The
+walls do not need to belong to the same thermal zone, thus all walls of a
+whole project can be calculated in one call of calc_equivalent_res().
+The parallel connection of the walls of many thermal zones is calculated
+in the same way by calc_parallel_connection().
+
+Results of the area independent stage are kept in a LRU cache keyed by
+the layer properties and t_bt, as archetype buildings reuse only a few
+distinct constructions. A cache hit is bit-identical to a fresh
+calculation, as the area scaling is always done anew.
+"""
+
+from __future__ import division
+import collections
+import threading
+import numpy as np
+
+_transfer_cache = collections.OrderedDict()
+_transfer_cache_lock = threading.Lock()
+_transfer_cache_info = {"hits": 0, "misses": 0, "maxsize": 4096}
+
+
+def gather_layer_properties(elements):
+    """Gathers the layer properties of several elements in padded arrays.
+
+    Parameters
+    ----------
+    elements : list
+        List of TEASER Wall instances
+
+    Returns
+    ----------
+    nr_of_layer : np.array
+        Numpy array with length of number of elements, filled with the number
+        of layer of each element
+    density : np.array
+        Numpy array of shape (number of elements, maximum number of layer),
+        filled with density of each layer, padded with zeros
+    thermal_conduc : np.array
+        Numpy array of shape (number of elements, maximum number of layer),
+        filled with thermal_conduc of each layer, padded with zeros
+    heat_capac : np.array
+        Numpy array of shape (number of elements, maximum number of layer),
+        filled with heat_capac of each layer, padded with zeros
+    thickness : np.array
+        Numpy array of shape (number of elements, maximum number of layer),
+        filled with thickness of each layer, padded with zeros
+    """
+
+    nr_of_layer = np.array([len(element.layer) for element in elements],
+                           dtype=int)
+    max_layer = int(nr_of_layer.max()) if len(elements) > 0 else 0
+
+    density = np.zeros((len(elements), max_layer))
+    thermal_conduc = np.zeros((len(elements), max_layer))
+    heat_capac = np.zeros((len(elements), max_layer))
+    thickness = np.zeros((len(elements), max_layer))
+
+    for i, element in enumerate(elements):
+        for j, layer in enumerate(element.layer):
+            density[i, j] = layer.material.density
+            thermal_conduc[i, j] = layer.material.thermal_conduc
+            heat_capac[i, j] = layer.material.heat_capac
+            thickness[i, j] = layer.thickness
+
+    return nr_of_layer, density, thermal_conduc, heat_capac, thickness
+
+
+def calc_omega(t_bt=7):
+    """Angular frequency of the excitation according to VDI 6007.
+
+    Parameters
+    ----------
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+
+    Returns
+    ----------
+    omega : float
+        angular frequency of the excitation
+    """
+
+    return 2 * np.pi / (86400 * t_bt)
+
+
+def calc_layer_matrices(r_layer, c_layer, omega):
+    """Transfer matrices of single layers according to VDI 6007.
+
+    The complex 2x2 transfer matrix of each layer is stored as real 4x4
+    matrix. All arguments are broadcast against each other.
+
+    Parameters
+    ----------
+    r_layer : np.array
+        Numpy array of resistances of the layers (thickness/thermal_conduc)
+    c_layer : np.array
+        Numpy array of capacities of the layers
+    omega : float
+        angular frequency of the excitation
+
+    Returns
+    ----------
+    a_layer : np.array
+        Numpy array with shape of r_layer plus (4, 4), filled with the
+        transfer matrix of each layer
+    """
+
+    x = np.sqrt(0.5 * omega * r_layer * c_layer)
+    cosh_x = np.cosh(x)
+    sinh_x = np.sinh(x)
+    cos_x = np.cos(x)
+    sin_x = np.sin(x)
+
+    re11 = cosh_x * cos_x
+    im11 = sinh_x * sin_x
+    re12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
+        (cosh_x * sin_x + sinh_x * cos_x)
+    im12 = r_layer * np.sqrt(1 / (2 * omega * r_layer * c_layer)) * \
+        (cosh_x * sin_x - sinh_x * cos_x)
+    re21 = (-1 / r_layer) * x * (cosh_x * sin_x - sinh_x * cos_x)
+    im21 = (1 / r_layer) * x * (cosh_x * sin_x + sinh_x * cos_x)
+
+    a_layer = np.empty(np.shape(re11) + (4, 4), dtype=np.result_type(re11))
+
+    a_layer[..., 0, 0] = re11
+    a_layer[..., 0, 1] = im11
+    a_layer[..., 0, 2] = re12
+    a_layer[..., 0, 3] = im12
+    a_layer[..., 1, 0] = -im11
+    a_layer[..., 1, 1] = re11
+    a_layer[..., 1, 2] = -im12
+    a_layer[..., 1, 3] = re12
+    a_layer[..., 2, 0] = re21
+    a_layer[..., 2, 1] = im21
+    a_layer[..., 2, 2] = re11
+    a_layer[..., 2, 3] = im11
+    a_layer[..., 3, 0] = -im21
+    a_layer[..., 3, 1] = re21
+    a_layer[..., 3, 2] = -im11
+    a_layer[..., 3, 3] = re11
+
+    return a_layer
+
+
+def calc_transfer_matrices(
+        nr_of_layer,
+        density,
+        thermal_conduc,
+        heat_capac,
+        thickness,
+        t_bt=7):
+    """Area independent stage of the equivalent resistance calculation.
+
+    Multiplies the transfer matrices of all layers of each element (from
+    the inner to the outer layer) and sums up the resistances of the
+    layers. Elements are grouped by their number of layer, thus padded
+    entries of the layer arrays are never evaluated and the results are
+    identical to a calculation of each element on its own.
+
+    Parameters
+    ----------
+    nr_of_layer : np.array
+        Numpy array with length of number of elements, filled with the number
+        of layer of each element
+    density : np.array
+        Numpy array of shape (number of elements, maximum number of layer)
+    thermal_conduc : np.array
+        Numpy array of shape (number of elements, maximum number of layer)
+    heat_capac : np.array
+        Numpy array of shape (number of elements, maximum number of layer)
+    thickness : np.array
+        Numpy array of shape (number of elements, maximum number of layer)
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+
+    Returns
+    ----------
+    transfer_mat : np.array
+        Numpy array of shape (number of elements, 4, 4), filled with the
+        transfer matrix of each element
+    r_sum : np.array
+        Numpy array with length of number of elements, filled with the sum
+        of the layer resistances of each element
+    """
+
+    nr_of_layer = np.asarray(nr_of_layer, dtype=int)
+    omega = calc_omega(t_bt=t_bt)
+
+    # complex layer properties are passed through, e.g. for the complex
+    # step derivatives of sensitivity.py
+    dtype = np.result_type(density, thermal_conduc, heat_capac, thickness)
+    transfer_mat = np.empty((len(nr_of_layer), 4, 4), dtype=dtype)
+    r_sum = np.empty(len(nr_of_layer), dtype=dtype)
+
+    for count_layer in np.unique(nr_of_layer):
+        index = np.flatnonzero(nr_of_layer == count_layer)
+
+        r_layer = np.ascontiguousarray(
+            thickness[index, :count_layer]) / np.ascontiguousarray(
+            thermal_conduc[index, :count_layer])
+        c_layer = np.ascontiguousarray(
+            heat_capac[index, :count_layer]) * np.ascontiguousarray(
+            density[index, :count_layer]) * np.ascontiguousarray(
+            thickness[index, :count_layer]) * 1000
+
+        a_layer = calc_layer_matrices(
+            r_layer=r_layer,
+            c_layer=c_layer,
+            omega=omega)
+
+        new_mat = np.broadcast_to(np.diag(np.ones(4)), (len(index), 4, 4))
+        for i in range(count_layer):
+            new_mat = np.matmul(
+                new_mat, np.ascontiguousarray(a_layer[:, i]))
+
+        transfer_mat[index] = new_mat
+        r_sum[index] = np.sum(r_layer, axis=1)
+
+    return transfer_mat, r_sum
+
+
+def scale_equivalent_res(transfer_mat, r_sum, area, t_bt=7):
+    """Area scaling stage of the equivalent resistance calculation.
+
+    Calculates the equivalent resistances and capacities according to VDI
+    6007 from the results of calc_transfer_matrices().
+
+    Parameters
+    ----------
+    transfer_mat : np.array
+        Numpy array of shape (number of elements, 4, 4), filled with the
+        transfer matrix of each element
+    r_sum : np.array
+        Numpy array with length of number of elements, filled with the sum
+        of the layer resistances of each element
+    area : np.array
+        Numpy array with length of number of elements, filled with the area
+        of each element
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+
+    Returns
+    ----------
+    r1 : np.array
+    r2 : np.array
+    r3 : np.array
+    c1 : np.array
+    c2 : np.array
+    c1_korr : np.array
+        Numpy arrays with length of number of elements, filled with the
+        equivalent resistances and capacities of each element
+    """
+
+    omega = calc_omega(t_bt=t_bt)
+    area = np.asarray(area, dtype=float)
+
+    m00 = transfer_mat[:, 0, 0]
+    m01 = transfer_mat[:, 0, 1]
+    m02 = transfer_mat[:, 0, 2]
+    m03 = transfer_mat[:, 0, 3]
+    m23 = transfer_mat[:, 2, 3]
+    m33 = transfer_mat[:, 3, 3]
+
+    # np.float_power evaluates pow() like the power operator of single
+    # floats does, while the power operator of arrays may round differently
+    sq_33 = np.float_power(m33 - 1, 2)
+    sq_23 = np.float_power(m23, 2)
+    sq_00 = np.float_power(m00 - 1, 2)
+    sq_01 = np.float_power(m01, 2)
+
+    r1 = (1 / area) * ((m33 - 1) * m02 + m23 * m03) / (sq_33 + sq_23)
+    r2 = (1 / area) * ((m00 - 1) * m02 + m01 * m03) / (sq_00 + sq_01)
+    c1 = area * (sq_33 + sq_23) / (omega * (m02 * m23 - (m33 - 1) * m03))
+    c2 = area * (sq_00 + sq_01) / (omega * (m02 * m01 - (m00 - 1) * m03))
+    r3 = (1 / area) * r_sum - r1 - r2
+
+    r_wall = r1 + r2 + r3
+
+    c1_korr = (1 / (omega * r1)) * (
+        (r_wall * area - m02 * m33 - m03 * m23) / (m33 * m03 - m02 * m23))
+
+    return r1, r2, r3, c1, c2, c1_korr
+
+
+def get_cache_info():
+    """Statistics of the cache for the area independent stage.
+
+    Returns
+    ----------
+    cache_info : dict
+        Dictionary with the number of cache hits and misses, the maximal
+        number of cached constructions (maxsize) and the current number of
+        cached constructions (currsize)
+    """
+
+    with _transfer_cache_lock:
+        cache_info = dict(_transfer_cache_info)
+        cache_info["currsize"] = len(_transfer_cache)
+    return cache_info
+
+
+def clear_cache(maxsize=None):
+    """Clears the cache for the area independent stage.
+
+    Removes all cached constructions and resets the statistics.
+
+    Parameters
+    ----------
+    maxsize : int
+        New maximal number of cached constructions, the least recently used
+        constructions are discarded first. Default is None, which keeps the
+        current maxsize. Use 0 to disable the cache.
+    """
+
+    with _transfer_cache_lock:
+        _transfer_cache.clear()
+        _transfer_cache_info["hits"] = 0
+        _transfer_cache_info["misses"] = 0
+        if maxsize is not None:
+            _transfer_cache_info["maxsize"] = int(maxsize)
+
+
+def lookup_transfer_matrices(
+        nr_of_layer,
+        density,
+        thermal_conduc,
+        heat_capac,
+        thickness,
+        t_bt=7):
+    """Cached version of calc_transfer_matrices().
+
+    Looks up the transfer matrix and the summed layer resistance of each
+    element in the cache, keyed by the tuple of (thickness, thermal_conduc,
+    density, heat_capac) of each layer and t_bt. Only constructions
+    missing in the cache are calculated with calc_transfer_matrices().
+    Parameters and returns are the same as in calc_transfer_matrices().
+    """
+
+    nr_of_layer = np.asarray(nr_of_layer, dtype=int)
+    keys = [
+        tuple(zip(
+            thickness[i, :count_layer].tolist(),
+            thermal_conduc[i, :count_layer].tolist(),
+            density[i, :count_layer].tolist(),
+            heat_capac[i, :count_layer].tolist())) + (t_bt,)
+        for i, count_layer in enumerate(nr_of_layer.tolist())]
+
+    transfer_mat = np.empty((len(keys), 4, 4))
+    r_sum = np.empty(len(keys))
+    missing = collections.OrderedDict()
+
+    with _transfer_cache_lock:
+        for i, key in enumerate(keys):
+            cached = _transfer_cache.get(key)
+            if cached is not None:
+                _transfer_cache.move_to_end(key)
+                _transfer_cache_info["hits"] += 1
+                transfer_mat[i], r_sum[i] = cached
+            elif key in missing:
+                # same construction as a previous element of this call
+                _transfer_cache_info["hits"] += 1
+                missing[key].append(i)
+            else:
+                _transfer_cache_info["misses"] += 1
+                missing[key] = [i]
+
+    if missing:
+        index = [positions[0] for positions in missing.values()]
+        new_mat, new_r_sum = calc_transfer_matrices(
+            nr_of_layer=nr_of_layer[index],
+            density=density[index],
+            thermal_conduc=thermal_conduc[index],
+            heat_capac=heat_capac[index],
+            thickness=thickness[index],
+            t_bt=t_bt)
+
+        with _transfer_cache_lock:
+            maxsize = _transfer_cache_info["maxsize"]
+            for j, (key, positions) in enumerate(missing.items()):
+                transfer_mat[positions] = new_mat[j]
+                r_sum[positions] = new_r_sum[j]
+                if maxsize > 0:
+                    _transfer_cache[key] = (new_mat[j].copy(), new_r_sum[j])
+                    _transfer_cache.move_to_end(key)
+            while len(_transfer_cache) > max(maxsize, 0):
+                _transfer_cache.popitem(last=False)
+
+    return transfer_mat, r_sum
+
+
+def calc_equivalent_res(elements, t_bt=7, use_cache=True):
+    """Equivalent resistance of several walls according to VDI 6007.
+
+    Calculates the equivalent resistances and capacities of all given
+    walls in one call and sets them to the walls, see
+    Wall.calc_equivalent_res(). The walls may belong to different thermal
+    zones and buildings.
+
+    Parameters
+    ----------
+    elements : list
+        List of TEASER Wall instances
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+    use_cache : bool
+        If True (default), the area independent stage is looked up in the
+        cache of already calculated constructions
+    """
+
+    if len(elements) == 0:
+        return
+
+    nr_of_layer, density, thermal_conduc, heat_capac, thickness = \
+        gather_layer_properties(elements)
+
+    if use_cache is True:
+        calc_stage = lookup_transfer_matrices
+    else:
+        calc_stage = calc_transfer_matrices
+
+    transfer_mat, r_sum = calc_stage(
+        nr_of_layer=nr_of_layer,
+        density=density,
+        thermal_conduc=thermal_conduc,
+        heat_capac=heat_capac,
+        thickness=thickness,
+        t_bt=t_bt)
+
+    r1, r2, r3, c1, c2, c1_korr = scale_equivalent_res(
+        transfer_mat=transfer_mat,
+        r_sum=r_sum,
+        area=[float(element.area) for element in elements],
+        t_bt=t_bt)
+
+    for i, element in enumerate(elements):
+        element.set_equivalent_res(
+            r1=r1[i], r2=r2[i], r3=r3[i], c1=c1[i], c2=c2[i],
+            c1_korr=c1_korr[i])
+
+
+def calc_parallel_connection(r1, c1, omega, nr_of_elements=None):
+    """Parallel connection of walls according to VDI 6007.
+
+    Calculates the parallel connection of wall elements according to VDI
+    6007, resulting in R1 and C1 (equation 23, 24). The elements are
+    folded pairwise from the first to the last one, for all thermal zones
+    at once.
+
+    Parameters
+    ----------
+    r1 : np.array
+        Numpy array with resistances R1 of the elements, either of shape
+        (number of elements) for one thermal zone or of shape (number of
+        zones, maximum number of elements) for several thermal zones
+    c1 : np.array
+        Numpy array with capacities C1 of the elements, same shape as r1
+    omega : float or np.array
+        VDI 6007 frequency, either one value or one value per thermal zone
+    nr_of_elements : np.array
+        Number of elements of each thermal zone, entries of r1 and c1 behind
+        that number are ignored. Default is None, which uses all entries
+
+    Returns
+    ----------
+    r1 : float or np.array [K/W]
+        VDI 6007 resistance for all elements of each thermal zone
+    c1 : float or np.array [K/W]
+        VDI 6007 capacity for all elements of each thermal zone
+    """
+
+    dtype = np.result_type(np.asarray(r1), np.asarray(c1), float)
+    r1 = np.asarray(r1, dtype=dtype)
+    c1 = np.asarray(c1, dtype=dtype)
+    single_zone = r1.ndim == 1
+    r1 = np.atleast_2d(r1)
+    c1 = np.atleast_2d(c1)
+    if nr_of_elements is None:
+        nr_of_elements = np.full(r1.shape[0], r1.shape[1])
+    nr_of_elements = np.asarray(nr_of_elements)
+
+    # np.float_power evaluates pow() like the power operator of single
+    # floats does, while the power operator of arrays may round differently
+    omega_sq = np.float_power(omega, 2)
+
+    r1x = r1[:, 0]
+    c1x = c1[:, 0]
+    for count in range(1, r1.shape[1]):
+        r1y = r1[:, count]
+        c1y = c1[:, count]
+        c1x_sq = np.float_power(c1x, 2)
+        c1y_sq = np.float_power(c1y, 2)
+        denominator = np.float_power(c1x + c1y, 2) + omega_sq * \
+            np.float_power(r1x + r1y, 2) * c1x_sq * c1y_sq
+
+        r1_new = (r1x * c1x_sq + r1y * c1y_sq + omega_sq * r1x * r1y *
+                  (r1x + r1y) * c1x_sq * c1y_sq) / denominator
+        c1_new = denominator / (
+            c1x + c1y + omega_sq * (
+                np.float_power(r1x, 2) * c1x +
+                np.float_power(r1y, 2) * c1y) * c1x * c1y)
+
+        active = count < nr_of_elements
+        r1x = np.where(active, r1_new, r1x)
+        c1x = np.where(active, c1_new, c1x)
+
+    if single_zone:
+        return r1x[0], c1x[0]
+    return r1x, c1x
+
+
+def calc_parallel_connection_of_elements(element_lists, omega):
+    """Parallel connection of the walls of several thermal zones.
+
+    Gathers R1 and C1 of the elements in padded arrays and calculates the
+    parallel connection of all element lists at once, see
+    calc_parallel_connection().
+
+    Parameters
+    ----------
+    element_lists : list
+        List of lists of inner or outer walls, e.g. one list per thermal zone
+    omega : float or np.array
+        VDI 6007 frequency, either one value or one value per element list
+
+    Returns
+    ----------
+    r1 : np.array [K/W]
+        VDI 6007 resistance for all elements of each element list
+    c1 : np.array [K/W]
+        VDI 6007 capacity for all elements of each element list
+    """
+
+    nr_of_elements = np.array([len(elements) for elements in element_lists],
+                              dtype=int)
+    max_elements = int(nr_of_elements.max()) if len(element_lists) > 0 else 0
+
+    r1 = np.ones((len(element_lists), max_elements))
+    c1 = np.ones((len(element_lists), max_elements))
+    for i, elements in enumerate(element_lists):
+        for j, element in enumerate(elements):
+            r1[i, j] = element.r1
+            c1[i, j] = element.c1
+
+    return calc_parallel_connection(
+        r1=r1,
+        c1=c1,
+        omega=omega,
+        nr_of_elements=nr_of_elements)
+
+
+def calc_wall_type(r1, c1, c1_korr, omega):
+    """R1 and C1 of the walls of one wall type according to VDI 6007.
+
+    A single wall keeps its R1 and its corrected capacity C1_korr, several
+    walls are connected in parallel (see calc_parallel_connection()).
+
+    Parameters
+    ----------
+    r1 : np.array
+        Numpy array with resistances R1 of the walls, either of shape
+        (number of walls) or of shape (number of rows, number of walls),
+        e.g. one row per sample
+    c1 : np.array
+        Numpy array with capacities C1 of the walls, same shape as r1
+    c1_korr : np.array
+        Numpy array with corrected capacities C1_korr of the walls, same
+        shape as r1
+    omega : float or np.array
+        VDI 6007 frequency, either one value or one value per row
+
+    Returns
+    ----------
+    r1 : float or np.array [K/W]
+        VDI 6007 resistance of the wall type
+    c1 : float or np.array [J/K]
+        VDI 6007 capacity of the wall type
+    """
+
+    r1 = np.asarray(r1)
+    if r1.shape[-1] == 1:
+        # [()] returns a scalar instead of an array of zero dimensions
+        return r1[..., 0][()], np.asarray(c1_korr)[..., 0][()]
+    return calc_parallel_connection(r1=r1, c1=c1, omega=omega)
+
+
+def calc_r_rest(r_conduc, r1):
+    """Remaining resistance of one wall type.
+
+    The conduction resistances of the walls are connected in parallel (one
+    wall after another, like sum()), the remaining resistance is the
+    difference to R1 of the wall type.
+
+    Parameters
+    ----------
+    r_conduc : np.array
+        Numpy array with conduction resistances of the walls, of shape
+        (number of walls) or (number of rows, number of walls)
+    r1 : float or np.array
+        R1 of the wall type, one value or one value per row
+
+    Returns
+    ----------
+    r_rest : float or np.array [K/W]
+        Remaining resistance of the wall type
+    """
+
+    r_conduc = np.asarray(r_conduc)
+    conductance = 0
+    for count in range(r_conduc.shape[-1]):
+        conductance = conductance + 1 / r_conduc[..., count]
+    return 1 / conductance - r1
+
+
+def calc_weighted_g_value(g_value, area):
+    """Area weighted g value of the windows of a zone.
+
+    Parameters
+    ----------
+    g_value : np.array
+        Numpy array with g values of the windows, of shape (number of
+        windows) or (number of rows, number of windows)
+    area : np.array
+        Numpy array with the areas of the windows, of shape (number of
+        windows)
+
+    Returns
+    ----------
+    weighted_g_value : float or np.array
+        Sum of g value times area of the windows (one window after another,
+        like sum()) divided by the sum of the areas
+    """
+
+    g_value = np.asarray(g_value)
+    area = np.asarray(area)
+    weighted = 0
+    total = 0
+    for count in range(area.shape[-1]):
+        weighted = weighted + g_value[..., count] * area[count]
+        total = total + area[count]
+    return weighted / total
+
+
+def calc_element_values(thermal_zone):
+    """Calculates the values of all building elements of a thermal zone.
+
+    Calculates the equivalent resistances and capacities of all walls in one
+    call of calc_equivalent_res() and of all windows, followed by the U*A
+    values and resistances of all elements. These values are the same for
+    all model orders (OneElement to FourElement) and are therefore only
+    calculated once per thermal zone.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone()
+        TEASER instance of ThermalZone
+    """
+
+    walls = (thermal_zone.outer_walls +
+             thermal_zone.rooftops +
+             thermal_zone.ground_floors +
+             thermal_zone.inner_walls +
+             thermal_zone.floors +
+             thermal_zone.ceilings)
+
+    calc_equivalent_res(walls)
+    for wall in walls:
+        wall.calc_ua_value()
+    for win in thermal_zone.windows:
+        win.calc_equivalent_res()
+        win.calc_ua_value()
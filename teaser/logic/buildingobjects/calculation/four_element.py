@@ -4,6 +4,9 @@ from __future__ import division
 import math
 import random
 import warnings
+import teaser.logic.buildingobjects.calculation.equivalent_res as \
+    equivalent_res
+import teaser.logic.buildingobjects.calculation.sensitivity as sensitivity
 
 
 class FourElement(object):
@@ -571,26 +574,20 @@ class FourElement(object):
         self.heat_load = 0.0
         self.cool_load = 0.0
 
-    def calc_attributes(self):
-        """Calls all necessary function to calculate model attributes"""
-
-        for out_wall in self.thermal_zone.outer_walls:
-            out_wall.calc_equivalent_res()
-            out_wall.calc_ua_value()
-        for rt in self.thermal_zone.rooftops:
-            rt.calc_equivalent_res()
-            rt.calc_ua_value()
-        for gf in self.thermal_zone.ground_floors:
-            gf.calc_equivalent_res()
-            gf.calc_ua_value()
-        for win in self.thermal_zone.windows:
-            win.calc_equivalent_res()
-            win.calc_ua_value()
-        for inner_wall in (self.thermal_zone.inner_walls +
-                           self.thermal_zone.floors +
-                           self.thermal_zone.ceilings):
-            inner_wall.calc_equivalent_res()
-            inner_wall.calc_ua_value()
+    def calc_attributes(self, calc_elements=True):
+        """Calls all necessary function to calculate model attributes
+
+        Parameters
+        ----------
+        calc_elements : bool
+            If True (default), the equivalent resistances and U*A values of
+            all building elements of the thermal zone are calculated first.
+            Set to False if they are already calculated (see
+            equivalent_res.calc_element_values()).
+        """
+
+        if calc_elements is True:
+            equivalent_res.calc_element_values(self.thermal_zone)
 
         self.set_calc_default()
         if len(self.thermal_zone.outer_walls) < 1:
@@ -662,63 +659,10 @@ class FourElement(object):
             VDI 6007 capacity all for inner or outer walls
         """
 
-        for wall_count in range(len(element_list) - 1):
-
-            if wall_count == 0:
-
-                r1 = (element_list[wall_count].r1 *
-                      element_list[wall_count].c1 ** 2 +
-                      element_list[wall_count + 1].r1 *
-                      element_list[wall_count + 1].c1 ** 2 + omega ** 2 *
-                      element_list[wall_count].r1 *
-                      element_list[wall_count + 1].r1 *
-                      (element_list[wall_count].r1 +
-                       element_list[wall_count + 1].r1) *
-                      element_list[wall_count].c1 ** 2 *
-                      element_list[wall_count + 1].c1 ** 2) / \
-                     ((element_list[wall_count].c1 +
-                       element_list[wall_count + 1].c1) ** 2 + omega ** 2 *
-                      (element_list[wall_count].r1 +
-                       element_list[wall_count + 1].r1) ** 2 *
-                      element_list[wall_count].c1 ** 2 *
-                      element_list[wall_count + 1].c1 ** 2)
-
-                c1 = ((element_list[wall_count].c1 +
-                       element_list[wall_count + 1].c1) ** 2 + omega ** 2 *
-                      (element_list[wall_count].r1 +
-                       element_list[wall_count + 1].r1) ** 2 *
-                      element_list[wall_count].c1 ** 2 *
-                      element_list[wall_count + 1].c1 ** 2) / \
-                     (element_list[wall_count].c1 +
-                      element_list[wall_count + 1].c1 + omega ** 2 *
-                      (element_list[wall_count].r1 ** 2 *
-                       element_list[wall_count].c1 +
-                       element_list[wall_count + 1].r1 ** 2 *
-                       element_list[wall_count + 1].c1) *
-                      element_list[wall_count].c1 *
-                      element_list[wall_count + 1].c1)
-            else:
-                r1x = r1
-                c1x = c1
-                r1 = (r1x * c1x ** 2 + element_list[wall_count + 1].r1 *
-                      element_list[wall_count + 1].c1 ** 2 +
-                      omega ** 2 * r1x * element_list[wall_count + 1].r1 *
-                      (r1x + element_list[wall_count + 1].r1) *
-                      c1x ** 2 * element_list[wall_count + 1].c1 ** 2) / \
-                     ((c1x + element_list[wall_count + 1].c1) ** 2 +
-                      omega ** 2 * (
-                          r1x + element_list[wall_count + 1].r1) ** 2 *
-                      c1x ** 2 * element_list[wall_count + 1].c1 ** 2)
-
-                c1 = ((c1x + element_list[
-                    wall_count + 1].c1) ** 2 + omega ** 2 *
-                    (r1x + element_list[wall_count + 1].r1) ** 2 * c1x ** 2 *
-                    element_list[wall_count + 1].c1 ** 2) / \
-                    (c1x + element_list[wall_count + 1].c1 + omega ** 2 *
-                     (r1x ** 2 * c1x + element_list[wall_count + 1].r1 **
-                      2 * element_list[wall_count + 1].c1) * c1x *
-                     element_list[wall_count + 1].c1)
-        return r1, c1
+        return equivalent_res.calc_parallel_connection(
+            r1=[element.r1 for element in element_list],
+            c1=[element.c1 for element in element_list],
+            omega=omega)
 
     def _sum_outer_wall_elements(self):
         """Sum attributes for outer wall elements
@@ -1044,8 +988,9 @@ class FourElement(object):
                                     * win.area for win in
                                     self.thermal_zone.windows) / self.area_win
 
-        self.weighted_g_value = sum(win.g_value * win.area for win in
-                                    self.thermal_zone.windows) / self.area_win
+        self.weighted_g_value = equivalent_res.calc_weighted_g_value(
+            g_value=[win.g_value for win in self.thermal_zone.windows],
+            area=[win.area for win in self.thermal_zone.windows])
 
         self.alpha_conv_outer_win = (
             1 / (self.r_conv_outer_win * self.area_win))
@@ -1073,14 +1018,12 @@ class FourElement(object):
 
         outer_walls = (self.thermal_zone.outer_walls)
 
-        if 0 < len(outer_walls) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_ow = outer_walls[0].r1
-            self.c1_ow = outer_walls[0].c1_korr
-        elif len(outer_walls) > 1:
-            # more than one outer wall, calculate chain matrix
-            self.r1_ow, self.c1_ow = self._calc_parallel_connection(outer_walls,
-                                                                    omega)
+        if len(outer_walls) > 0:
+            self.r1_ow, self.c1_ow = equivalent_res.calc_wall_type(
+                r1=[wall.r1 for wall in outer_walls],
+                c1=[wall.c1 for wall in outer_walls],
+                c1_korr=[wall.c1_korr for wall in outer_walls],
+                omega=omega)
         else:
             warnings.warn("No walls are defined as outer walls, please be "
                           "careful with results. In addition this might lead "
@@ -1093,10 +1036,9 @@ class FourElement(object):
                     self.r1_win = (1 / sum((1 / win.r1) for win in
                                            self.thermal_zone.windows))
                 if len(self.thermal_zone.outer_walls) > 0:
-                    conduction = (1 / sum((1 / element.r_conduc) for element in
-                                  outer_walls))
-
-                    self.r_rest_ow = (conduction - self.r1_ow)
+                    self.r_rest_ow = equivalent_res.calc_r_rest(
+                        r_conduc=[wall.r_conduc for wall in outer_walls],
+                        r1=self.r1_ow)
 
             except RuntimeError:
                 print("As no outer walls or no windows are defined lumped "
@@ -1154,23 +1096,22 @@ class FourElement(object):
 
         omega = 2 * math.pi / 86400 / self.t_bt
 
-        if 0 < len(self.thermal_zone.ground_floors) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_gf = self.thermal_zone.ground_floors[0].r1
-            self.c1_gf = self.thermal_zone.ground_floors[0].c1_korr
-        elif len(self.thermal_zone.ground_floors) > 1:
-            # more than one outer wall, calculate chain matrix
-            self.r1_gf, self.c1_gf = self._calc_parallel_connection(
-                self.thermal_zone.ground_floors, omega)
+        ground_floors = self.thermal_zone.ground_floors
+
+        if len(ground_floors) > 0:
+            self.r1_gf, self.c1_gf = equivalent_res.calc_wall_type(
+                r1=[wall.r1 for wall in ground_floors],
+                c1=[wall.c1 for wall in ground_floors],
+                c1_korr=[wall.c1_korr for wall in ground_floors],
+                omega=omega)
         else:
             warnings.warn("No walls are defined as ground floors, please be "
                           "careful with results. In addition this might lead "
                           "to RunTimeErrors")
         try:
-            conduction = (1 / sum((1 / element.r_conduc) for element in
-                                  self.thermal_zone.ground_floors))
-
-            self.r_rest_gf = (conduction - self.r1_gf)
+            self.r_rest_gf = equivalent_res.calc_r_rest(
+                r_conduc=[wall.r_conduc for wall in ground_floors],
+                r1=self.r1_gf)
         except RuntimeError:
             print("As no ground floors are defined lumped "
                   "parameter cannot be calculated")
@@ -1190,23 +1131,22 @@ class FourElement(object):
 
         omega = 2 * math.pi / 86400 / self.t_bt
 
-        if 0 < len(self.thermal_zone.rooftops) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_rt = self.thermal_zone.rooftops[0].r1
-            self.c1_rt = self.thermal_zone.rooftops[0].c1_korr
-        elif len(self.thermal_zone.rooftops) > 1:
-            # more than one outer wall, calculate chain matrix
-            self.r1_rt, self.c1_rt = self._calc_parallel_connection(
-                self.thermal_zone.rooftops, omega)
+        rooftops = self.thermal_zone.rooftops
+
+        if len(rooftops) > 0:
+            self.r1_rt, self.c1_rt = equivalent_res.calc_wall_type(
+                r1=[wall.r1 for wall in rooftops],
+                c1=[wall.c1 for wall in rooftops],
+                c1_korr=[wall.c1_korr for wall in rooftops],
+                omega=omega)
         else:
             warnings.warn("No walls are defined as ground floors, please be "
                           "careful with results. In addition this might lead "
                           "to RunTimeErrors")
         try:
-            conduction = (1 / sum((1 / element.r_conduc) for element in
-                                  self.thermal_zone.rooftops))
-
-            self.r_rest_rt = (conduction - self.r1_rt)
+            self.r_rest_rt = equivalent_res.calc_r_rest(
+                r_conduc=[wall.r_conduc for wall in rooftops],
+                r1=self.r1_rt)
         except RuntimeError:
             print("As no rooftops are defined lumped "
                   "parameter cannot be calculated")
@@ -1233,19 +1173,16 @@ class FourElement(object):
                        self.thermal_zone.floors +
                        self.thermal_zone.ceilings)
 
+        equivalent_res.calc_equivalent_res(inner_walls)
         for in_wall in inner_walls:
-            in_wall.calc_equivalent_res()
             in_wall.calc_ua_value()
 
-        if 0 < len(inner_walls) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_iw = inner_walls[0].r1
-            self.c1_iw = inner_walls[0].c1_korr
-        elif len(inner_walls) > 1:
-            # more than one outer wall, calculate chain matrix
-            self.r1_iw, self.c1_iw = self._calc_parallel_connection(
-                inner_walls,
-                omega)
+        if len(inner_walls) > 0:
+            self.r1_iw, self.c1_iw = equivalent_res.calc_wall_type(
+                r1=[wall.r1 for wall in inner_walls],
+                c1=[wall.c1 for wall in inner_walls],
+                c1_korr=[wall.c1_korr for wall in inner_walls],
+                omega=omega)
         else:
             warnings.warn("No walls are defined as outer walls, please be "
                           "careful with results. In addition this might lead "
@@ -1384,14 +1321,14 @@ class FourElement(object):
 
                 if self.merge_windows is False:
                     self.window_areas.append(
-                        sum([win.area for win in wins]))
+                        self.thermal_zone.get_window_area(i[0], i[1]))
                     self.transparent_areas.append(
-                        sum([win.area for win in wins]))
+                        self.thermal_zone.get_window_area(i[0], i[1]))
 
                 else:
                     self.window_areas.append(0)
                     self.transparent_areas.append(
-                        sum([win.area for win in wins]))
+                        self.thermal_zone.get_window_area(i[0], i[1]))
 
         tilt_orient_rt = []
         for roof in self.thermal_zone.rooftops:
@@ -1412,6 +1349,72 @@ class FourElement(object):
                     sum([rt.wf_out for rt in rts]))
                 self.rooftop_areas.append(sum([rt.area for rt in rts]))
 
+    def get_heat_load_ua_values(self):
+        """UA values of the static heat load calculation
+
+        Returns the UA values used by _calc_heat_load(), e.g. to calculate
+        the heat load of many zones at once (see heat_load.py).
+
+        Returns
+        -------
+        ua_value_ow_temp : float [W/K]
+            UA Value of the outer walls without GroundFloors
+        ua_value_win : float [W/K]
+            UA Value of the windows
+        ua_value_gf_temp : float [W/K]
+            UA Value of all GroundFloors
+        """
+        ua_value_ow_temp = self.ua_value_rt + self.ua_value_ow
+        ua_value_gf_temp = self.ua_value_gf
+        return ua_value_ow_temp, self.ua_value_win, ua_value_gf_temp
+
+    def get_heat_load_ua_elements(self):
+        """Building elements of the UA values of the static heat load
+
+        Returns the building elements whose UA values make up the values of
+        get_heat_load_ua_values(), e.g. for the derivatives of the heat load
+        (see sensitivity.calc_zone_sensitivities()).
+
+        Returns
+        -------
+        ow_elements : list
+            List of the rooftops and outer walls
+        win_elements : list
+            List of the windows
+        gf_elements : list
+            List of the GroundFloors
+        """
+        zone = self.thermal_zone
+        return (zone.rooftops + zone.outer_walls,
+                zone.windows,
+                zone.ground_floors)
+
+    def calc_sensitivities(self):
+        """Derivatives of the lumped parameters to layer properties
+
+        Calculates the derivatives of R1, C1 and the remaining resistance of
+        each wall type, of R1 of the windows and of the static heat load with
+        respect to thermal_conduc, thickness, heat_capac and density of all
+        layers of the zone, see
+        sensitivity.calc_zone_sensitivities(). Only available for
+        merge_windows=False.
+
+        Returns
+        -------
+        columns : list
+            List of tuples (element, layer index, parameter), one per column
+            of the Jacobian
+        jacobian : collections.OrderedDict
+            Dictionary with numpy arrays with one derivative per column, e.g.
+            for r1_ow, c1_ow, r_rest_ow, r1_win and heat_load
+        """
+        zone = self.thermal_zone
+        return sensitivity.calc_zone_sensitivities(model=self, groups=[
+            ("ow", zone.outer_walls, True),
+            ("gf", zone.ground_floors, True),
+            ("rt", zone.rooftops, True),
+            ("iw", zone.inner_walls + zone.floors + zone.ceilings, False)])
+
     def _calc_heat_load(self):
         """Static heat load calculation
 
@@ -1428,16 +1431,16 @@ class FourElement(object):
             UA Value of all GroundFloors
         """
         self.heat_load = 0.0
-
-        ua_value_ow_temp = self.ua_value_rt + self.ua_value_ow
+        ua_value_ow_temp, ua_value_win, ua_value_gf_temp = \
+            self.get_heat_load_ua_values()
         self.heat_load = \
-            ((((ua_value_ow_temp + self.ua_value_win) +
+            ((((ua_value_ow_temp + ua_value_win) +
                self.thermal_zone.volume *
                self.thermal_zone.use_conditions.infiltration_rate * 1 / 3600 *
                self.thermal_zone.heat_capac_air *
                self.thermal_zone.density_air) * (self.thermal_zone.t_inside -
                                                  self.thermal_zone.t_outside))
-             + (self.ua_value_gf * (self.thermal_zone.t_inside -
+             + (ua_value_gf_temp * (self.thermal_zone.t_inside -
                                     self.thermal_zone.t_ground)))
 
     def set_calc_default(self):
@@ -0,0 +1,158 @@
+# created October 2026
+
+"""Static design heat load of many zones at once.
+
+The static heat load of a zone (see e.g. TwoElement._calc_heat_load()) is a
+linear function of the UA values of the calculated zone model, the
+infiltration and the temperature differences. This module collects these
+inputs of all zones of a list of buildings into arrays once and evaluates
+the heat load for all zones in one vectorized pass, e.g. for sweeps over
+outdoor design temperatures. The zone models and buildings are not changed.
+"""
+
+import collections
+import numpy as np
+
+HEAT_LOAD_INPUTS = (
+    "building_index",
+    "zone_position",
+    "ua_value_ow",
+    "ua_value_win",
+    "ua_value_gf",
+    "volume",
+    "infiltration_rate",
+    "heat_capac_air",
+    "density_air",
+    "t_inside",
+    "t_outside",
+    "t_ground")
+
+
+def collect_heat_load_inputs(buildings):
+    """Collects the heat load inputs of all zones of the buildings.
+
+    Parameters
+    ----------
+    buildings : list
+        List of calculated TEASER instances of Building
+
+    Returns
+    ----------
+    inputs : collections.OrderedDict
+        Dictionary of arrays with one value per zone for the keys of
+        HEAT_LOAD_INPUTS. building_index is the index of the building of the
+        zone in buildings, zone_position the index of the zone in
+        Building.thermal_zones. The number of buildings is stored as
+        nr_of_buildings.
+    """
+
+    values = collections.OrderedDict((key, []) for key in HEAT_LOAD_INPUTS)
+    for building_index, bldg in enumerate(buildings):
+        for zone_position, zone in enumerate(bldg.thermal_zones):
+            model_attr = getattr(zone, "model_attr", None)
+            if model_attr is None:
+                raise ValueError(
+                    "Thermal zone " + str(zone.name) + " of building " +
+                    str(bldg.name) + " is not calculated, call "
+                    "calc_building_parameter() first")
+            ua_value_ow, ua_value_win, ua_value_gf = \
+                model_attr.get_heat_load_ua_values()
+            values["building_index"].append(building_index)
+            values["zone_position"].append(zone_position)
+            values["ua_value_ow"].append(ua_value_ow)
+            values["ua_value_win"].append(ua_value_win)
+            values["ua_value_gf"].append(ua_value_gf)
+            values["volume"].append(zone.volume)
+            values["infiltration_rate"].append(
+                zone.use_conditions.infiltration_rate)
+            values["heat_capac_air"].append(zone.heat_capac_air)
+            values["density_air"].append(zone.density_air)
+            values["t_inside"].append(zone.t_inside)
+            values["t_outside"].append(zone.t_outside)
+            values["t_ground"].append(zone.t_ground)
+
+    inputs = collections.OrderedDict()
+    for key, value in values.items():
+        if key in ("building_index", "zone_position"):
+            inputs[key] = np.array(value, dtype=int)
+        else:
+            inputs[key] = np.array(value, dtype=float)
+    inputs["nr_of_buildings"] = len(buildings)
+    return inputs
+
+
+def _per_zone(value, building_index):
+    """Maps a scalar or per building value to the zones.
+
+    Values with more than one dimension are broadcast, the last axis is the
+    building axis.
+    """
+    value = np.asarray(value, dtype=float)
+    if value.ndim == 0:
+        return value
+    return value[..., building_index]
+
+
+def calc_heat_loads(inputs, t_outside=None, infiltration_rate=None):
+    """Calculates the static heat load of all zones and buildings.
+
+    The heat load is calculated with the same equation and order of
+    operations as in _calc_heat_load() of the zone models, thus without
+    overrides the results are equal to model_attr.heat_load.
+
+    Parameters
+    ----------
+    inputs : collections.OrderedDict
+        Inputs of all zones returned by collect_heat_load_inputs()
+    t_outside : float or array
+        Outdoor design temperature in K overriding ThermalZone.t_outside.
+        Either one value for all buildings or an array with one value per
+        building, optionally with leading axes (e.g. shape (n, buildings)
+        for n design temperatures per building). Default is None, which
+        uses the values of the zones
+    infiltration_rate : float or array
+        Infiltration rate in 1/h overriding the values of the use
+        conditions, given like t_outside. Default is None, which uses the
+        values of the zones
+
+    Returns
+    ----------
+    building_heat_load : np.array
+        Heat load in W of each building, summed up in the order of the
+        zones, with the leading axes of the overrides
+    zone_heat_load : np.array
+        Heat load in W of each zone in the order of inputs
+    """
+
+    building_index = inputs["building_index"]
+
+    if t_outside is None:
+        t_outside = inputs["t_outside"]
+    else:
+        t_outside = _per_zone(t_outside, building_index)
+    if infiltration_rate is None:
+        infiltration_rate = inputs["infiltration_rate"]
+    else:
+        infiltration_rate = _per_zone(infiltration_rate, building_index)
+
+    zone_heat_load = \
+        ((((inputs["ua_value_ow"] + inputs["ua_value_win"]) +
+           inputs["volume"] *
+           infiltration_rate * 1 / 3600 *
+           inputs["heat_capac_air"] *
+           inputs["density_air"]) * (inputs["t_inside"] - t_outside))
+         + (inputs["ua_value_gf"] * (inputs["t_inside"] -
+                                     inputs["t_ground"])))
+
+    # sum up the zones of each building one after another, like
+    # Building.calc_building_parameter()
+    building_heat_load = np.zeros(
+        zone_heat_load.shape[:-1] + (inputs["nr_of_buildings"],))
+    zone_position = inputs["zone_position"]
+    for position in range(
+            zone_position.max() + 1 if zone_position.size else 0):
+        mask = zone_position == position
+        building_heat_load[..., building_index[mask]] += \
+            zone_heat_load[..., mask]
+
+    return building_heat_load, zone_heat_load
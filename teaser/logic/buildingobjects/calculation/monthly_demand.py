@@ -0,0 +1,272 @@
+# created October 2026
+
+"""Monthly quasi-steady state heating demand of many zones at once.
+
+Estimates the heating demand of each month with the monthly balance method
+of ISO 13790 / DIN V 18599: the heat losses by transmission and
+ventilation at the mean outdoor temperature of the month are reduced by
+the internal and solar gains, weighted with a utilization factor that
+depends on the ratio of gains to losses and on the time constant of the
+zone. The inputs of all zones are taken from the calculated zone models
+(UA values as in heat_load.py and the capacities C1 for the time
+constant), the thermal zones (volume, ground temperature) and the use
+conditions (infiltration, set points and internal gains of persons,
+machines and lighting with their profiles). Solar gains through the
+windows are calculated from the irradiation on the facades of the zone
+models (see simulation.solar), solar gains on opaque elements are
+neglected. The inputs are collected once and the balance is evaluated for
+all zones and months in one vectorized pass. The zone models and
+buildings are not changed.
+"""
+
+import collections
+import numpy as np
+import teaser.data.input.weather_input as weather_input
+import teaser.logic.simulation.solar as solar
+
+DAYS_PER_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+A_H0 = 1.0
+"""Numerical parameter a_0 of the utilization factor (ISO 13790)"""
+
+TAU_H0 = 15.0
+"""Reference time constant tau_0 in h of the utilization factor"""
+
+MONTHLY_INPUTS = (
+    "building_index",
+    "zone_position",
+    "ua_value_ow",
+    "ua_value_win",
+    "ua_value_gf",
+    "volume",
+    "infiltration_rate",
+    "heat_capac_air",
+    "density_air",
+    "t_ground",
+    "capacity",
+    "with_heating")
+
+
+def _monthly_mean(values, month):
+    """Mean of hourly values (last axis) for each month."""
+    return np.stack([
+        values[..., month == count].mean(axis=-1) for count in range(12)])
+
+
+def collect_monthly_inputs(buildings, weather_file_path, time_zone=None):
+    """Collects the inputs of the monthly balance of all zones.
+
+    Parameters
+    ----------
+    buildings : list
+        List of calculated TEASER instances of Building
+    weather_file_path : str
+        Path to the weather file in Modelica .mos format with hourly values
+        of one year (8760 rows)
+    time_zone : float
+        Time zone of the weather data in h, default is None, which uses the
+        time zone of the weather file
+
+    Returns
+    ----------
+    inputs : collections.OrderedDict
+        Dictionary of arrays with one value per zone for the keys of
+        MONTHLY_INPUTS (building_index and zone_position as in
+        heat_load.collect_heat_load_inputs(), capacity is the sum of C1 of
+        all wall types in J/K), arrays of shape (12, number of zones) with
+        the mean heating set point in K (t_set), internal gains in W
+        (internal_gains) and solar gains in W (solar_gains) of each month,
+        the hours (hours) and mean outdoor temperature in K (t_outside) of
+        each month and the number of buildings (nr_of_buildings)
+    """
+
+    weather = weather_input.load_weather(weather_file_path)
+    nr_of_hours = len(weather["time"])
+    if nr_of_hours != sum(DAYS_PER_MONTH) * 24:
+        raise ValueError(
+            "The monthly balance needs hourly weather data of one year, "
+            "weather file " + str(weather_file_path) + " has " +
+            str(nr_of_hours) + " rows")
+    month = np.repeat(np.arange(12), np.array(DAYS_PER_MONTH) * 24)
+
+    zones = [(building_index, zone_position, zone)
+             for building_index, bldg in enumerate(buildings)
+             for zone_position, zone in enumerate(bldg.thermal_zones)]
+    for building_index, zone_position, zone in zones:
+        if getattr(zone, "model_attr", None) is None:
+            raise ValueError(
+                "Thermal zone " + str(zone.name) + " of building " +
+                str(buildings[building_index].name) + " is not calculated, "
+                "call calc_building_parameter() first")
+
+    # profiles are shared by many zones, their monthly means are calculated
+    # once per distinct profile
+    profile_means = {}
+
+    def _profile_mean(profile):
+        key = tuple(profile)
+        if key not in profile_means:
+            profile_means[key] = _monthly_mean(
+                np.resize(np.asarray(profile, dtype=float), nr_of_hours),
+                month)
+        return profile_means[key]
+
+    values = collections.OrderedDict((key, []) for key in MONTHLY_INPUTS)
+    t_set = np.empty((12, len(zones)))
+    internal_gains = np.empty((12, len(zones)))
+    for count, (building_index, zone_position, zone) in enumerate(zones):
+        model = zone.model_attr
+        use_conditions = zone.use_conditions
+        ua_value_ow, ua_value_win, ua_value_gf = \
+            model.get_heat_load_ua_values()
+        values["building_index"].append(building_index)
+        values["zone_position"].append(zone_position)
+        values["ua_value_ow"].append(ua_value_ow)
+        values["ua_value_win"].append(ua_value_win)
+        values["ua_value_gf"].append(ua_value_gf)
+        values["volume"].append(zone.volume)
+        values["infiltration_rate"].append(use_conditions.infiltration_rate)
+        values["heat_capac_air"].append(zone.heat_capac_air)
+        values["density_air"].append(zone.density_air)
+        values["t_ground"].append(zone.t_ground)
+        values["capacity"].append(sum(
+            getattr(model, "c1_" + suffix, 0.0)
+            for suffix in ("ow", "iw", "gf", "rt")))
+        values["with_heating"].append(use_conditions.with_heating)
+        t_set[:, count] = _profile_mean(use_conditions.heating_profile)
+        internal_gains[:, count] = (
+            use_conditions.persons * zone.area *
+            use_conditions.fixed_heat_flow_rate_persons *
+            _profile_mean(use_conditions.persons_profile) +
+            use_conditions.machines * zone.area *
+            _profile_mean(use_conditions.machines_profile) +
+            use_conditions.lighting_power * zone.area *
+            _profile_mean(use_conditions.lighting_profile))
+
+    irradiation, zone_index = solar.calc_zone_irradiation(
+        thermal_zones=[zone for building_index, zone_position, zone in zones],
+        weather_file_path=weather_file_path,
+        time_zone=time_zone)
+    monthly_irradiation = _monthly_mean(irradiation.T, month)
+    windows = [
+        (count, column, zone.model_attr.weighted_g_value * area)
+        for count, (building_index, zone_position, zone) in enumerate(zones)
+        for column, area in zip(
+            zone_index[count], zone.model_attr.transparent_areas)]
+    window_zone, window_column, window_area = np.array(
+        windows, dtype=float).reshape(-1, 3).T
+    solar_gains = np.stack([
+        np.bincount(
+            window_zone.astype(int),
+            weights=monthly_irradiation[count, window_column.astype(int)] *
+            window_area,
+            minlength=len(zones)) for count in range(12)])
+
+    inputs = collections.OrderedDict()
+    for key, value in values.items():
+        if key in ("building_index", "zone_position"):
+            inputs[key] = np.array(value, dtype=int)
+        elif key == "with_heating":
+            inputs[key] = np.array(value, dtype=bool)
+        else:
+            inputs[key] = np.array(value, dtype=float)
+    inputs["t_set"] = t_set
+    inputs["internal_gains"] = internal_gains
+    inputs["solar_gains"] = solar_gains
+    inputs["hours"] = np.array(DAYS_PER_MONTH, dtype=float) * 24
+    inputs["t_outside"] = _monthly_mean(
+        np.asarray(weather["temp_dry_bulb"]), month) + 273.15
+    inputs["nr_of_buildings"] = len(buildings)
+    return inputs
+
+
+def calc_utilization_factor(gain_loss_ratio, time_constant):
+    """Utilization factor of the heat gains (ISO 13790).
+
+    Parameters
+    ----------
+    gain_loss_ratio : np.array
+        Ratio of heat gains to heat losses
+    time_constant : np.array
+        Time constant of the zone in h
+
+    Returns
+    ----------
+    utilization : np.array
+        Utilization factor of the heat gains
+    """
+
+    gamma = np.asarray(gain_loss_ratio, dtype=float)
+    a_h = A_H0 + np.asarray(time_constant, dtype=float) / TAU_H0
+    with np.errstate(all="ignore"):
+        inverse = 1 / gamma
+        # for gamma > 1 numerator and denominator are divided by gamma^(a+1)
+        # to avoid overflows
+        utilization = np.where(
+            gamma > 1,
+            (inverse ** (a_h + 1) - inverse) / (inverse ** (a_h + 1) - 1),
+            (1 - gamma ** a_h) / (1 - gamma ** (a_h + 1)))
+        utilization = np.where(gamma == 1, a_h / (a_h + 1), utilization)
+    return np.where(gamma > 0, utilization, 1.0)
+
+
+def calc_monthly_demands(inputs):
+    """Calculates the monthly heating demand of all zones and buildings.
+
+    Parameters
+    ----------
+    inputs : collections.OrderedDict
+        Inputs of all zones returned by collect_monthly_inputs()
+
+    Returns
+    ----------
+    demands : collections.OrderedDict
+        Dictionary with arrays of shape (12, number of zones) of the heat
+        losses (heat_loss), heat gains (heat_gain) and heating demand
+        (heating_demand) in kWh and the utilization factor of the gains
+        (utilization), the monthly heating demand of the buildings in kWh
+        with shape (12, number of buildings) (building_heating_demand), the
+        annual heating demand of each zone (annual_heating_demand) and
+        building (building_annual_heating_demand) in kWh, and
+        building_index and zone_position of each zone
+    """
+
+    transmission = inputs["ua_value_ow"] + inputs["ua_value_win"]
+    ventilation = (inputs["volume"] * inputs["infiltration_rate"] / 3600 *
+                   inputs["heat_capac_air"] * inputs["density_air"])
+    hours = inputs["hours"][:, None]
+    t_set = inputs["t_set"]
+
+    heat_loss = ((transmission + ventilation) *
+                 (t_set - inputs["t_outside"][:, None]) +
+                 inputs["ua_value_gf"] * (t_set - inputs["t_ground"])) * \
+        hours / 1000
+    heat_gain = (inputs["internal_gains"] + inputs["solar_gains"]) * \
+        hours / 1000
+    time_constant = inputs["capacity"] / 3600 / (
+        transmission + ventilation + inputs["ua_value_gf"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gain_loss_ratio = np.where(
+            heat_loss > 0, heat_gain / heat_loss, np.inf)
+    utilization = calc_utilization_factor(gain_loss_ratio, time_constant)
+    heating_demand = np.where(
+        (heat_loss > 0) & inputs["with_heating"],
+        np.maximum(heat_loss - utilization * heat_gain, 0), 0.0)
+
+    building_heating_demand = np.stack([
+        np.bincount(inputs["building_index"], weights=heating_demand[count],
+                    minlength=inputs["nr_of_buildings"])
+        for count in range(12)])
+
+    demands = collections.OrderedDict()
+    demands["building_index"] = inputs["building_index"]
+    demands["zone_position"] = inputs["zone_position"]
+    demands["heat_loss"] = heat_loss
+    demands["heat_gain"] = heat_gain
+    demands["utilization"] = utilization
+    demands["heating_demand"] = heating_demand
+    demands["annual_heating_demand"] = heating_demand.sum(axis=0)
+    demands["building_heating_demand"] = building_heating_demand
+    demands["building_annual_heating_demand"] = \
+        building_heating_demand.sum(axis=0)
+    return demands
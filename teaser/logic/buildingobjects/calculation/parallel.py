@@ -0,0 +1,258 @@
+# created October 2026
+
+"""Parallel calculation of the buildings of a project.
+
+Buildings are independent from each other, thus they can be calculated in
+worker processes. Each worker gets the project once (inherited on
+platforms that fork, pickled once per worker otherwise) and calculates
+chunks of buildings given by their index. Only compact results (the
+attributes of the zone models, of the library attributes and the
+calculated values of the building elements) are sent back and set to the
+buildings of the main process.
+"""
+
+import math
+import multiprocessing
+import os
+import warnings
+from teaser.logic.buildingobjects.calculation.aixlib import AixLib
+from teaser.logic.buildingobjects.calculation.ibpsa import IBPSA
+import teaser.logic.buildingobjects.calculation.zone_engine as zone_engine
+
+LIBRARY_CLASSES = {"AixLib": AixLib, "IBPSA": IBPSA}
+
+# calculated values of building elements, see BuildingElement
+ELEMENT_RESULTS = (
+    "r1",
+    "r2",
+    "r3",
+    "c1",
+    "c2",
+    "c1_korr",
+    "wf_out",
+    "ua_value",
+    "u_value",
+    "r_conduc",
+    "r_inner_conv",
+    "r_inner_rad",
+    "r_inner_comb",
+    "r_outer_conv",
+    "r_outer_rad",
+    "r_outer_comb")
+
+# errors that mark a building as not calculable, see
+# Project.calc_all_buildings()
+CALC_ERRORS = (ZeroDivisionError, TypeError)
+
+_worker_project = None
+
+
+def _init_worker(project):
+    """Stores the project in the worker process."""
+    global _worker_project
+    _worker_project = project
+
+
+def _calc_chunk(indices, number_of_elements, merge_windows, used_library):
+    """Calculates a chunk of buildings in the worker process.
+
+    Parameters
+    ----------
+    indices : list
+        Indices of the buildings in Project.buildings
+    number_of_elements : int
+        defines the number of elements, that area aggregated, between 1
+        and 4
+    merge_windows : bool
+        True for merging the windows into the outer walls, False for
+        separate resistance for window
+    used_library : str
+        used library (AixLib and IBPSA are supported)
+
+    Returns
+    ----------
+    results : list
+        List of tuples (index, results, error, warnings) for each building,
+        with results of collect_results() or error as the exception raised
+        by the calculation
+    """
+
+    results = []
+    for index in indices:
+        bldg = _worker_project.buildings[index]
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                bldg.calc_building_parameter(
+                    number_of_elements=number_of_elements,
+                    merge_windows=merge_windows,
+                    used_library=used_library,
+                )
+                result, error = collect_results(bldg), None
+            except CALC_ERRORS as err:
+                result, error = None, err
+        results.append((
+            index,
+            result,
+            error,
+            [(str(warn.message), warn.category) for warn in caught]))
+    return results
+
+
+def collect_results(bldg):
+    """Collects the compact results of a calculated building.
+
+    Parameters
+    ----------
+    bldg : Building()
+        calculated TEASER instance of Building
+
+    Returns
+    ----------
+    results : dict
+        Dictionary with the attributes of the building, the library and
+        the zone models that are set by the calculation, together with
+        the calculated values of the building elements of each zone
+    """
+
+    if bldg.library_attr is not None:
+        library_attr = (
+            type(bldg.library_attr).__name__,
+            {key: value for key, value in vars(bldg.library_attr).items()
+             if key != "parent"})
+    else:
+        library_attr = None
+
+    zones = []
+    for zone in bldg.thermal_zones:
+        zones.append((
+            type(zone.model_attr).__name__,
+            {key: value for key, value in vars(zone.model_attr).items()
+             if key != "thermal_zone"},
+            [tuple(getattr(element, attr) for attr in ELEMENT_RESULTS)
+             for element in zone_engine.get_zone_elements(zone)]))
+
+    return {
+        "sum_heat_load": bldg.sum_heat_load,
+        "number_of_elements_calc": bldg._number_of_elements_calc,
+        "merge_windows_calc": bldg._merge_windows_calc,
+        "used_library_calc": bldg._used_library_calc,
+        "library_attr": library_attr,
+        "zones": zones}
+
+
+def apply_results(bldg, results):
+    """Sets the results of collect_results() to a building.
+
+    Parameters
+    ----------
+    bldg : Building()
+        TEASER instance of Building in the main process
+    results : dict
+        Dictionary returned by collect_results() for this building
+    """
+
+    model_classes = {
+        model_class.__name__: model_class
+        for model_class in zone_engine.MODEL_CLASSES.values()}
+
+    bldg.sum_heat_load = results["sum_heat_load"]
+    bldg._number_of_elements_calc = results["number_of_elements_calc"]
+    bldg._merge_windows_calc = results["merge_windows_calc"]
+    bldg._used_library_calc = results["used_library_calc"]
+
+    if results["library_attr"] is not None:
+        class_name, attributes = results["library_attr"]
+        library_attr = LIBRARY_CLASSES[class_name].__new__(
+            LIBRARY_CLASSES[class_name])
+        library_attr.__dict__.update(attributes)
+        library_attr.parent = bldg
+        bldg.library_attr = library_attr
+
+    for zone, (class_name, attributes, element_results) in zip(
+            bldg.thermal_zones, results["zones"]):
+        model_attr = model_classes[class_name].__new__(
+            model_classes[class_name])
+        model_attr.__dict__.update(attributes)
+        model_attr.thermal_zone = zone
+        zone.model_attr = model_attr
+        for element, values in zip(zone_engine.get_zone_elements(zone),
+                                   element_results):
+            for attr, value in zip(ELEMENT_RESULTS, values):
+                setattr(element, attr, value)
+
+
+def calc_buildings(
+        project,
+        processes=None,
+        chunk_size=None,
+        raise_errors=False):
+    """Calculates all buildings of a project in worker processes.
+
+    Parameters
+    ----------
+    project : Project()
+        TEASER instance of Project
+    processes : int
+        Number of worker processes, default is None, which uses the number
+        of CPUs
+    chunk_size : int
+        Number of buildings calculated by a worker per task, default is
+        None, which gives each worker about four chunks
+    raise_errors : bool
+        If True, the first error of a building calculation is raised after
+        all workers are finished, default is False
+
+    Returns
+    ----------
+    failed : list
+        List of tuples (building, error) of all buildings that could not be
+        calculated, in the order of Project.buildings
+    """
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    nr_of_bldgs = len(project.buildings)
+    if chunk_size is None:
+        chunk_size = max(1, int(math.ceil(nr_of_bldgs / (processes * 4))))
+    chunks = [
+        list(range(start, min(start + chunk_size, nr_of_bldgs)))
+        for start in range(0, nr_of_bldgs, chunk_size)]
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+
+    pool = context.Pool(
+        processes=processes,
+        initializer=_init_worker,
+        initargs=(project,))
+    try:
+        async_results = [
+            pool.apply_async(
+                _calc_chunk,
+                (chunk,
+                 project.number_of_elements_calc,
+                 project.merge_windows_calc,
+                 project.used_library_calc))
+            for chunk in chunks]
+        chunk_results = [result.get() for result in async_results]
+    finally:
+        pool.close()
+        pool.join()
+
+    failed = []
+    for results in chunk_results:
+        for index, result, error, caught in results:
+            bldg = project.buildings[index]
+            for message, category in caught:
+                warnings.warn(message, category)
+            if error is not None:
+                failed.append((bldg, error))
+            else:
+                apply_results(bldg, result)
+
+    if raise_errors is True and failed:
+        raise failed[0][1]
+    return failed
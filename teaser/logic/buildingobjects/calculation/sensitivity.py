@@ -0,0 +1,313 @@
+# created October 2026
+
+"""Sensitivities of element and zone parameters to layer properties.
+
+Calculates the derivatives of the equivalent resistances and capacities of
+building elements and of the lumped parameters and heat load of the zone
+models with respect to thermal_conduc, thickness, heat_capac and density
+of each layer. The derivatives are calculated in forward mode with the
+complex step method: each layer property is perturbed by an imaginary step
+and the vectorized kernels of equivalent_res.py are evaluated once for all
+perturbations of all elements, the derivative is the imaginary part of the
+result divided by the step. As no difference of two results is taken, the
+derivatives are exact to machine precision (unlike finite differences).
+The building elements and zone models are not changed.
+"""
+
+import collections
+import math
+import numpy as np
+import teaser.logic.buildingobjects.calculation.equivalent_res as \
+    equivalent_res
+
+PARAMETERS = ("thermal_conduc", "thickness", "heat_capac", "density")
+
+WALL_RESULTS = (
+    "r1",
+    "r2",
+    "r3",
+    "c1",
+    "c2",
+    "c1_korr",
+    "r_conduc",
+    "ua_value")
+
+WINDOW_RESULTS = (
+    "r1",
+    "c1",
+    "r_conduc",
+    "ua_value")
+
+STEP = 1e-30
+
+
+def _sequential_sum(values):
+    """Sums up the last axis one entry after another, like sum()."""
+    total = 0
+    for count in range(values.shape[-1]):
+        total = total + values[..., count]
+    return total
+
+
+def _calc_complex_values(elements, t_bt=7):
+    """Element values for a complex step of each layer property.
+
+    Parameters
+    ----------
+    elements : list
+        List of TEASER Wall instances or of TEASER Window instances
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+
+    Returns
+    ----------
+    owner : np.array
+        Index of the perturbed element of each step
+    layer : np.array
+        Index of the perturbed layer of each step
+    parameter : np.array
+        Index of the perturbed property in PARAMETERS of each step
+    values : dict
+        Dictionary with complex numpy arrays with one value per step for
+        the keys of WALL_RESULTS or WINDOW_RESULTS
+    """
+
+    nr_of_layer, density, thermal_conduc, heat_capac, thickness = \
+        equivalent_res.gather_layer_properties(elements)
+    properties = {
+        "thermal_conduc": thermal_conduc,
+        "thickness": thickness,
+        "heat_capac": heat_capac,
+        "density": density}
+
+    owner, layer, parameter = np.array([
+        (i, j, k) for i, count_layer in enumerate(nr_of_layer)
+        for j in range(count_layer)
+        for k in range(len(PARAMETERS))], dtype=int).reshape(-1, 3).T
+
+    perturbed = {}
+    for k, key in enumerate(PARAMETERS):
+        perturbed[key] = properties[key][owner].astype(complex)
+        steps = np.flatnonzero(parameter == k)
+        perturbed[key][steps, layer[steps]] += 1j * STEP
+
+    area = np.array([float(element.area) for element in elements])[owner]
+    count_layer = nr_of_layer[owner]
+    active = np.arange(thickness.shape[1]) < count_layer[:, None]
+    r_layer = perturbed["thickness"] / np.where(
+        active, perturbed["thermal_conduc"], 1.0)
+
+    values = {}
+    r_conduc = 0.0
+    for count in range(thickness.shape[1]):
+        r_conduc = r_conduc + np.where(active[:, count], r_layer[:, count], 0)
+    values["r_conduc"] = r_conduc * (1 / area)
+
+    # see BuildingElement.calc_ua_value()
+    r_comb = np.zeros(len(elements))
+    for i, element in enumerate(elements):
+        r_inner_conv = (1 / element.inner_convection) * (1 / element.area)
+        r_inner_rad = (1 / element.inner_radiation) * (1 / element.area)
+        r_comb[i] = 1 / (1 / r_inner_conv + 1 / r_inner_rad)
+        if element.outer_convection is not None \
+                and element.outer_radiation is not None:
+            r_outer_conv = (1 / element.outer_convection) * (
+                1 / element.area)
+            r_outer_rad = (1 / element.outer_radiation) * (1 / element.area)
+            r_comb[i] += 1 / (1 / r_outer_conv + 1 / r_outer_rad)
+    values["ua_value"] = 1 / (r_comb[owner] + values["r_conduc"])
+
+    if type(elements[0]).__name__ == "Window":
+        # see Window.calc_equivalent_res()
+        c_layer = perturbed["heat_capac"] * perturbed["density"] * \
+            perturbed["thickness"]
+        r1 = 0.0
+        c1 = 0.0
+        for count in range(thickness.shape[1]):
+            r1 = r1 + np.where(
+                active[:, count], r_layer[:, count] / area, 0)
+            c1 = c1 + np.where(active[:, count], c_layer[:, count], 0)
+        values["r1"] = r1
+        values["c1"] = c1
+        return owner, layer, parameter, values
+
+    transfer_mat, r_sum = equivalent_res.calc_transfer_matrices(
+        nr_of_layer=count_layer,
+        density=perturbed["density"],
+        thermal_conduc=perturbed["thermal_conduc"],
+        heat_capac=perturbed["heat_capac"],
+        thickness=perturbed["thickness"],
+        t_bt=t_bt)
+    (values["r1"], values["r2"], values["r3"], values["c1"], values["c2"],
+     values["c1_korr"]) = equivalent_res.scale_equivalent_res(
+        transfer_mat=transfer_mat,
+        r_sum=r_sum,
+        area=area,
+        t_bt=t_bt)
+    # see Wall.set_equivalent_res()
+    outer = np.array([type(element).__name__ in (
+        "OuterWall", "Rooftop", "GroundFloor") for element in elements])
+    values["c1"] = np.where(outer[owner], values["c1_korr"], values["c1"])
+    return owner, layer, parameter, values
+
+
+def calc_element_sensitivities(elements, t_bt=7):
+    """Derivatives of the values of building elements to layer properties.
+
+    Parameters
+    ----------
+    elements : list
+        List of TEASER Wall and Window instances
+    t_bt : int
+        Time constant according to VDI 6007 of the equivalent resistances
+        of walls (default t_bt = 7)
+
+    Returns
+    ----------
+    sensitivities : list
+        List with one collections.OrderedDict per element, with numpy arrays
+        of shape (number of layer, len(PARAMETERS)) for the keys of
+        WALL_RESULTS or WINDOW_RESULTS. Entry [j, k] is the derivative of the
+        value with respect to the property PARAMETERS[k] of layer j. Values
+        of walls are the ones of Wall.calc_equivalent_res(t_bt) and
+        BuildingElement.calc_ua_value(), with c1 of OuterWalls, Rooftops and
+        GroundFloors being c1_korr
+    """
+
+    sensitivities = [None] * len(elements)
+    walls = [i for i, element in enumerate(elements)
+             if type(element).__name__ != "Window"]
+    windows = [i for i, element in enumerate(elements)
+               if type(element).__name__ == "Window"]
+
+    for index, results in ((walls, WALL_RESULTS), (windows, WINDOW_RESULTS)):
+        if not index:
+            continue
+        owner, layer, parameter, values = _calc_complex_values(
+            [elements[i] for i in index], t_bt=t_bt)
+        for position, i in enumerate(index):
+            steps = owner == position
+            sensitivity = collections.OrderedDict()
+            for key in results:
+                derivative = np.zeros(
+                    (len(elements[i].layer), len(PARAMETERS)))
+                derivative[layer[steps], parameter[steps]] = \
+                    values[key][steps].imag / STEP
+                sensitivity[key] = derivative
+            sensitivities[i] = sensitivity
+
+    return sensitivities
+
+
+def calc_zone_sensitivities(model, groups, t_bt=7):
+    """Derivatives of the lumped zone parameters to layer properties.
+
+    Evaluates the lumping of the element values of a zone model (parallel
+    connection of R1 and C1, remaining resistance r_rest, resistance of the
+    windows and static heat load) for the complex steps of all layer
+    properties of all building elements of the zone at once. The element
+    values are calculated anew, thus the derivatives belong to the current
+    layer properties. The UA values of the heat load are grouped like the
+    ones of model.get_heat_load_ua_values(), see
+    model.get_heat_load_ua_elements().
+
+    Parameters
+    ----------
+    model : OneElement(), TwoElement(), ThreeElement() or FourElement()
+        Calculated zone model with merge_windows=False
+    groups : list
+        List of tuples (suffix, elements, with_r_rest) of the wall groups of
+        the model, e.g. ("ow", outer_walls + rooftops, True) for r1_ow,
+        c1_ow and r_rest_ow of ThreeElement. If with_r_rest is False,
+        r_rest is not calculated for this group
+    t_bt : int
+        Time constant according to VDI 6007 of the equivalent resistances
+        of walls (default t_bt = 7)
+
+    Returns
+    ----------
+    columns : list
+        List of tuples (element, layer index, parameter), one per column of
+        the Jacobian, for all layers of the outer walls, rooftops, ground
+        floors, inner walls, floors, ceilings and windows of the zone
+    jacobian : collections.OrderedDict
+        Dictionary with numpy arrays with one derivative per column for
+        r1_<suffix>, c1_<suffix> and r_rest_<suffix> of each group, r1_win
+        and heat_load
+    """
+
+    if model.merge_windows is True:
+        raise ValueError(
+            "Sensitivities are only available for merge_windows=False")
+
+    zone = model.thermal_zone
+    omega = 2 * math.pi / 86400 / model.t_bt
+    walls = (zone.outer_walls + zone.rooftops + zone.ground_floors +
+             zone.inner_walls + zone.floors + zone.ceilings)
+
+    columns = []
+    step_values = []
+    locations = {}
+    for elements in (walls, zone.windows):
+        if not elements:
+            continue
+        owner, layer, parameter, values = _calc_complex_values(
+            elements, t_bt=t_bt)
+        offset = len(columns)
+        columns += [
+            (elements[i], j, PARAMETERS[k])
+            for i, j, k in zip(owner, layer, parameter)]
+        # the steps of each element are consecutive
+        bounds = np.searchsorted(owner, np.arange(len(elements) + 1))
+        for i, element in enumerate(elements):
+            locations[id(element)] = (
+                len(step_values), np.arange(bounds[i], bounds[i + 1]))
+        step_values.append((offset, values))
+    nr_of_columns = len(columns)
+
+    def _group_values(elements, key):
+        """Element values of a group with one row per column."""
+        group = np.empty((nr_of_columns, len(elements)), dtype=complex)
+        for position, element in enumerate(elements):
+            group[:, position] = getattr(element, key)
+            block, steps = locations[id(element)]
+            offset, values = step_values[block]
+            group[offset + steps, position] = values[key][steps]
+        return group
+
+    jacobian = collections.OrderedDict()
+    for suffix, elements, with_r_rest in groups:
+        if not elements:
+            continue
+        r1_group, c1_group = equivalent_res.calc_wall_type(
+            r1=_group_values(elements, "r1"),
+            c1=_group_values(elements, "c1"),
+            c1_korr=_group_values(elements, "c1_korr"),
+            omega=omega)
+        jacobian["r1_" + suffix] = r1_group.imag / STEP
+        jacobian["c1_" + suffix] = c1_group.imag / STEP
+        if with_r_rest is True:
+            r_rest = equivalent_res.calc_r_rest(
+                r_conduc=_group_values(elements, "r_conduc"), r1=r1_group)
+            jacobian["r_rest_" + suffix] = r_rest.imag / STEP
+
+    if zone.windows:
+        r1_win = 1 / _sequential_sum(1 / _group_values(zone.windows, "r1"))
+        jacobian["r1_win"] = r1_win.imag / STEP
+
+    # the heat load is linear in the UA values, see _calc_heat_load()
+    ua_value_ow, ua_value_win, ua_value_gf = [
+        _sequential_sum(_group_values(elements, "ua_value"))
+        if elements else 0
+        for elements in model.get_heat_load_ua_elements()]
+    heat_load = \
+        ((((ua_value_ow + ua_value_win) +
+           zone.volume *
+           zone.use_conditions.infiltration_rate * 1 / 3600 *
+           zone.heat_capac_air *
+           zone.density_air) * (zone.t_inside - zone.t_outside))
+         + (ua_value_gf * (zone.t_inside - zone.t_ground)))
+    jacobian["heat_load"] = np.imag(heat_load) / STEP * np.ones(
+        nr_of_columns)
+
+    return columns, jacobian
@@ -4,6 +4,9 @@ from __future__ import division
 import math
 import random
 import warnings
+import teaser.logic.buildingobjects.calculation.equivalent_res as \
+    equivalent_res
+import teaser.logic.buildingobjects.calculation.sensitivity as sensitivity
 
 
 class TwoElement(object):
@@ -381,25 +384,25 @@ class TwoElement(object):
         self.heat_load = 0.0
         self.cool_load = 0.0
 
-    def calc_attributes(self):
-        """Calls all necessary function to calculate model attributes"""
+    def calc_attributes(self, calc_elements=True):
+        """Calls all necessary function to calculate model attributes
+
+        Parameters
+        ----------
+        calc_elements : bool
+            If True (default), the equivalent resistances and U*A values of
+            all building elements of the thermal zone are calculated first.
+            Set to False if they are already calculated (see
+            equivalent_res.calc_element_values()).
+        """
+
+        if calc_elements is True:
+            equivalent_res.calc_element_values(self.thermal_zone)
 
         outer_walls = (self.thermal_zone.outer_walls +
                        self.thermal_zone.ground_floors +
                        self.thermal_zone.rooftops)
 
-        for out_wall in outer_walls:
-            out_wall.calc_equivalent_res()
-            out_wall.calc_ua_value()
-        for win in self.thermal_zone.windows:
-            win.calc_equivalent_res()
-            win.calc_ua_value()
-        for inner_wall in (self.thermal_zone.inner_walls +
-                           self.thermal_zone.floors +
-                           self.thermal_zone.ceilings):
-            inner_wall.calc_equivalent_res()
-            inner_wall.calc_ua_value()
-
         self.set_calc_default()
         if len(outer_walls) < 1:
             warnings.warn("No walls are defined as outer walls for thermal "
@@ -456,63 +459,10 @@ class TwoElement(object):
             VDI 6007 capacity all for inner or outer walls
         """
 
-        for wall_count in range(len(element_list) - 1):
-
-            if wall_count == 0:
-
-                r1 = (element_list[wall_count].r1 *
-                      element_list[wall_count].c1 ** 2 +
-                      element_list[wall_count + 1].r1 *
-                      element_list[wall_count + 1].c1 ** 2 + omega ** 2 *
-                      element_list[wall_count].r1 *
-                      element_list[wall_count + 1].r1 *
-                      (element_list[wall_count].r1 +
-                       element_list[wall_count + 1].r1) *
-                      element_list[wall_count].c1 ** 2 *
-                      element_list[wall_count + 1].c1 ** 2) / \
-                     ((element_list[wall_count].c1 +
-                       element_list[wall_count + 1].c1) ** 2 + omega ** 2 *
-                      (element_list[wall_count].r1 +
-                       element_list[wall_count + 1].r1) ** 2 *
-                      element_list[wall_count].c1 ** 2 *
-                      element_list[wall_count + 1].c1 ** 2)
-
-                c1 = ((element_list[wall_count].c1 +
-                       element_list[wall_count + 1].c1) ** 2 + omega ** 2 *
-                      (element_list[wall_count].r1 +
-                       element_list[wall_count + 1].r1) ** 2 *
-                      element_list[wall_count].c1 ** 2 *
-                      element_list[wall_count + 1].c1 ** 2) / \
-                     (element_list[wall_count].c1 +
-                      element_list[wall_count + 1].c1 + omega ** 2 *
-                      (element_list[wall_count].r1 ** 2 *
-                       element_list[wall_count].c1 +
-                       element_list[wall_count + 1].r1 ** 2 *
-                       element_list[wall_count + 1].c1) *
-                      element_list[wall_count].c1 *
-                      element_list[wall_count + 1].c1)
-            else:
-                r1x = r1
-                c1x = c1
-                r1 = (r1x * c1x ** 2 + element_list[wall_count + 1].r1 *
-                      element_list[wall_count + 1].c1 ** 2 +
-                      omega ** 2 * r1x * element_list[wall_count + 1].r1 *
-                      (r1x + element_list[wall_count + 1].r1) *
-                      c1x ** 2 * element_list[wall_count + 1].c1 ** 2) / \
-                     ((c1x + element_list[wall_count + 1].c1) ** 2 +
-                      omega ** 2 * (
-                          r1x + element_list[wall_count + 1].r1) ** 2 *
-                      c1x ** 2 * element_list[wall_count + 1].c1 ** 2)
-
-                c1 = ((c1x + element_list[
-                    wall_count + 1].c1) ** 2 + omega ** 2 *
-                    (r1x + element_list[wall_count + 1].r1) ** 2 * c1x ** 2 *
-                    element_list[wall_count + 1].c1 ** 2) / \
-                    (c1x + element_list[wall_count + 1].c1 + omega ** 2 *
-                     (r1x ** 2 * c1x + element_list[wall_count + 1].r1 **
-                      2 * element_list[wall_count + 1].c1) * c1x *
-                     element_list[wall_count + 1].c1)
-        return r1, c1
+        return equivalent_res.calc_parallel_connection(
+            r1=[element.r1 for element in element_list],
+            c1=[element.c1 for element in element_list],
+            omega=omega)
 
     def _sum_outer_wall_elements(self):
         """Sum attributes for outer wall elements
@@ -763,8 +713,9 @@ class TwoElement(object):
                                     * win.area for win in
                                     self.thermal_zone.windows) / self.area_win
 
-        self.weighted_g_value = sum(win.g_value * win.area for win in
-                                    self.thermal_zone.windows) / self.area_win
+        self.weighted_g_value = equivalent_res.calc_weighted_g_value(
+            g_value=[win.g_value for win in self.thermal_zone.windows],
+            area=[win.area for win in self.thermal_zone.windows])
 
         self.alpha_conv_outer_win = (
             1 / (self.r_conv_outer_win * self.area_win))
@@ -794,14 +745,12 @@ class TwoElement(object):
                        self.thermal_zone.ground_floors +
                        self.thermal_zone.rooftops)
 
-        if 0 < len(outer_walls) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_ow = outer_walls[0].r1
-            self.c1_ow = outer_walls[0].c1_korr
-        elif len(outer_walls) > 1:
-            # more than one outer wall, calculate chain matrix
-            self.r1_ow, self.c1_ow = self._calc_parallel_connection(outer_walls,
-                                                                    omega)
+        if len(outer_walls) > 0:
+            self.r1_ow, self.c1_ow = equivalent_res.calc_wall_type(
+                r1=[wall.r1 for wall in outer_walls],
+                c1=[wall.c1 for wall in outer_walls],
+                c1_korr=[wall.c1_korr for wall in outer_walls],
+                omega=omega)
 
         if self.merge_windows is False:
             try:
@@ -810,10 +759,9 @@ class TwoElement(object):
                     self.r1_win = (1 / sum((1 / win.r1) for win in
                                            self.thermal_zone.windows))
                 if len(self.thermal_zone.outer_walls) > 0:
-                    conduction = (1 / sum((1 / element.r_conduc) for element in
-                                          outer_walls))
-
-                    self.r_rest_ow = (conduction - self.r1_ow)
+                    self.r_rest_ow = equivalent_res.calc_r_rest(
+                        r_conduc=[wall.r_conduc for wall in outer_walls],
+                        r1=self.r1_ow)
 
             except RuntimeError:
                 print("As no outer walls or no windows are defined lumped "
@@ -880,19 +828,16 @@ class TwoElement(object):
                        self.thermal_zone.floors +
                        self.thermal_zone.ceilings)
 
+        equivalent_res.calc_equivalent_res(inner_walls)
         for in_wall in inner_walls:
-            in_wall.calc_equivalent_res()
             in_wall.calc_ua_value()
 
-        if 0 < len(inner_walls) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_iw = inner_walls[0].r1
-            self.c1_iw = inner_walls[0].c1_korr
-        elif len(inner_walls) > 1:
-            # more than one outer wall, calculate chain matrix
-            self.r1_iw, self.c1_iw = self._calc_parallel_connection(
-                inner_walls,
-                omega)
+        if len(inner_walls) > 0:
+            self.r1_iw, self.c1_iw = equivalent_res.calc_wall_type(
+                r1=[wall.r1 for wall in inner_walls],
+                c1=[wall.c1 for wall in inner_walls],
+                c1_korr=[wall.c1_korr for wall in inner_walls],
+                omega=omega)
 
     def _calc_wf(self):
         """Weightfactors for outer elements(walls, roof, ground floor, windows)
@@ -1039,14 +984,80 @@ class TwoElement(object):
 
                 if self.merge_windows is False:
                     self.window_areas.append(
-                        sum([win.area for win in wins]))
+                        self.thermal_zone.get_window_area(i[0], i[1]))
                     self.transparent_areas.append(
-                        sum([win.area for win in wins]))
+                        self.thermal_zone.get_window_area(i[0], i[1]))
 
                 else:
                     self.window_areas.append(0)
                     self.transparent_areas.append(
-                        sum([win.area for win in wins]))
+                        self.thermal_zone.get_window_area(i[0], i[1]))
+
+    def get_heat_load_ua_values(self):
+        """UA values of the static heat load calculation
+
+        Returns the UA values used by _calc_heat_load(), e.g. to calculate
+        the heat load of many zones at once (see heat_load.py).
+
+        Returns
+        -------
+        ua_value_ow_temp : float [W/K]
+            UA Value of the outer walls without GroundFloors
+        ua_value_win : float [W/K]
+            UA Value of the windows
+        ua_value_gf_temp : float [W/K]
+            UA Value of all GroundFloors
+        """
+        ua_value_gf_temp = sum(
+            ground.ua_value for ground in self.thermal_zone.ground_floors)
+        ua_value_ow_temp = self.ua_value_ow - ua_value_gf_temp
+        return ua_value_ow_temp, self.ua_value_win, ua_value_gf_temp
+
+    def get_heat_load_ua_elements(self):
+        """Building elements of the UA values of the static heat load
+
+        Returns the building elements whose UA values make up the values of
+        get_heat_load_ua_values(), e.g. for the derivatives of the heat load
+        (see sensitivity.calc_zone_sensitivities()).
+
+        Returns
+        -------
+        ow_elements : list
+            List of the outer walls and rooftops
+        win_elements : list
+            List of the windows
+        gf_elements : list
+            List of the GroundFloors
+        """
+        zone = self.thermal_zone
+        return (zone.outer_walls + zone.rooftops,
+                zone.windows,
+                zone.ground_floors)
+
+    def calc_sensitivities(self):
+        """Derivatives of the lumped parameters to layer properties
+
+        Calculates the derivatives of R1, C1 and the remaining resistance of
+        each wall type, of R1 of the windows and of the static heat load with
+        respect to thermal_conduc, thickness, heat_capac and density of all
+        layers of the zone, see
+        sensitivity.calc_zone_sensitivities(). Only available for
+        merge_windows=False.
+
+        Returns
+        -------
+        columns : list
+            List of tuples (element, layer index, parameter), one per column
+            of the Jacobian
+        jacobian : collections.OrderedDict
+            Dictionary with numpy arrays with one derivative per column, e.g.
+            for r1_ow, c1_ow, r_rest_ow, r1_win and heat_load
+        """
+        zone = self.thermal_zone
+        return sensitivity.calc_zone_sensitivities(model=self, groups=[
+            ("ow", zone.outer_walls + zone.ground_floors + zone.rooftops,
+             len(zone.outer_walls) > 0),
+            ("iw", zone.inner_walls + zone.floors + zone.ceilings, False)])
 
     def _calc_heat_load(self):
         """Static heat load calculation
@@ -1064,11 +1075,10 @@ class TwoElement(object):
             UA Value of all GroundFloors
         """
         self.heat_load = 0.0
-        ua_value_gf_temp = sum(
-            ground.ua_value for ground in self.thermal_zone.ground_floors)
-        ua_value_ow_temp = self.ua_value_ow - ua_value_gf_temp
+        ua_value_ow_temp, ua_value_win, ua_value_gf_temp = \
+            self.get_heat_load_ua_values()
         self.heat_load = \
-            ((((ua_value_ow_temp + self.ua_value_win) +
+            ((((ua_value_ow_temp + ua_value_win) +
                self.thermal_zone.volume *
                self.thermal_zone.use_conditions.infiltration_rate * 1 / 3600 *
                self.thermal_zone.heat_capac_air *
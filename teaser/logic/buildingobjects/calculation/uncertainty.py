@@ -0,0 +1,442 @@
+# created October 2026
+
+"""Monte Carlo sampling of zone parameters over uncertain inputs.
+
+Draws samples of the layer properties (thermal_conduc, density, heat_capac
+and thickness of all layers), the g_value of windows and the infiltration
+rate of zones and calculates the resulting zone parameters of the
+TwoElement model (merge_windows=False) and the static heat loads for all
+samples at once. The building elements of a zone are calculated for all
+samples in one call of the vectorized kernels of equivalent_res.py and
+heat_load.py. The object model is neither copied nor changed.
+
+Distributions are given as relative factors on the nominal values of the
+object model, e.g. {"thermal_conduc": ("normal", 1.0, 0.1)} samples the
+thermal conductivity of all layers with a standard deviation of 10 %.
+"""
+
+import collections
+import math
+import numpy as np
+import teaser.logic.buildingobjects.calculation.equivalent_res as \
+    equivalent_res
+import teaser.logic.buildingobjects.calculation.heat_load as heat_load
+
+PARAMETERS = (
+    "thermal_conduc",
+    "density",
+    "heat_capac",
+    "thickness",
+    "g_value",
+    "infiltration_rate")
+
+LAYER_PARAMETERS = (
+    "thermal_conduc",
+    "density",
+    "heat_capac",
+    "thickness")
+
+ZONE_RESULTS = (
+    "r1_ow",
+    "c1_ow",
+    "r_rest_ow",
+    "r_total_ow",
+    "ua_value_ow",
+    "r1_iw",
+    "c1_iw",
+    "r1_win",
+    "ua_value_win",
+    "weighted_g_value",
+    "heat_load")
+
+
+def draw_factors(distribution, size, rng):
+    """Draws relative factors of one distribution.
+
+    Parameters
+    ----------
+    distribution : tuple or function
+        Either a tuple of the name and parameters of the distribution,
+        ("normal", mean, std), ("lognormal", mean, sigma), ("uniform",
+        low, high) or ("triangular", left, mode, right), or a function
+        returning an array of the given size for (rng, size)
+    size : int or tuple
+        Shape of the returned array
+    rng : np.random.RandomState
+        Random number generator
+
+    Returns
+    ----------
+    factors : np.array
+        Numpy array of the given shape with the drawn factors
+    """
+
+    if callable(distribution):
+        return np.broadcast_to(
+            np.asarray(distribution(rng, size), dtype=float), size)
+
+    name = distribution[0]
+    params = distribution[1:]
+    if name == "normal":
+        return rng.normal(params[0], params[1], size)
+    elif name == "lognormal":
+        return rng.lognormal(params[0], params[1], size)
+    elif name == "uniform":
+        return rng.uniform(params[0], params[1], size)
+    elif name == "triangular":
+        return rng.triangular(params[0], params[1], params[2], size)
+    else:
+        raise ValueError("Distribution " + str(name) + " is not supported")
+
+
+def _sequential_sum(values):
+    """Sums up the last axis one entry after another, like sum()."""
+    total = 0
+    for count in range(values.shape[-1]):
+        total = total + values[..., count]
+    return total
+
+
+def _element_groups(thermal_zone):
+    """Groups of building elements of a zone as in the TwoElement model."""
+    return (
+        ("outer_walls", thermal_zone.outer_walls +
+         thermal_zone.ground_floors + thermal_zone.rooftops),
+        ("inner_walls", thermal_zone.inner_walls + thermal_zone.floors +
+         thermal_zone.ceilings),
+        ("windows", thermal_zone.windows))
+
+
+def _calc_element_samples(elements, factors):
+    """Calculates the values of building elements for all samples.
+
+    Parameters
+    ----------
+    elements : list
+        List of TEASER Wall or Window instances
+    factors : dict
+        Factors of the layer properties with shape (samples, 1, 1) for
+        factors shared by all layers or (samples, elements, layers)
+
+    Returns
+    ----------
+    values : dict
+        Dictionary with numpy arrays of shape (samples, elements) for r1,
+        c1, c1_korr, r_conduc and ua_value, calculated as in
+        Wall.calc_equivalent_res(), Window.calc_equivalent_res() and
+        BuildingElement.calc_ua_value()
+    """
+
+    nr_of_layer, density, thermal_conduc, heat_capac, thickness = \
+        equivalent_res.gather_layer_properties(elements)
+    thermal_conduc = thermal_conduc * factors["thermal_conduc"]
+    density = density * factors["density"]
+    heat_capac = heat_capac * factors["heat_capac"]
+    thickness = thickness * factors["thickness"]
+    samples = thermal_conduc.shape[0]
+    nr_of_elements, max_layer = nr_of_layer.shape[0], thickness.shape[-1]
+    area = np.array([float(element.area) for element in elements])
+
+    # padded layers are not evaluated
+    active = np.arange(max_layer) < nr_of_layer[:, None]
+    r_layer = thickness / np.where(active, thermal_conduc, 1.0)
+
+    values = {}
+    r_conduc = 0.0
+    for count in range(max_layer):
+        r_conduc = r_conduc + np.where(
+            active[:, count], r_layer[..., count], 0.0)
+    values["r_conduc"] = r_conduc * (1 / area)
+
+    r_inner_comb = np.empty(nr_of_elements)
+    r_outer_comb = np.zeros(nr_of_elements)
+    for i, element in enumerate(elements):
+        r_inner_conv = (1 / element.inner_convection) * (1 / element.area)
+        r_inner_rad = (1 / element.inner_radiation) * (1 / element.area)
+        r_inner_comb[i] = 1 / (1 / r_inner_conv + 1 / r_inner_rad)
+        if element.outer_convection is not None \
+                and element.outer_radiation is not None:
+            r_outer_conv = (1 / element.outer_convection) * (
+                1 / element.area)
+            r_outer_rad = (1 / element.outer_radiation) * (1 / element.area)
+            r_outer_comb[i] = 1 / (1 / r_outer_conv + 1 / r_outer_rad)
+    values["ua_value"] = 1 / (
+        r_inner_comb + values["r_conduc"] + r_outer_comb)
+
+    if type(elements[0]).__name__ == "Window":
+        r1 = 0.0
+        for count in range(max_layer):
+            r1 = r1 + np.where(
+                active[:, count], r_layer[..., count] / area, 0.0)
+        values["r1"] = np.broadcast_to(r1, (samples, nr_of_elements))
+        return values
+
+    def _flat(array):
+        return np.broadcast_to(
+            array, (samples, nr_of_elements, max_layer)).reshape(
+            samples * nr_of_elements, max_layer)
+
+    transfer_mat, r_sum = equivalent_res.calc_transfer_matrices(
+        nr_of_layer=np.tile(nr_of_layer, samples),
+        density=_flat(density),
+        thermal_conduc=_flat(thermal_conduc),
+        heat_capac=_flat(heat_capac),
+        thickness=_flat(thickness))
+    r1, r2, r3, c1, c2, c1_korr = equivalent_res.scale_equivalent_res(
+        transfer_mat=transfer_mat,
+        r_sum=r_sum,
+        area=np.tile(area, samples))
+    values["r1"] = r1.reshape(samples, nr_of_elements)
+    values["c1_korr"] = c1_korr.reshape(samples, nr_of_elements)
+    # see Wall.set_equivalent_res()
+    outer = np.array([type(element).__name__ in (
+        "OuterWall", "Rooftop", "GroundFloor") for element in elements])
+    values["c1"] = np.where(
+        outer, values["c1_korr"], c1.reshape(samples, nr_of_elements))
+    return values
+
+
+def _calc_zone_samples(thermal_zone, factors, t_bt=5):
+    """Calculates the TwoElement parameters of a zone for all samples.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone()
+        TEASER instance of ThermalZone
+    factors : dict
+        Factors of all PARAMETERS, see _calc_element_samples()
+    t_bt : float
+        Time constant according to VDI 6007 (default t_bt = 5)
+
+    Returns
+    ----------
+    results : dict
+        Dictionary with numpy arrays of length samples for the keys of
+        ZONE_RESULTS (without heat_load) and the UA values of the heat load
+    """
+
+    samples = factors["infiltration_rate"].shape[0]
+    omega = 2 * math.pi / 86400 / t_bt
+    zeros = np.zeros(samples)
+    results = collections.OrderedDict(
+        (key, zeros) for key in ZONE_RESULTS if key != "heat_load")
+
+    def _layer_factors(name):
+        return {key: factors[key][name] for key in LAYER_PARAMETERS}
+
+    outer_walls = (thermal_zone.outer_walls +
+                   thermal_zone.ground_floors +
+                   thermal_zone.rooftops)
+    ua_value_gf = zeros
+    if outer_walls:
+        values = _calc_element_samples(
+            outer_walls, _layer_factors("outer_walls"))
+        nr_of_ow = len(thermal_zone.outer_walls)
+        nr_of_gf = len(thermal_zone.ground_floors)
+        ua_value = values["ua_value"]
+        ua_value_gf = _sequential_sum(ua_value[:, nr_of_ow:nr_of_ow + nr_of_gf])
+        results["ua_value_ow"] = (
+            _sequential_sum(ua_value[:, :nr_of_ow]) + ua_value_gf +
+            _sequential_sum(ua_value[:, nr_of_ow + nr_of_gf:]))
+        results["r_total_ow"] = 1 / results["ua_value_ow"]
+        results["r1_ow"], results["c1_ow"] = equivalent_res.calc_wall_type(
+            r1=values["r1"],
+            c1=values["c1"],
+            c1_korr=values["c1_korr"],
+            omega=omega)
+        if thermal_zone.outer_walls:
+            results["r_rest_ow"] = equivalent_res.calc_r_rest(
+                r_conduc=values["r_conduc"], r1=results["r1_ow"])
+
+    inner_walls = (thermal_zone.inner_walls +
+                   thermal_zone.floors +
+                   thermal_zone.ceilings)
+    if inner_walls:
+        values = _calc_element_samples(
+            inner_walls, _layer_factors("inner_walls"))
+        results["r1_iw"], results["c1_iw"] = equivalent_res.calc_wall_type(
+            r1=values["r1"],
+            c1=values["c1"],
+            c1_korr=values["c1_korr"],
+            omega=omega)
+
+    if thermal_zone.windows:
+        values = _calc_element_samples(
+            thermal_zone.windows,
+            _layer_factors("windows"))
+        area = np.array([win.area for win in thermal_zone.windows])
+        g_value = np.array([win.g_value for win in thermal_zone.windows]) * \
+            factors["g_value"]
+        results["ua_value_win"] = _sequential_sum(values["ua_value"])
+        results["r1_win"] = 1 / _sequential_sum(1 / values["r1"])
+        results["weighted_g_value"] = equivalent_res.calc_weighted_g_value(
+            g_value=np.broadcast_to(g_value, values["r1"].shape), area=area)
+
+    results["ua_value_gf"] = ua_value_gf
+    return results
+
+
+def _check_zone_models(buildings):
+    """Checks that the zones are calculated with TwoElement.
+
+    The samples are calculated for the TwoElement model with
+    merge_windows=False, other model orders would return parameters that
+    do not match the zone models.
+    """
+    for bldg in buildings:
+        project = getattr(bldg, "parent", None)
+        if project is not None and (
+                project.number_of_elements_calc != 2 or
+                project.merge_windows_calc is True):
+            raise ValueError(
+                "Samples are only available for number_of_elements_calc=2 "
+                "and merge_windows_calc=False, the project of building " +
+                str(bldg.name) + " uses " +
+                str(project.number_of_elements_calc) + " and " +
+                str(project.merge_windows_calc))
+        for zone in bldg.thermal_zones:
+            model_attr = getattr(zone, "model_attr", None)
+            if model_attr is not None and (
+                    type(model_attr).__name__ != "TwoElement" or
+                    model_attr.merge_windows is True):
+                raise ValueError(
+                    "Samples are only available for the TwoElement model "
+                    "with merge_windows=False, thermal zone " +
+                    str(zone.name) + " of building " + str(bldg.name) +
+                    " is calculated with " + type(model_attr).__name__)
+
+
+def calc_samples(
+        buildings,
+        distributions,
+        samples=1000,
+        seed=None,
+        independent=False,
+        chunk_size=1000,
+        t_bt=5):
+    """Monte Carlo sampling of zone parameters and heat loads.
+
+    The samples are calculated for the TwoElement model with
+    merge_windows=False, projects and zones calculated with another model
+    order or with merged windows raise a ValueError.
+
+    Parameters
+    ----------
+    buildings : Project() or Building() or list
+        TEASER instance of Project or Building or a list of buildings
+    distributions : dict
+        Distributions of relative factors (see draw_factors()) for the keys
+        of PARAMETERS. Parameters without distribution keep their nominal
+        value
+    samples : int
+        Number of samples, default is 1000
+    seed : int
+        Seed of the random number generator, default is None
+    independent : bool
+        If False (default), one factor per sample and parameter is used for
+        all layers, windows and zones. If True, the factors of each layer,
+        window and zone are drawn independently
+    chunk_size : int
+        Number of samples calculated at once, limits the memory of the
+        kernels, default is 1000
+    t_bt : float
+        Time constant according to VDI 6007 of the zone model (default
+        t_bt = 5)
+
+    Returns
+    ----------
+    results : collections.OrderedDict
+        Dictionary with numpy arrays of shape (samples, zones) for the keys
+        of ZONE_RESULTS, with the zones of all buildings in order, the
+        heat load of each building as building_heat_load with shape
+        (samples, buildings), building_index and zone_position of each zone
+        (see heat_load.collect_heat_load_inputs()) and, if independent is
+        False, the drawn factors of each parameter as factors
+    """
+
+    if hasattr(buildings, "buildings"):
+        buildings = buildings.buildings
+    elif hasattr(buildings, "thermal_zones"):
+        buildings = [buildings]
+
+    for key in distributions:
+        if key not in PARAMETERS:
+            raise ValueError("Parameter " + str(key) + " can't be sampled")
+    _check_zone_models(buildings)
+
+    rng = np.random.RandomState(seed)
+    shared = collections.OrderedDict()
+    if independent is False:
+        for key in PARAMETERS:
+            if key in distributions:
+                shared[key] = draw_factors(distributions[key], samples, rng)
+
+    zones = [(building_index, zone_position, zone)
+             for building_index, bldg in enumerate(buildings)
+             for zone_position, zone in enumerate(bldg.thermal_zones)]
+
+    zone_results = collections.OrderedDict(
+        (key, np.empty((samples, len(zones)))) for key in ZONE_RESULTS)
+    ua_value_gf = np.empty((samples, len(zones)))
+    infiltration_rate = np.empty((samples, len(zones)))
+
+    def _factors(key, shared_shape, independent_shape):
+        if key not in distributions:
+            return np.ones(shared_shape)
+        elif independent is False:
+            return shared[key][start:stop].reshape(shared_shape)
+        return draw_factors(distributions[key], independent_shape, rng)
+
+    for start in range(0, samples, chunk_size):
+        stop = min(start + chunk_size, samples)
+        size = stop - start
+        for count, (building_index, zone_position, zone) in enumerate(zones):
+            zone_factors = {}
+            for key in LAYER_PARAMETERS:
+                zone_factors[key] = {}
+                for name, elements in _element_groups(zone):
+                    zone_factors[key][name] = _factors(
+                        key, (size, 1, 1), (size, len(elements), max(
+                            [len(element.layer) for element in elements] +
+                            [0])))
+            zone_factors["g_value"] = _factors(
+                "g_value", (size, 1), (size, len(zone.windows)))
+            zone_factors["infiltration_rate"] = _factors(
+                "infiltration_rate", (size,), (size,))
+
+            results = _calc_zone_samples(zone, zone_factors, t_bt=t_bt)
+            for key, value in results.items():
+                if key in zone_results:
+                    zone_results[key][start:stop, count] = value
+            ua_value_gf[start:stop, count] = results["ua_value_gf"]
+            infiltration_rate[start:stop, count] = \
+                zone.use_conditions.infiltration_rate * \
+                zone_factors["infiltration_rate"]
+
+    inputs = collections.OrderedDict()
+    inputs["building_index"] = np.array(
+        [building_index for building_index, zone_position, zone in zones],
+        dtype=int)
+    inputs["zone_position"] = np.array(
+        [zone_position for building_index, zone_position, zone in zones],
+        dtype=int)
+    # UA values of the heat load of TwoElement, see get_heat_load_ua_values()
+    inputs["ua_value_ow"] = zone_results["ua_value_ow"] - ua_value_gf
+    inputs["ua_value_win"] = zone_results["ua_value_win"]
+    inputs["ua_value_gf"] = ua_value_gf
+    inputs["infiltration_rate"] = infiltration_rate
+    for key in ("volume", "heat_capac_air", "density_air", "t_inside",
+                "t_outside", "t_ground"):
+        inputs[key] = np.array(
+            [getattr(zone, key) for building_index, zone_position, zone
+             in zones], dtype=float)
+    inputs["nr_of_buildings"] = len(buildings)
+    building_heat_load, zone_results["heat_load"] = \
+        heat_load.calc_heat_loads(inputs)
+
+    zone_results["building_heat_load"] = building_heat_load
+    zone_results["building_index"] = inputs["building_index"]
+    zone_results["zone_position"] = inputs["zone_position"]
+    if independent is False:
+        zone_results["factors"] = shared
+    return zone_results
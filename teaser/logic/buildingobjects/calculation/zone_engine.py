@@ -0,0 +1,186 @@
+# created October 2026
+
+"""Calculation of the zone parameters for several model orders.
+
+The values of the building elements of a thermal zone are the same for all
+model orders (OneElement, TwoElement, ThreeElement and FourElement). This
+module calculates them once and then aggregates them for each requested
+model order. ThermalZone.calc_zone_parameters() keeps the results together
+with a fingerprint of all inputs, so that switching the model order or
+exporting several model orders does not recalculate the zone.
+"""
+
+import collections
+from teaser.logic.buildingobjects.calculation.one_element import OneElement
+from teaser.logic.buildingobjects.calculation.two_element import TwoElement
+from teaser.logic.buildingobjects.calculation.three_element import ThreeElement
+from teaser.logic.buildingobjects.calculation.four_element import FourElement
+import teaser.logic.buildingobjects.calculation.equivalent_res as \
+    equivalent_res
+
+MODEL_CLASSES = collections.OrderedDict([
+    (1, OneElement),
+    (2, TwoElement),
+    (3, ThreeElement),
+    (4, FourElement)])
+
+# results of the calculation, these are not part of the fingerprint but
+# are stored per model order (see calc_zone_models())
+_ELEMENT_RESULTS = ("r1", "r2", "r3", "c1", "c2", "c1_korr", "wf_out")
+_NO_INPUTS = set(_ELEMENT_RESULTS) | {
+    "parent",
+    "_ua_dirty",
+    "_ua_value",
+    "_u_value",
+    "_r_conduc",
+    "_r_inner_conv",
+    "_r_inner_rad",
+    "_r_inner_comb",
+    "_r_outer_conv",
+    "_r_outer_rad",
+    "_r_outer_comb"}
+
+
+def get_zone_elements(thermal_zone):
+    """Returns all building elements used by the zone models.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone()
+        TEASER instance of ThermalZone
+
+    Returns
+    ----------
+    elements : list
+        List of all walls and windows of the thermal zone
+    """
+
+    return (thermal_zone.outer_walls +
+            thermal_zone.rooftops +
+            thermal_zone.ground_floors +
+            thermal_zone.windows +
+            thermal_zone.inner_walls +
+            thermal_zone.floors +
+            thermal_zone.ceilings)
+
+
+def get_zone_fingerprint(thermal_zone):
+    """Fingerprint of all inputs of the zone models.
+
+    The fingerprint contains all zone values read by the zone models and
+    all attributes of the building elements and their layers except the
+    calculated ones. Two equal fingerprints lead to equal zone models.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone()
+        TEASER instance of ThermalZone
+
+    Returns
+    ----------
+    fingerprint : list
+        List of all inputs, comparable with ==
+    """
+
+    if thermal_zone.use_conditions is not None:
+        infiltration_rate = thermal_zone.use_conditions.infiltration_rate
+    else:
+        infiltration_rate = None
+
+    fingerprint = [(
+        thermal_zone.volume,
+        thermal_zone.t_inside,
+        thermal_zone.t_outside,
+        thermal_zone.t_ground,
+        thermal_zone.density_air,
+        thermal_zone.heat_capac_air,
+        infiltration_rate)]
+
+    for element in get_zone_elements(thermal_zone):
+        values = [type(element).__name__]
+        for key, value in vars(element).items():
+            if key in _NO_INPUTS:
+                continue
+            if key == "_layer":
+                value = [(
+                    layer.thickness,
+                    layer.material.density,
+                    layer.material.thermal_conduc,
+                    layer.material.heat_capac,
+                    layer.material.solar_absorp,
+                    layer.material.ir_emissivity,
+                    layer.material.transmittance) for layer in value]
+            values.append((key, value))
+        fingerprint.append(values)
+
+    return fingerprint
+
+
+def calc_zone_models(
+        thermal_zone,
+        merge_windows=False,
+        t_bt=5,
+        orders=(1, 2, 3, 4)):
+    """Calculates the zone models of several model orders together.
+
+    The values of the building elements are calculated once with
+    equivalent_res.calc_element_values(), then each model is calculated
+    without recalculating them. The model of the last order is left as
+    the current state of the building elements (e.g. wf_out).
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone()
+        TEASER instance of ThermalZone
+    merge_windows : boolean
+        True for merging windows into the outer wall's RC-combination,
+        False for separate resistance for window, default is False
+    t_bt : float [d]
+        Time constant according to VDI 6007 (default t_bt = 5)
+    orders : list
+        Number of elements of the models to calculate, between 1 and 4,
+        default are all four model orders
+
+    Returns
+    ----------
+    models : collections.OrderedDict
+        Dictionary with the number of elements as key and a tuple of the
+        model instance (e.g. TwoElement()) and the calculated values of
+        the building elements as value (see restore_zone_model())
+    """
+
+    equivalent_res.calc_element_values(thermal_zone)
+    elements = get_zone_elements(thermal_zone)
+
+    models = collections.OrderedDict()
+    for number_of_elements in orders:
+        model = MODEL_CLASSES[number_of_elements](
+            thermal_zone=thermal_zone,
+            merge_windows=merge_windows,
+            t_bt=t_bt)
+        model.calc_attributes(calc_elements=False)
+        element_results = [
+            tuple(getattr(element, attr) for attr in _ELEMENT_RESULTS)
+            for element in elements]
+        models[number_of_elements] = (model, element_results)
+
+    return models
+
+
+def restore_zone_model(thermal_zone, model_result):
+    """Sets a calculated zone model to the thermal zone.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone()
+        TEASER instance of ThermalZone
+    model_result : tuple
+        One value of the dictionary returned by calc_zone_models()
+    """
+
+    model, element_results = model_result
+    for element, results in zip(get_zone_elements(thermal_zone),
+                                element_results):
+        for attr, value in zip(_ELEMENT_RESULTS, results):
+            setattr(element, attr, value)
+    thermal_zone.model_attr = model
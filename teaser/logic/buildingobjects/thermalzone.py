@@ -4,13 +4,109 @@
 """This module includes the ThermalZone class
 """
 from __future__ import division
+import bisect
 import random
 import re
 import warnings
-from teaser.logic.buildingobjects.calculation.one_element import OneElement
-from teaser.logic.buildingobjects.calculation.two_element import TwoElement
-from teaser.logic.buildingobjects.calculation.three_element import ThreeElement
-from teaser.logic.buildingobjects.calculation.four_element import FourElement
+import teaser.logic.buildingobjects.calculation.zone_engine as zone_engine
+
+# element lists of a thermal zone that are indexed by orientation and tilt
+# (see ThermalZone.find_walls()), with the type of their elements
+INDEXED_ELEMENTS = {
+    "OuterWall": "outer_walls",
+    "Door": "doors",
+    "Rooftop": "rooftops",
+    "GroundFloor": "ground_floors",
+    "Window": "windows"}
+
+
+class ElementList(list):
+    """List of building elements of a thermal zone.
+
+    Notifies the thermal zone about added and removed elements to keep the
+    index of ThermalZone.find_walls() etc. and the area sums of the building
+    up to date. Appending and removing elements updates the index
+    incrementally, all other changes of the list mark the index for a
+    rebuild on the next lookup.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone()
+        TEASER instance of ThermalZone containing the list
+    name : str
+        Name of the list in the thermal zone, e.g. 'outer_walls'
+    """
+
+    def __init__(self, thermal_zone=None, name=None):
+        super(ElementList, self).__init__()
+        self.thermal_zone = thermal_zone
+        self.name = name
+
+    def _get_thermal_zone(self):
+        # lists are filled before their attributes when unpickled
+        return self.__dict__.get("thermal_zone")
+
+    def _invalidate(self):
+        thermal_zone = self._get_thermal_zone()
+        if thermal_zone is not None:
+            thermal_zone._element_list_changed(self.name)
+
+    def append(self, element):
+        super(ElementList, self).append(element)
+        thermal_zone = self._get_thermal_zone()
+        if thermal_zone is not None:
+            thermal_zone._element_added(self.name, element)
+
+    def remove(self, element):
+        super(ElementList, self).remove(element)
+        thermal_zone = self._get_thermal_zone()
+        if thermal_zone is not None:
+            thermal_zone._element_removed(self.name, element)
+
+    def pop(self, index=-1):
+        element = super(ElementList, self).pop(index)
+        thermal_zone = self._get_thermal_zone()
+        if thermal_zone is not None:
+            thermal_zone._element_removed(self.name, element)
+        return element
+
+    def extend(self, elements):
+        super(ElementList, self).extend(elements)
+        self._invalidate()
+
+    def insert(self, index, element):
+        super(ElementList, self).insert(index, element)
+        self._invalidate()
+
+    def clear(self):
+        super(ElementList, self).clear()
+        self._invalidate()
+
+    def sort(self, *args, **kwargs):
+        super(ElementList, self).sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self):
+        super(ElementList, self).reverse()
+        self._invalidate()
+
+    def __setitem__(self, index, value):
+        super(ElementList, self).__setitem__(index, value)
+        self._invalidate()
+
+    def __delitem__(self, index):
+        super(ElementList, self).__delitem__(index)
+        self._invalidate()
+
+    def __iadd__(self, elements):
+        super(ElementList, self).__iadd__(elements)
+        self._invalidate()
+        return self
+
+    def __imul__(self, value):
+        super(ElementList, self).__imul__(value)
+        self._invalidate()
+        return self
 
 
 class ThermalZone(object):
@@ -91,26 +187,32 @@ class ThermalZone(object):
         self._area = None
         self._volume = None
         self._infiltration_rate = 0.4
-        self._outer_walls = []
-        self._doors = []
-        self._rooftops = []
-        self._ground_floors = []
-        self._windows = []
-        self._inner_walls = []
-        self._floors = []
-        self._ceilings = []
+        self._element_index = None
+        self._element_seq = 0
+        self._element_area = {}
+        self._outer_walls = ElementList(self, "outer_walls")
+        self._doors = ElementList(self, "doors")
+        self._rooftops = ElementList(self, "rooftops")
+        self._ground_floors = ElementList(self, "ground_floors")
+        self._windows = ElementList(self, "windows")
+        self._inner_walls = ElementList(self, "inner_walls")
+        self._floors = ElementList(self, "floors")
+        self._ceilings = ElementList(self, "ceilings")
         self._use_conditions = None
         self._t_inside = 293.15
         self._t_outside = 261.15
         self.density_air = 1.25
         self.heat_capac_air = 1002
         self.t_ground = 286.15
+        self._model_attr_cache = {}
+        self._model_attr_fingerprint = None
 
     def calc_zone_parameters(
             self,
             number_of_elements=2,
             merge_windows=False,
-            t_bt=5):
+            t_bt=5,
+            all_orders=False):
         """RC-Calculation for the thermal zone
 
         Based on the input parameters (used model) this function instantiates
@@ -127,6 +229,11 @@ class ThermalZone(object):
         For all four options we can chose if the thermal conduction through
         the window is considered in a separate resistance or not.
 
+        Calculated models are kept together with a fingerprint of all inputs
+        of the zone (see zone_engine.get_zone_fingerprint()). As long as the
+        inputs do not change, switching the number of elements or
+        calculating the same model again reuses the kept models.
+
         Parameters
         ----------
         number_of_elements : int
@@ -140,32 +247,41 @@ class ThermalZone(object):
 
         t_bt : float
             Time constant according to VDI 6007 (default t_bt = 5)
+
+        all_orders : bool
+            If True, the models of all four numbers of elements are calculated
+            together, e.g. to export several model orders of the same
+            buildings afterwards. Default is False, which only calculates the
+            model of number_of_elements
         """
 
-        if number_of_elements == 1:
-            self.model_attr = OneElement(
-                thermal_zone=self,
-                merge_windows=merge_windows,
-                t_bt=t_bt)
-            self.model_attr.calc_attributes()
-        elif number_of_elements == 2:
-            self.model_attr = TwoElement(
-                thermal_zone=self,
-                merge_windows=merge_windows,
-                t_bt=t_bt)
-            self.model_attr.calc_attributes()
-        elif number_of_elements == 3:
-            self.model_attr = ThreeElement(
-                thermal_zone=self,
-                merge_windows=merge_windows,
-                t_bt=t_bt)
-            self.model_attr.calc_attributes()
-        elif number_of_elements == 4:
-            self.model_attr = FourElement(
+        if number_of_elements not in zone_engine.MODEL_CLASSES:
+            return
+
+        fingerprint = zone_engine.get_zone_fingerprint(self)
+        if fingerprint != self._model_attr_fingerprint:
+            self._model_attr_cache = {}
+            self._model_attr_fingerprint = fingerprint
+
+        if (number_of_elements, merge_windows, t_bt) not in \
+                self._model_attr_cache:
+            if all_orders is True:
+                orders = list(zone_engine.MODEL_CLASSES)
+            else:
+                orders = [number_of_elements]
+            models = zone_engine.calc_zone_models(
                 thermal_zone=self,
                 merge_windows=merge_windows,
-                t_bt=t_bt)
-            self.model_attr.calc_attributes()
+                t_bt=t_bt,
+                orders=orders)
+            for order, model_result in models.items():
+                self._model_attr_cache[
+                    (order, merge_windows, t_bt)] = model_result
+
+        zone_engine.restore_zone_model(
+            thermal_zone=self,
+            model_result=self._model_attr_cache[
+                (number_of_elements, merge_windows, t_bt)])
 
     def find_walls(self, orientation, tilt):
         """Returns all outer walls with given orientation and tilt
@@ -185,13 +301,7 @@ class ThermalZone(object):
         elements : list
             List of OuterWalls instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.outer_walls:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("outer_walls", orientation, tilt)
 
     def find_doors(self, orientation, tilt):
         """Returns all outer walls with given orientation and tilt
@@ -211,13 +321,7 @@ class ThermalZone(object):
         elements : list
             List of Doors instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.doors:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("doors", orientation, tilt)
 
     def find_rts(self, orientation, tilt):
         """Returns all rooftops with given orientation and tilt
@@ -237,13 +341,7 @@ class ThermalZone(object):
         elements : list
             List of Rooftop instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.rooftops:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("rooftops", orientation, tilt)
 
     def find_gfs(self, orientation, tilt):
         """Returns all ground floors with given orientation and tilt
@@ -263,13 +361,7 @@ class ThermalZone(object):
         elements : list
             List of GroundFloor instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.ground_floors:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("ground_floors", orientation, tilt)
 
     def find_wins(self, orientation, tilt):
         """Returns all windows with given orientation and tilt
@@ -289,13 +381,206 @@ class ThermalZone(object):
         elements : list
             List of Window instances with desired orientation and tilt.
         """
-        elements = []
-        for i in self.windows:
-            if i.orientation == orientation and i.tilt == tilt:
-                elements.append(i)
-            else:
-                pass
-        return elements
+        return self._find_elements("windows", orientation, tilt)
+
+    def get_window_area(self, orientation, tilt):
+        """Returns the area of all windows with given orientation and tilt
+
+        The area is summed up in the order of find_wins() and kept until a
+        window of this orientation and tilt is added, removed, rotated or
+        changes its area.
+
+        Parameters
+        ----------
+        orientation : float [degree]
+            Azimuth of the desired windows.
+        tilt : float [degree]
+            Tilt against the horizontal of the desired windows.
+
+        Returns
+        -------
+        sum_area : float
+            Area of all Window instances with desired orientation and tilt.
+        """
+        key = ("windows", orientation, tilt)
+        if key not in self._element_area:
+            self._element_area[key] = sum(
+                [win.area for win in self.find_wins(orientation, tilt)])
+        return self._element_area[key]
+
+    def invalidate_element_index(self):
+        """Marks the index of find_walls() etc. for a rebuild
+
+        The index maps the list name, orientation and tilt of outer walls,
+        doors, rooftops, ground floors and windows to the elements. It is
+        updated incrementally when elements are appended, removed or
+        rotated and rebuilt on the next lookup after all other changes.
+        """
+        self._element_index = None
+        self._element_area = {}
+
+    def invalidate_element_area(self, element):
+        """Drops the kept area sum of the orientation and tilt of an element
+
+        Called by BuildingElement if the area of an element of this zone
+        changes (see get_window_area()).
+
+        Parameters
+        ----------
+        element : BuildingElement()
+            instance of BuildingElement with changed area
+        """
+        name = INDEXED_ELEMENTS.get(type(element).__name__)
+        if name is not None:
+            self._element_area.pop(
+                (name, element.orientation, element.tilt), None)
+
+    def _get_element_index(self):
+        """Returns the index of find_walls() etc., rebuilt if marked"""
+        if self._element_index is None:
+            self._element_index = {}
+            self._element_seq = 0
+            for name in INDEXED_ELEMENTS.values():
+                for element in getattr(self, name):
+                    self._element_index.setdefault(
+                        (name, element.orientation, element.tilt), []).append(
+                        (self._element_seq, element))
+                    self._element_seq += 1
+        return self._element_index
+
+    def _find_elements(self, name, orientation, tilt):
+        """Returns the elements of one list with given orientation and tilt
+
+        Elements are returned in the order of the list, as each entry of the
+        index holds the sequence number of the element in the zone.
+        """
+        return [element for seq, element in self._get_element_index().get(
+            (name, orientation, tilt), [])]
+
+    def find_by_orientation(self, name, orientation):
+        """Returns the elements of one list with given orientation
+
+        This function returns the elements of all tilts in the order of the
+        list, e.g. to sum up areas per orientation in Building.
+
+        Parameters
+        ----------
+        name : str
+            Name of the element list, one of 'outer_walls', 'doors',
+            'rooftops', 'ground_floors' and 'windows'.
+        orientation : float [degree]
+            Azimuth of the desired elements.
+
+        Returns
+        -------
+        elements : list
+            List of elements with desired orientation.
+        """
+        entries = []
+        for (key_name, key_orientation, key_tilt), key_entries in \
+                self._get_element_index().items():
+            if key_name == name and key_orientation == orientation:
+                entries.extend(key_entries)
+        entries.sort(key=lambda entry: entry[0])
+        return [element for seq, element in entries]
+
+    def _element_added(self, name, element):
+        """Adds an element appended to one of the lists to the index"""
+        self._notify_building(name, element)
+        if name not in INDEXED_ELEMENTS.values() or \
+                self.__dict__.get("_element_index") is None:
+            return
+        if "_orientation" not in vars(element):
+            # elements append themselves before their orientation is set
+            self.invalidate_element_index()
+            return
+        key = (name, element.orientation, element.tilt)
+        self._element_index.setdefault(key, []).append(
+            (self._element_seq, element))
+        self._element_seq += 1
+        self._element_area.pop(key, None)
+
+    def _element_removed(self, name, element):
+        """Removes an element removed from one of the lists from the index"""
+        self._notify_building(name, element)
+        if name not in INDEXED_ELEMENTS.values() or \
+                self.__dict__.get("_element_index") is None:
+            return
+        key = (name, element.orientation, element.tilt)
+        entries = self._element_index.get(key, [])
+        positions = [
+            position for position, (seq, item) in enumerate(entries)
+            if item is element]
+        if len(positions) != 1:
+            # unknown which entry of an element added twice was removed
+            self.invalidate_element_index()
+            return
+        del entries[positions[0]]
+        if not entries:
+            del self._element_index[key]
+        self._element_area.pop(key, None)
+
+    def _element_list_changed(self, name):
+        """Marks the index after other changes of one of the lists"""
+        self._notify_building(name)
+        if name in INDEXED_ELEMENTS.values():
+            self.invalidate_element_index()
+
+    def _notify_building(self, name, element=None):
+        """Marks the area sums of the building after changes of a list
+
+        Elements without area (e.g. while they are constructed) do not
+        change the sums, like in the area setter of BuildingElement.
+        """
+        building = self.__dict__.get("_ThermalZone__parent")
+        if building is None:
+            return
+        if element is not None and vars(element).get("_area") is None:
+            return
+        if name in ("outer_walls", "rooftops", "ground_floors"):
+            building.invalidate_outer_area()
+        elif name == "windows":
+            building.invalidate_window_area()
+        elif name in ("inner_walls", "floors", "ceilings"):
+            building.invalidate_inner_wall_area()
+
+    def reindex_element(self, element, orientation, tilt):
+        """Moves a rotated element in the index of find_walls() etc.
+
+        Called by BuildingElement if orientation or tilt of an element of
+        this zone changes.
+
+        Parameters
+        ----------
+        element : BuildingElement()
+            rotated instance of OuterWall, Door, Rooftop, GroundFloor or
+            Window
+        orientation : float [degree]
+            Azimuth of the element before the change.
+        tilt : float [degree]
+            Tilt of the element before the change.
+        """
+        name = INDEXED_ELEMENTS.get(type(element).__name__)
+        if name is None or self._element_index is None:
+            return
+        old_key = (name, orientation, tilt)
+        new_key = (name, element.orientation, element.tilt)
+        if old_key == new_key:
+            return
+        entries = self._element_index.get(old_key, [])
+        moved = [entry for entry in entries if entry[1] is element]
+        if not moved:
+            return
+        entries = [entry for entry in entries if entry[1] is not element]
+        if entries:
+            self._element_index[old_key] = entries
+        else:
+            del self._element_index[old_key]
+        new_entries = self._element_index.setdefault(new_key, [])
+        for entry in moved:
+            bisect.insort(new_entries, entry)
+        self._element_area.pop(old_key, None)
+        self._element_area.pop(new_key, None)
 
     def set_inner_wall_area(self):
         """Sets the inner wall area according to zone area
@@ -418,6 +703,7 @@ class ThermalZone(object):
             if tz.internal_id == self.internal_id:
                 self.parent.net_leased_area -= self.area
                 self.parent.thermal_zones.pop(index)
+                self.parent.invalidate_inner_wall_area()
 
                 break
 
@@ -470,6 +756,7 @@ class ThermalZone(object):
             if inspect.isclass(Building):
                 self.__parent = value
                 self.__parent.thermal_zones.append(self)
+                self.__parent.invalidate_inner_wall_area()
 
     @property
     def name(self):
@@ -496,7 +783,8 @@ class ThermalZone(object):
     @outer_walls.setter
     def outer_walls(self, value):
         if value is None:
-            self._outer_walls = []
+            self._outer_walls = ElementList(self, "outer_walls")
+            self._element_list_changed("outer_walls")
 
     @property
     def doors(self):
@@ -505,7 +793,8 @@ class ThermalZone(object):
     @doors.setter
     def doors(self, value):
         if value is None:
-            self._doors = []
+            self._doors = ElementList(self, "doors")
+            self._element_list_changed("doors")
 
     @property
     def rooftops(self):
@@ -514,7 +803,8 @@ class ThermalZone(object):
     @rooftops.setter
     def rooftops(self, value):
         if value is None:
-            self._rooftops = []
+            self._rooftops = ElementList(self, "rooftops")
+            self._element_list_changed("rooftops")
 
     @property
     def ground_floors(self):
@@ -523,7 +813,8 @@ class ThermalZone(object):
     @ground_floors.setter
     def ground_floors(self, value):
         if value is None:
-            self._ground_floors = []
+            self._ground_floors = ElementList(self, "ground_floors")
+            self._element_list_changed("ground_floors")
 
     @property
     def ceilings(self):
@@ -532,7 +823,8 @@ class ThermalZone(object):
     @ceilings.setter
     def ceilings(self, value):
         if value is None:
-            self._ceilings = []
+            self._ceilings = ElementList(self, "ceilings")
+            self._element_list_changed("ceilings")
 
     @property
     def floors(self):
@@ -541,7 +833,8 @@ class ThermalZone(object):
     @floors.setter
     def floors(self, value):
         if value is None:
-            self._floors = []
+            self._floors = ElementList(self, "floors")
+            self._element_list_changed("floors")
 
     @property
     def inner_walls(self):
@@ -551,7 +844,8 @@ class ThermalZone(object):
     def inner_walls(self, value):
 
         if value is None:
-            self._inner_walls = []
+            self._inner_walls = ElementList(self, "inner_walls")
+            self._element_list_changed("inner_walls")
 
     @property
     def windows(self):
@@ -561,7 +855,8 @@ class ThermalZone(object):
     def windows(self, value):
 
         if value is None:
-            self._windows = []
+            self._windows = ElementList(self, "windows")
+            self._element_list_changed("windows")
 
     @property
     def use_conditions(self):
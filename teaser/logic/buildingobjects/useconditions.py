@@ -364,12 +364,12 @@ class UseConditions(object):
             DataClass containing the bindings for Use Conditions (typically
             this is the data class stored in prj.data,
             but the user can individually change that. Default is None which
-            leads to an automatic setter to self.parent.parent.parent.data (
-            which is DataClass in current project)
+            leads to an automatic setter to self.parent.parent.data (
+            which is the DataClass of the building in current project)
 
         """
         if data_class is None:
-            data_class = self.parent.parent.parent.data
+            data_class = self.parent.parent.data
         else:
             data_class = data_class
 
@@ -380,7 +380,7 @@ class UseConditions(object):
     def save_use_conditions(self, data_class=None):
         """Documentation is missing."""
         if data_class is None:
-            data_class = self.parent.parent.parent.data
+            data_class = self.parent.parent.data
         else:
             data_class = data_class
 
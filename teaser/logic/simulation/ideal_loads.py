@@ -0,0 +1,158 @@
+# created October 2026
+
+"""Annual ideal heating and cooling loads of many zones for sizing.
+
+The zone models of all buildings are simulated hourly with the batched
+state space simulation (see statespace.simulate_chunks()). The heating and
+cooling set points and the profiles of persons, machines and lighting are
+taken from UseConditions.schedules, heating and cooling are only applied
+if with_heating and with_cooling of the use conditions are True. From the
+hourly ideal loads of each chunk of zones the sizing values are derived
+at once: annual peaks and the hour of the peak, annual demands, full load
+hours and load duration curves of each zone, the coincident peaks of each
+building and the hourly total load of all buildings. The hourly loads of
+single zones are only kept if requested, thus the memory does not grow
+with the number of hours times the number of zones.
+"""
+
+import collections
+import numpy as np
+import teaser.logic.simulation.statespace as statespace
+
+
+def calc_load_duration_curve(load, steps=None):
+    """Load duration curves of hourly loads.
+
+    Parameters
+    ----------
+    load : np.array
+        Numpy array of shape (number of hours, ...) with hourly loads
+    steps : int
+        Number of values of the curve, evenly distributed over the sorted
+        hours including the first and the last hour. Default is None, which
+        returns the loads of all hours
+
+    Returns
+    ----------
+    duration_curve : np.array
+        Numpy array of shape (steps, ...) with the loads sorted in
+        descending order
+    hours : np.array
+        Number of hours with a load greater or equal than the values of the
+        curve
+    """
+
+    load = np.asarray(load, dtype=float)
+    nr_of_hours = load.shape[0]
+    duration_curve = -np.sort(-load, axis=0)
+    if steps is None:
+        hours = np.arange(nr_of_hours)
+    else:
+        hours = np.round(np.linspace(0, nr_of_hours - 1, steps)).astype(int)
+        duration_curve = duration_curve[hours]
+    return duration_curve, hours + 1
+
+
+def calc_ideal_loads(
+        buildings,
+        weather_file_path=None,
+        time_zone=None,
+        chunk_size=256,
+        duration_steps=101,
+        hourly=False):
+    """Ideal loads, annual peaks and load duration curves of all zones.
+
+    Parameters
+    ----------
+    buildings : Project(), Building() or list
+        Project, building or list of calculated TEASER instances of Building
+    weather_file_path : str
+        Path to the weather file in Modelica .mos format, default is None,
+        which uses Project.weather_file_path of the first building
+    time_zone : float
+        Time zone of the weather data in h, default is None, which uses the
+        time zone of the weather file
+    chunk_size : int
+        Minimal number of zones that are simulated together (default 256)
+    duration_steps : int
+        Number of values of the load duration curves (default 101), None
+        returns the loads of all hours
+    hourly : bool
+        If True, the hourly heating and cooling loads of all zones are
+        returned as well (default False)
+
+    Returns
+    ----------
+    loads : collections.OrderedDict
+        Dictionary with building_index and zone_position of each zone, the
+        time of the weather data in s (time), for heating and cooling
+        (<load> is heating or cooling): annual peak in W (<load>_peak), hour
+        of the peak (<load>_peak_hour), annual demand in kWh
+        (<load>_demand) and full load hours (<load>_full_load_hours) of
+        each zone, load duration curves in W of shape (duration_steps,
+        number of zones) (<load>_duration) with the hours of their values
+        (duration_hours), coincident peak load of the zones of each
+        building in W (building_<load>_peak) and hourly load of all
+        buildings in W (total_<load>_load). If hourly is True, the hourly
+        loads in W of shape (number of hours, number of zones)
+        (<load>_load)
+    """
+
+    if hasattr(buildings, "buildings"):
+        buildings = buildings.buildings
+    elif hasattr(buildings, "thermal_zones"):
+        buildings = [buildings]
+
+    loads = collections.OrderedDict()
+    for chunk in statespace.simulate_chunks(
+            buildings=buildings,
+            weather_file_path=weather_file_path,
+            time_zone=time_zone,
+            chunk_size=chunk_size):
+        nr_of_hours = len(chunk["time"])
+        nr_of_zones = chunk["nr_of_zones"]
+        if not loads:
+            loads["building_index"] = np.empty(nr_of_zones, dtype=int)
+            loads["zone_position"] = np.empty(nr_of_zones, dtype=int)
+            loads["time"] = chunk["time"]
+            for name in ("heating", "cooling"):
+                for key in ("_peak", "_demand", "_full_load_hours"):
+                    loads[name + key] = np.empty(nr_of_zones)
+                loads[name + "_peak_hour"] = np.empty(nr_of_zones, dtype=int)
+                loads[name + "_duration"] = np.empty(
+                    (nr_of_hours if duration_steps is None
+                     else duration_steps, nr_of_zones))
+                loads["building_" + name + "_peak"] = np.zeros(
+                    len(buildings))
+                loads["total_" + name + "_load"] = np.zeros(nr_of_hours)
+                if hourly is True:
+                    loads[name + "_load"] = np.empty(
+                        (nr_of_hours, nr_of_zones))
+
+        zones = slice(chunk["start"], chunk["stop"])
+        building_index = chunk["building_index"]
+        loads["building_index"][zones] = building_index
+        loads["zone_position"][zones] = chunk["zone_position"]
+        # chunks hold whole buildings, see simulate_chunks()
+        first = np.flatnonzero(chunk["zone_position"] == 0)
+
+        for name, load in (
+                ("heating", np.maximum(chunk["ideal_load"], 0)),
+                ("cooling", np.maximum(-chunk["ideal_load"], 0))):
+            peak = load.max(axis=0)
+            demand = load.sum(axis=0) / 1000
+            loads[name + "_peak"][zones] = peak
+            loads[name + "_peak_hour"][zones] = load.argmax(axis=0)
+            loads[name + "_demand"][zones] = demand
+            with np.errstate(divide="ignore", invalid="ignore"):
+                loads[name + "_full_load_hours"][zones] = np.where(
+                    peak > 0, demand * 1000 / peak, 0.0)
+            loads[name + "_duration"][:, zones], loads["duration_hours"] = \
+                calc_load_duration_curve(load, steps=duration_steps)
+            loads["total_" + name + "_load"] += load.sum(axis=1)
+            loads["building_" + name + "_peak"][building_index[first]] = \
+                np.add.reduceat(load, first, axis=1).max(axis=0)
+            if hourly is True:
+                loads[name + "_load"][:, zones] = load
+
+    return loads
@@ -0,0 +1,276 @@
+# created October 2026
+
+"""Hourly solar irradiation on the surfaces of the zone models.
+
+The irradiation on tilted surfaces is calculated from the direct normal,
+diffuse horizontal and global horizontal irradiation of a weather file
+(isotropic sky, ground reflection with a constant albedo). The position of
+the sun is calculated for the middle of each hour.
+
+The zone models of a project share few distinct surfaces: most buildings
+have the same four facade orientations and a handful of roof tilts, and
+buildings of a district share one location. calc_surface_irradiation()
+therefore calculates the irradiation of each unique surface (latitude,
+longitude, orientation, tilt) once, in one vectorized pass over all hours
+and surfaces, and keeps the result in a small in-memory cache keyed by the
+weather file (path and fingerprint), time zone, albedo and the set of
+unique surfaces. Rotating a building (Building.rotate_building()) changes
+its orientations and thus the surface set, which leads to a new
+calculation.
+"""
+
+import os
+import math
+import collections
+import numpy as np
+import teaser.data.input.weather_input as weather_input
+import teaser.data.catalog_cache as catalog_cache
+
+ALBEDO = 0.2
+"""Reflectance of the ground for the irradiation on tilted surfaces"""
+
+IRRADIATION_CACHE_SIZE = 16
+"""Number of surface sets of which the irradiation is kept in memory"""
+
+_irradiation_cache = collections.OrderedDict()
+
+
+def calc_irradiation(
+        weather,
+        latitude,
+        longitude,
+        time_zone,
+        orientations,
+        tilts,
+        albedo=ALBEDO):
+    """Hourly irradiation on tilted surfaces.
+
+    Calculates the direct, diffuse (isotropic sky) and ground reflected
+    irradiation on surfaces with the given orientations and tilts. The
+    position of the sun is calculated for the middle of each hour.
+
+    Parameters
+    ----------
+    weather : dict
+        Weather data as returned by weather_input.load_weather()
+    latitude : float or np.array
+        Latitude in degree, one value for all surfaces or one per surface
+    longitude : float or np.array
+        Longitude in degree (east positive), one value for all surfaces or
+        one per surface
+    time_zone : float
+        Time zone of the time of the weather data in h
+    orientations : list
+        Orientations of the surfaces in degree (0 is north, 90 east, 180
+        south, 270 west, -1 horizontal roof and -2 ground floor)
+    tilts : list
+        Tilts of the surfaces in degree (0 is horizontal, 90 vertical)
+    albedo : float
+        Reflectance of the ground, default is 0.2
+
+    Returns
+    ----------
+    irradiation : np.array
+        Numpy array of shape (number of hours, number of surfaces) with the
+        irradiation in W/m2, zero for ground floors
+    """
+
+    time = weather["time"] - 1800
+    day = np.floor(time / 86400) + 1
+    day_angle = 2 * math.pi * (day - 1) / 365
+    declination = (
+        0.006918 - 0.399912 * np.cos(day_angle) +
+        0.070257 * np.sin(day_angle) -
+        0.006758 * np.cos(2 * day_angle) +
+        0.000907 * np.sin(2 * day_angle) -
+        0.002697 * np.cos(3 * day_angle) +
+        0.00148 * np.sin(3 * day_angle))
+    equation_of_time = 229.18 * (
+        0.000075 + 0.001868 * np.cos(day_angle) -
+        0.032077 * np.sin(day_angle) -
+        0.014615 * np.cos(2 * day_angle) -
+        0.04089 * np.sin(2 * day_angle))
+
+    orientations = np.asarray(orientations, dtype=float)
+    longitude = np.asarray(longitude, dtype=float) * np.ones(
+        orientations.shape)
+    phi = np.radians(np.asarray(latitude, dtype=float) * np.ones(
+        orientations.shape))[None, :]
+    solar_time = ((time % 86400) / 3600)[:, None] + (
+        4 * (longitude[None, :] - 15 * time_zone) +
+        equation_of_time[:, None]) / 60
+    hour_angle = np.radians(15 * (solar_time - 12))
+
+    sin_delta = np.sin(declination)[:, None]
+    cos_delta = np.cos(declination)[:, None]
+    cos_omega = np.cos(hour_angle)
+    sin_omega = np.sin(hour_angle)
+    cos_zenith = (np.sin(phi) * sin_delta + np.cos(phi) * cos_delta *
+                  cos_omega)
+
+    tilts = np.where(orientations == -1, 0.0, np.asarray(tilts, dtype=float))
+    beta = np.radians(tilts)[None, :]
+    gamma = np.radians(orientations - 180)[None, :]
+
+    cos_incidence = (
+        sin_delta * np.sin(phi) * np.cos(beta) -
+        sin_delta * np.cos(phi) * np.sin(beta) * np.cos(gamma) +
+        cos_delta * np.cos(phi) * np.cos(beta) * cos_omega +
+        cos_delta * np.sin(phi) * np.sin(beta) * np.cos(gamma) *
+        cos_omega +
+        cos_delta * np.sin(beta) * np.sin(gamma) * sin_omega)
+
+    direct = weather["irr_direct_normal"][:, None] * np.where(
+        cos_zenith > 0, np.maximum(cos_incidence, 0), 0)
+    diffuse = weather["irr_diffuse_horizontal"][:, None] * (
+        1 + np.cos(beta)) / 2
+    reflected = albedo * weather["irr_global_horizontal"][:, None] * (
+        1 - np.cos(beta)) / 2
+
+    return np.where(orientations == -2, 0.0, direct + diffuse + reflected)
+
+
+def calc_surface_irradiation(
+        weather_file_path,
+        surfaces,
+        time_zone=None,
+        albedo=ALBEDO):
+    """Irradiation on the unique surfaces of a set of surfaces, cached.
+
+    Parameters
+    ----------
+    weather_file_path : str
+        Path to the weather file in Modelica .mos format
+    surfaces : np.array
+        Numpy array of shape (number of surfaces, 4) with latitude and
+        longitude in degree, orientation and tilt in degree of each surface
+        (see calc_irradiation())
+    time_zone : float
+        Time zone of the weather data in h, default is None, which uses the
+        time zone of the #LOCATION line of the weather file
+    albedo : float
+        Reflectance of the ground, default is 0.2
+
+    Returns
+    ----------
+    irradiation : np.array
+        Read-only numpy array of shape (number of hours, number of unique
+        surfaces) with the irradiation in W/m2
+    index : np.array
+        Column of irradiation of each surface
+    """
+
+    if time_zone is None:
+        time_zone = weather_input.load_location(
+            weather_file_path)["time_zone"]
+    surfaces = np.asarray(surfaces, dtype=float).reshape(-1, 4)
+    unique, index = np.unique(surfaces, axis=0, return_inverse=True)
+    index = index.reshape(-1)
+
+    key = (
+        os.path.abspath(weather_file_path),
+        tuple(catalog_cache.get_fingerprint(weather_file_path)),
+        float(time_zone),
+        float(albedo),
+        unique.tobytes())
+    irradiation = _irradiation_cache.get(key)
+    if irradiation is None:
+        irradiation = calc_irradiation(
+            weather=weather_input.load_weather(weather_file_path),
+            latitude=unique[:, 0],
+            longitude=unique[:, 1],
+            time_zone=time_zone,
+            orientations=unique[:, 2],
+            tilts=unique[:, 3],
+            albedo=albedo)
+        irradiation.flags.writeable = False
+        _irradiation_cache[key] = irradiation
+        while len(_irradiation_cache) > IRRADIATION_CACHE_SIZE:
+            _irradiation_cache.popitem(last=False)
+    else:
+        _irradiation_cache.move_to_end(key)
+    return irradiation, index
+
+
+def collect_zone_surfaces(thermal_zones):
+    """Surfaces of the irradiation of the zone models of thermal zones.
+
+    Parameters
+    ----------
+    thermal_zones : list
+        List of calculated TEASER instances of ThermalZone
+
+    Returns
+    ----------
+    surfaces : np.array
+        Numpy array of shape (number of surfaces, 4) with latitude,
+        longitude, orientation and tilt of the facades (orientation_facade)
+        and rooftops (orientation_rt, if the model has them) of all zones
+    offsets : np.array
+        Rows of the surfaces of zone i are offsets[i]:offsets[i + 1]
+    """
+
+    surfaces = []
+    offsets = [0]
+    for zone in thermal_zones:
+        model = zone.model_attr
+        building = zone.parent
+        orientations = list(model.orientation_facade)
+        tilts = list(model.tilt_facade)
+        if hasattr(model, "orientation_rt"):
+            orientations += list(model.orientation_rt)
+            tilts += list(model.tilt_rt)
+        surfaces += [
+            (building.latitude, building.longitude, orientation, tilt)
+            for orientation, tilt in zip(orientations, tilts)]
+        offsets.append(len(surfaces))
+    return (np.array(surfaces, dtype=float).reshape(-1, 4),
+            np.array(offsets, dtype=int))
+
+
+def calc_zone_irradiation(
+        thermal_zones,
+        weather_file_path,
+        time_zone=None,
+        albedo=ALBEDO):
+    """Irradiation on the surfaces of the zone models of thermal zones.
+
+    The irradiation of all unique surfaces of the zones is calculated once
+    (see calc_surface_irradiation()).
+
+    Parameters
+    ----------
+    thermal_zones : list
+        List of calculated TEASER instances of ThermalZone
+    weather_file_path : str
+        Path to the weather file in Modelica .mos format
+    time_zone : float
+        Time zone of the weather data in h, default is None, which uses the
+        time zone of the weather file
+    albedo : float
+        Reflectance of the ground, default is 0.2
+
+    Returns
+    ----------
+    irradiation : np.array
+        Numpy array of shape (number of hours, number of unique surfaces)
+        with the irradiation in W/m2
+    zone_index : list
+        List with one array per zone with the columns of irradiation of the
+        facades (orientation_facade) followed by the rooftops
+        (orientation_rt) of the zone model
+    """
+
+    surfaces, offsets = collect_zone_surfaces(thermal_zones)
+    irradiation, index = calc_surface_irradiation(
+        weather_file_path=weather_file_path,
+        surfaces=surfaces,
+        time_zone=time_zone,
+        albedo=albedo)
+    return irradiation, [index[offsets[count]:offsets[count + 1]]
+                         for count in range(len(thermal_zones))]
+
+
+def clear_irradiation_cache():
+    """Removes all irradiation of calc_surface_irradiation() from memory."""
+    _irradiation_cache.clear()
@@ -0,0 +1,334 @@
+# created October 2026
+
+"""Batched state space simulation of the zone models of many buildings.
+
+The thermal networks of vdi6007.calc_network() are translated into the
+continuous state space form dx/dt = A x + B u. The surface nodes have no
+heat capacity, their temperatures are an algebraic function of the
+capacity nodes and the inputs and are eliminated (Kron reduction), the
+states are the air temperature (first state) and the temperatures of the
+capacities of the walls. For a time step dt with inputs held constant over
+the step (zero order hold), the exact discrete time form is
+
+    x[k+1] = exp(A dt) x[k] + A^-1 (exp(A dt) - I) B u[k+1]
+
+which is obtained from the matrix exponential of the augmented matrix
+[[A, B], [0, 0]] dt. The matrix exponentials of all zones are calculated
+at once with numpy (scaling and squaring with the [13/13] Pade
+approximant, Higham 2005), the zones are then stepped together with
+vdi6007.simulate_discrete(). Unlike the implicit Euler method of
+vdi6007.simulate_zones(), the discretization has no truncation error for
+inputs that are constant within each hour.
+"""
+
+import collections
+import numpy as np
+import teaser.data.input.weather_input as weather_input
+import teaser.logic.simulation.solar as solar
+import teaser.logic.simulation.vdi6007 as vdi6007
+
+PADE_COEFFICIENTS = (
+    64764752532480000.,
+    32382376266240000.,
+    7771770303897600.,
+    1187353796428800.,
+    129060195264000.,
+    10559470521600.,
+    670442572800.,
+    33522128640.,
+    1323241920.,
+    40840800.,
+    960960.,
+    16380.,
+    182.,
+    1.)
+
+THETA_13 = 5.371920351148152
+
+
+def expm(matrices):
+    """Matrix exponential of a stack of square matrices.
+
+    Parameters
+    ----------
+    matrices : np.array
+        Numpy array of shape (..., n, n)
+
+    Returns
+    ----------
+    exponential : np.array
+        Numpy array of shape (..., n, n) with the matrix exponential of each
+        matrix
+    """
+
+    matrices = np.asarray(matrices, dtype=float)
+    shape = matrices.shape
+    matrices = matrices.reshape((-1,) + shape[-2:])
+
+    norm = np.abs(matrices).sum(axis=-2).max(axis=-1)
+    squarings = np.zeros(len(matrices), dtype=int)
+    large = norm > THETA_13
+    squarings[large] = np.ceil(np.log2(norm[large] / THETA_13)).astype(int)
+    scaled = matrices / (2.0 ** squarings)[:, None, None]
+
+    b = PADE_COEFFICIENTS
+    identity = np.broadcast_to(np.eye(shape[-1]), scaled.shape)
+    a_2 = np.matmul(scaled, scaled)
+    a_4 = np.matmul(a_2, a_2)
+    a_6 = np.matmul(a_4, a_2)
+    odd = np.matmul(scaled, np.matmul(
+        a_6, b[13] * a_6 + b[11] * a_4 + b[9] * a_2) +
+        b[7] * a_6 + b[5] * a_4 + b[3] * a_2 + b[1] * identity)
+    even = np.matmul(a_6, b[12] * a_6 + b[10] * a_4 + b[8] * a_2) + \
+        b[6] * a_6 + b[4] * a_4 + b[2] * a_2 + b[0] * identity
+    exponential = np.linalg.solve(even - odd, even + odd)
+
+    for count in range(squarings.max(initial=0)):
+        square = squarings > count
+        exponential[square] = np.matmul(
+            exponential[square], exponential[square])
+
+    return exponential.reshape(shape)
+
+
+def calc_state_space(network):
+    """Continuous state space form of a thermal network.
+
+    Parameters
+    ----------
+    network : dict
+        Thermal network as returned by vdi6007.calc_network()
+
+    Returns
+    ----------
+    state_matrix : np.array
+        Matrix A in 1/s of dx/dt = A x + B u, one state per node with heat
+        capacity, the first state is the air temperature
+    input_matrix : np.array
+        Matrix B in K/s (heat flows W/J), one column per entry of
+        vdi6007.INPUTS
+    """
+
+    capacity = network["capacity"]
+    conductance = network["conductance"]
+    inputs = network["input_matrix"]
+    mass = np.flatnonzero(capacity > 0)
+    surface = np.flatnonzero(capacity <= 0)
+
+    reduced = conductance[np.ix_(mass, mass)]
+    reduced_inputs = inputs[mass]
+    if len(surface) > 0:
+        coupling = conductance[np.ix_(mass, surface)]
+        solved = np.linalg.solve(
+            conductance[np.ix_(surface, surface)],
+            np.hstack((conductance[np.ix_(surface, mass)], inputs[surface])))
+        reduced = reduced - np.dot(coupling, solved[:, :len(mass)])
+        reduced_inputs = reduced_inputs - np.dot(
+            coupling, solved[:, len(mass):])
+
+    state_matrix = -reduced / capacity[mass][:, None]
+    input_matrix = reduced_inputs / capacity[mass][:, None]
+    return state_matrix, input_matrix
+
+
+def discretize_state_space(state_matrix, input_matrix, time_step=3600):
+    """Discrete time form of state space systems (zero order hold).
+
+    Parameters
+    ----------
+    state_matrix : np.array
+        Numpy array of shape (..., n, n) with the continuous state matrices
+    input_matrix : np.array
+        Numpy array of shape (..., n, m) with the continuous input matrices
+    time_step : float
+        Time step in s, default is 3600
+
+    Returns
+    ----------
+    state_matrix : np.array
+        Matrices A of x[k+1] = A x[k] + B u[k+1], shape (..., n, n)
+    input_matrix : np.array
+        Matrices B, shape (..., n, m)
+    """
+
+    state_matrix = np.asarray(state_matrix, dtype=float)
+    input_matrix = np.asarray(input_matrix, dtype=float)
+    nr_of_states = state_matrix.shape[-1]
+    size = nr_of_states + input_matrix.shape[-1]
+    augmented = np.zeros(state_matrix.shape[:-2] + (size, size))
+    augmented[..., :nr_of_states, :nr_of_states] = state_matrix * time_step
+    augmented[..., :nr_of_states, nr_of_states:] = input_matrix * time_step
+    exponential = expm(augmented)
+    return (exponential[..., :nr_of_states, :nr_of_states],
+            exponential[..., :nr_of_states, nr_of_states:])
+
+
+def simulate_chunks(
+        buildings,
+        weather_file_path=None,
+        time_zone=None,
+        time_step=3600,
+        chunk_size=256):
+    """Hourly simulation of the thermal zones of many buildings in chunks.
+
+    The zones are processed in chunks of whole buildings with at least
+    chunk_size zones (except for the last chunk): the state space forms of
+    the zones of a chunk are stacked (padded with zeros), discretized at
+    once and stepped together over the weather data with ideal heating and
+    cooling (see vdi6007.simulate_discrete()). The results of each chunk
+    are yielded, thus only the results of one chunk are held in memory.
+
+    Parameters
+    ----------
+    buildings : Project(), Building() or list
+        Project, building or list of calculated TEASER instances of Building
+    weather_file_path : str
+        Path to the weather file in Modelica .mos format, default is None,
+        which uses Project.weather_file_path of the first building
+    time_zone : float
+        Time zone of the weather data in h, default is None, which uses the
+        time zone of the #LOCATION line of the weather file
+    time_step : float
+        Time step of the weather data in s, default is 3600
+    chunk_size : int
+        Minimal number of zones that are simulated together, limits the
+        memory of the inputs (number of hours x chunk_size x number of
+        states)
+
+    Yields
+    ----------
+    chunk : collections.OrderedDict
+        Dictionary with the time of the weather data in s (time), the number
+        of zones of all buildings (nr_of_zones), the building_index and
+        zone_position of the zones of the chunk, the position of the first
+        and behind the last zone of the chunk among the zones of all
+        buildings (start, stop) and numpy
+        arrays of shape (number of hours, number of zones of the chunk) with
+        the air temperature in K (t_air) and the ideal load in W
+        (ideal_load, positive for heating and negative for cooling)
+    """
+
+    if hasattr(buildings, "buildings"):
+        buildings = buildings.buildings
+    elif hasattr(buildings, "thermal_zones"):
+        buildings = [buildings]
+
+    zones = [(building_index, zone_position, zone)
+             for building_index, bldg in enumerate(buildings)
+             for zone_position, zone in enumerate(bldg.thermal_zones)]
+    if not zones:
+        raise ValueError("No thermal zones to simulate")
+
+    if weather_file_path is None:
+        weather_file_path = buildings[0].parent.weather_file_path
+    weather = weather_input.load_weather(weather_file_path)
+    if time_zone is None:
+        time_zone = weather_input.load_location(
+            weather_file_path)["time_zone"]
+
+    irradiation, zone_index = solar.calc_zone_irradiation(
+        thermal_zones=[zone for building_index, zone_position, zone in zones],
+        weather_file_path=weather_file_path,
+        time_zone=time_zone)
+
+    start = 0
+    while start < len(zones):
+        stop = min(start + chunk_size, len(zones))
+        # chunks end at the last zone of a building
+        while stop < len(zones) and zones[stop][1] != 0:
+            stop += 1
+        thermal_zones = [zone for building_index, zone_position, zone
+                         in zones[start:stop]]
+        continuous = [calc_state_space(vdi6007.calc_network(zone))
+                      for zone in thermal_zones]
+        state_matrix, input_matrix = discretize_state_space(
+            state_matrix=vdi6007.stack_matrices(
+                [matrices[0] for matrices in continuous]),
+            input_matrix=vdi6007.stack_matrices(
+                [matrices[1] for matrices in continuous]),
+            time_step=time_step)
+        t_air, ideal_load = vdi6007.simulate_discrete(
+            thermal_zones=thermal_zones,
+            state_matrix=state_matrix,
+            input_matrix=input_matrix,
+            weather=weather,
+            time_zone=time_zone,
+            irradiation=[irradiation[:, index]
+                         for index in zone_index[start:stop]])
+
+        chunk = collections.OrderedDict()
+        chunk["time"] = weather["time"]
+        chunk["nr_of_zones"] = len(zones)
+        chunk["building_index"] = np.array(
+            [building_index for building_index, zone_position, zone
+             in zones[start:stop]], dtype=int)
+        chunk["zone_position"] = np.array(
+            [zone_position for building_index, zone_position, zone
+             in zones[start:stop]], dtype=int)
+        chunk["start"] = start
+        chunk["stop"] = stop
+        chunk["t_air"] = t_air
+        chunk["ideal_load"] = ideal_load
+        yield chunk
+        start = stop
+
+
+def simulate_buildings(
+        buildings,
+        weather_file_path=None,
+        time_zone=None,
+        time_step=3600,
+        chunk_size=256):
+    """Hourly simulation of all thermal zones of many buildings.
+
+    See simulate_chunks(), the results of all chunks are combined.
+
+    Parameters
+    ----------
+    buildings : Project(), Building() or list
+        Project, building or list of calculated TEASER instances of Building
+    weather_file_path : str
+        Path to the weather file in Modelica .mos format, default is None,
+        which uses Project.weather_file_path of the first building
+    time_zone : float
+        Time zone of the weather data in h, default is None, which uses the
+        time zone of the #LOCATION line of the weather file
+    time_step : float
+        Time step of the weather data in s, default is 3600
+    chunk_size : int
+        Minimal number of zones that are simulated together
+
+    Returns
+    ----------
+    results : collections.OrderedDict
+        Dictionary with the time of the weather data in s (time), numpy
+        arrays of shape (number of hours, number of zones) with the air
+        temperature in K (t_air) and the ideal heating and cooling loads in
+        W (heating_load, cooling_load, both positive), with the zones of all
+        buildings in order, and building_index and zone_position of each
+        zone (see heat_load.collect_heat_load_inputs())
+    """
+
+    results = collections.OrderedDict()
+    for chunk in simulate_chunks(
+            buildings=buildings,
+            weather_file_path=weather_file_path,
+            time_zone=time_zone,
+            time_step=time_step,
+            chunk_size=chunk_size):
+        if not results:
+            shape = (len(chunk["time"]), chunk["nr_of_zones"])
+            results["time"] = chunk["time"]
+            results["t_air"] = np.empty(shape)
+            results["heating_load"] = np.empty(shape)
+            results["cooling_load"] = np.empty(shape)
+            results["building_index"] = np.empty(shape[1], dtype=int)
+            results["zone_position"] = np.empty(shape[1], dtype=int)
+        zones = slice(chunk["start"], chunk["stop"])
+        results["t_air"][:, zones] = chunk["t_air"]
+        results["heating_load"][:, zones] = np.maximum(chunk["ideal_load"], 0)
+        results["cooling_load"][:, zones] = np.maximum(
+            -chunk["ideal_load"], 0)
+        results["building_index"][zones] = chunk["building_index"]
+        results["zone_position"][zones] = chunk["zone_position"]
+    return results
@@ -0,0 +1,507 @@
+# created October 2026
+
+"""Time domain simulation of the reduced order zone models (VDI 6007).
+
+The one to four element models of the thermal zones (model_attr of
+ThermalZone) are simulated with hourly time steps without Modelica. Each
+zone model is translated into a linear thermal network of the air node, the
+capacity and inner surface node of each wall type (outer walls, inner
+walls, ground floors and rooftops, depending on the number of elements) and
+the inner surface node of the windows, following the structure of the
+AixLib ReducedOrder models:
+
+- capacity nodes are connected to their surface node by R1 and to the
+  equivalent outdoor temperature (outer walls, rooftops) or the ground
+  temperature (ground floors) by the remaining resistance and the outer
+  coefficient of heat transfer
+- windows are connected to the equivalent outdoor temperature of windows by
+  R1 of the windows and the outer coefficient of heat transfer
+- surface nodes are connected convectively to the air node and by
+  radiation to each other (minimal area of each pair times
+  alpha_rad_inner_mean)
+- infiltration connects the air node to the outdoor air temperature
+
+Solar gains through the windows and internal gains of persons, machines
+and lighting are split into a convective part at the air node and a
+radiative part distributed over the surfaces by area. The network is
+integrated with the implicit Euler method, the state of the next step is a
+linear function of the current state and the inputs. Ideal heating and
+cooling keep the air temperature within the heating and cooling set points
+of UseConditions.schedules: as the network is linear, the heat flow that
+reaches the set point at the end of a step is calculated directly from the
+free floating air temperature.
+
+The equivalent outdoor temperatures are calculated as in VDI 6007 from the
+outdoor air temperature, the long wave radiation of the sky and the solar
+irradiation on the orientations of the zone model (isotropic sky, see
+solar.calc_irradiation()). Shading (g_sunblind), moisture and air handling
+units are not considered.
+"""
+
+import collections
+import math
+import numpy as np
+import teaser.data.input.weather_input as weather_input
+import teaser.logic.simulation.solar as solar
+
+SIGMA = 5.670374419e-8
+"""Stefan-Boltzmann constant in W/(m2*K4)"""
+
+INPUTS = (
+    "t_eq_wall",
+    "t_eq_win",
+    "t_eq_roof",
+    "t_ground",
+    "t_outside",
+    "q_conv",
+    "q_rad")
+
+WALL_TYPES = (
+    ("ow", "t_eq_wall"),
+    ("iw", None),
+    ("gf", "t_ground"),
+    ("rt", "t_eq_roof"))
+
+
+def _conductance(*resistances):
+    """Conductance of resistances in series, zero if one is not finite."""
+    try:
+        resistance = sum(resistances)
+        conductance = 1 / resistance
+    except (ZeroDivisionError, TypeError):
+        return 0.0
+    if not math.isfinite(conductance) or conductance < 0:
+        return 0.0
+    return conductance
+
+
+def _wall_types(model):
+    """Suffixes of the wall types of a zone model."""
+    return [
+        (suffix, boundary) for suffix, boundary in WALL_TYPES
+        if hasattr(model, "r1_" + suffix)]
+
+
+def calc_network(thermal_zone):
+    """Thermal network of the zone model of a thermal zone.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone()
+        Calculated TEASER instance of ThermalZone
+
+    Returns
+    ----------
+    network : collections.OrderedDict
+        Dictionary with the names of the nodes (nodes, the first node is the
+        air node), the heat capacity of each node in J/K (capacity, zero
+        for surface nodes), the conductance matrix in W/K (conductance,
+        positive conductances to the boundaries on the diagonal) and the
+        matrix of the inputs (input_matrix, one column per entry of INPUTS)
+    """
+
+    model = thermal_zone.model_attr
+    if model is None:
+        raise ValueError(
+            "Thermal zone " + str(thermal_zone.name) + " is not calculated, "
+            "call calc_zone_parameters() first")
+
+    nodes = ["air"]
+    capacity = [thermal_zone.volume * thermal_zone.density_air *
+                thermal_zone.heat_capac_air]
+    links = []
+    boundaries = []
+    surfaces = []
+
+    def _add_node(name, node_capacity):
+        nodes.append(name)
+        capacity.append(node_capacity)
+        return len(nodes) - 1
+
+    for suffix, boundary in _wall_types(model):
+        area = getattr(model, "area_" + suffix)
+        if not area > 0 or not getattr(model, "c1_" + suffix) > 0:
+            continue
+        mass = _add_node("c1_" + suffix, getattr(model, "c1_" + suffix))
+        surface = _add_node("surface_" + suffix, 0.0)
+        surfaces.append((surface, area))
+        links.append((mass, surface, _conductance(
+            getattr(model, "r1_" + suffix))))
+        links.append((surface, 0, getattr(
+            model, "alpha_conv_inner_" + suffix) * area))
+        if suffix == "gf":
+            boundaries.append((mass, boundary, _conductance(
+                model.r_rest_gf)))
+        elif boundary is not None:
+            boundaries.append((mass, boundary, _conductance(
+                getattr(model, "r_rest_" + suffix), 1 / (getattr(
+                    model, "alpha_comb_outer_" + suffix) * area))))
+
+    if model.area_win > 0:
+        surface = _add_node("surface_win", 0.0)
+        surfaces.append((surface, model.area_win))
+        links.append((surface, 0, model.alpha_conv_inner_win *
+                      model.area_win))
+        boundaries.append((surface, "t_eq_win", _conductance(
+            model.r1_win, 1 / (model.alpha_comb_outer_win * model.area_win))))
+
+    for i, (surface_i, area_i) in enumerate(surfaces):
+        for surface_j, area_j in surfaces[i + 1:]:
+            links.append((surface_i, surface_j, min(area_i, area_j) *
+                          model.alpha_rad_inner_mean))
+
+    boundaries.append((0, "t_outside", thermal_zone.volume *
+                       thermal_zone.use_conditions.infiltration_rate / 3600 *
+                       thermal_zone.density_air *
+                       thermal_zone.heat_capac_air))
+
+    conductance = np.zeros((len(nodes), len(nodes)))
+    for i, j, value in links:
+        conductance[i, j] -= value
+        conductance[j, i] -= value
+        conductance[i, i] += value
+        conductance[j, j] += value
+    input_matrix = np.zeros((len(nodes), len(INPUTS)))
+    for i, name, value in boundaries:
+        conductance[i, i] += value
+        input_matrix[i, INPUTS.index(name)] += value
+
+    input_matrix[0, INPUTS.index("q_conv")] = 1.0
+    if surfaces:
+        total_area = sum(area for surface, area in surfaces)
+        for surface, area in surfaces:
+            input_matrix[surface, INPUTS.index("q_rad")] = area / total_area
+    else:
+        input_matrix[0, INPUTS.index("q_rad")] = 1.0
+
+    network = collections.OrderedDict()
+    network["nodes"] = nodes
+    network["capacity"] = np.array(capacity)
+    network["conductance"] = conductance
+    network["input_matrix"] = input_matrix
+    return network
+
+
+def discretize_network(network, time_step=3600):
+    """Discrete time form of a thermal network (implicit Euler).
+
+    Parameters
+    ----------
+    network : dict
+        Thermal network as returned by calc_network()
+    time_step : float
+        Time step in s, default is 3600
+
+    Returns
+    ----------
+    state_matrix : np.array
+        Matrix A of the temperatures of the nodes at the end of a step
+        x[k+1] = A x[k] + B u[k+1]
+    input_matrix : np.array
+        Matrix B, one column per entry of INPUTS
+    """
+
+    capacity = network["capacity"] / time_step
+    system = np.diag(capacity) + network["conductance"]
+    state_matrix = np.linalg.solve(system, np.diag(capacity))
+    input_matrix = np.linalg.solve(system, network["input_matrix"])
+    return state_matrix, input_matrix
+
+
+def calc_inputs(thermal_zone, weather, time_zone, irradiation=None):
+    """Hourly inputs of the thermal network of a thermal zone.
+
+    Parameters
+    ----------
+    thermal_zone : ThermalZone()
+        Calculated TEASER instance of ThermalZone, latitude and longitude
+        are taken from its building
+    weather : dict
+        Weather data as returned by weather_input.load_weather()
+    time_zone : float
+        Time zone of the time of the weather data in h
+    irradiation : np.array
+        Numpy array of shape (number of hours, number of surfaces) with the
+        irradiation in W/m2 on the facades (orientation_facade) followed by
+        the rooftops (orientation_rt) of the zone model, e.g. of
+        solar.calc_zone_irradiation(). Default is None, which calculates
+        the irradiation with solar.calc_irradiation()
+
+    Returns
+    ----------
+    inputs : np.array
+        Numpy array of shape (number of hours, len(INPUTS)) with the
+        temperatures in K and heat flows in W of INPUTS
+    """
+
+    model = thermal_zone.model_attr
+    use_conditions = thermal_zone.use_conditions
+    building = thermal_zone.parent
+
+    nr_of_hours = len(weather["time"])
+    t_outside = weather["temp_dry_bulb"] + 273.15
+    t_sky = np.power(
+        np.maximum(weather["irr_horizontal_infrared"], 0) / SIGMA, 0.25)
+    inputs = np.zeros((nr_of_hours, len(INPUTS)))
+
+    if irradiation is None:
+        orientations = list(model.orientation_facade)
+        tilts = list(model.tilt_facade)
+        if hasattr(model, "orientation_rt"):
+            orientations += list(model.orientation_rt)
+            tilts += list(model.tilt_rt)
+        irradiation = solar.calc_irradiation(
+            weather=weather,
+            latitude=building.latitude,
+            longitude=building.longitude,
+            time_zone=time_zone,
+            orientations=orientations,
+            tilts=tilts)
+    irradiation_facade = irradiation[:, :len(model.orientation_facade)]
+
+    def _t_eq(alpha_rad, alpha_comb, solar_absorp, weightfactors,
+              surface_irradiation):
+        if not alpha_comb > 0:
+            return t_outside
+        t_eq = t_outside + (t_sky - t_outside) * alpha_rad / alpha_comb
+        if solar_absorp is None:
+            return t_eq
+        return np.dot(
+            t_eq[:, None] + surface_irradiation * solar_absorp / alpha_comb,
+            weightfactors)
+
+    inputs[:, INPUTS.index("t_eq_wall")] = _t_eq(
+        model.alpha_rad_outer_ow, model.alpha_comb_outer_ow,
+        model.solar_absorp_ow, np.asarray(model.weightfactor_ow),
+        irradiation_facade) + model.weightfactor_ground * \
+        thermal_zone.t_ground
+    inputs[:, INPUTS.index("t_eq_win")] = _t_eq(
+        model.alpha_rad_outer_win, model.alpha_comb_outer_win, None, None,
+        None)
+    if hasattr(model, "orientation_rt"):
+        inputs[:, INPUTS.index("t_eq_roof")] = _t_eq(
+            model.alpha_rad_outer_rt, model.alpha_comb_outer_rt,
+            model.solar_absorp_rt, np.asarray(model.weightfactor_rt),
+            irradiation[:, len(model.orientation_facade):])
+    inputs[:, INPUTS.index("t_ground")] = thermal_zone.t_ground
+    inputs[:, INPUTS.index("t_outside")] = t_outside
+
+    solar_gains = model.weighted_g_value * np.dot(
+        irradiation_facade, np.asarray(model.transparent_areas))
+
+    def _profile(name):
+        return np.resize(
+            np.asarray(use_conditions.schedules[name], dtype=float),
+            nr_of_hours)
+
+    persons = (use_conditions.persons * thermal_zone.area *
+               use_conditions.fixed_heat_flow_rate_persons *
+               _profile("persons_profile"))
+    machines = (use_conditions.machines * thermal_zone.area *
+                _profile("machines_profile"))
+    lighting = (use_conditions.lighting_power * thermal_zone.area *
+                _profile("lighting_profile"))
+
+    inputs[:, INPUTS.index("q_conv")] = (
+        model.ratio_conv_rad_inner_win * solar_gains +
+        use_conditions.ratio_conv_rad_persons * persons +
+        use_conditions.ratio_conv_rad_machines * machines +
+        use_conditions.ratio_conv_rad_lighting * lighting)
+    inputs[:, INPUTS.index("q_rad")] = (
+        (1 - model.ratio_conv_rad_inner_win) * solar_gains +
+        (1 - use_conditions.ratio_conv_rad_persons) * persons +
+        (1 - use_conditions.ratio_conv_rad_machines) * machines +
+        (1 - use_conditions.ratio_conv_rad_lighting) * lighting)
+    return inputs
+
+
+def stack_matrices(matrices):
+    """Stacks matrices of several zones, padded with zeros.
+
+    Parameters
+    ----------
+    matrices : list
+        List of numpy arrays of shape (number of nodes, number of columns)
+        with the same number of columns or, if the number of columns is the
+        number of nodes of each matrix, square matrices
+
+    Returns
+    ----------
+    stacked : np.array
+        Numpy array of shape (number of matrices, maximum number of nodes,
+        maximum number of columns)
+    """
+
+    nr_of_rows = max(matrix.shape[0] for matrix in matrices)
+    nr_of_columns = max(matrix.shape[1] for matrix in matrices)
+    stacked = np.zeros((len(matrices), nr_of_rows, nr_of_columns))
+    for count, matrix in enumerate(matrices):
+        stacked[count, :matrix.shape[0], :matrix.shape[1]] = matrix
+    return stacked
+
+
+def simulate_discrete(
+        thermal_zones,
+        state_matrix,
+        input_matrix,
+        weather,
+        time_zone,
+        irradiation=None):
+    """Steps discrete time networks of several zones with ideal loads.
+
+    The state of each zone of the next hour is x[k+1] = A x[k] + B u[k+1],
+    with the inputs u of INPUTS (see calc_inputs()) and the air temperature
+    as first state. The ideal heating or cooling load is added to q_conv
+    such that the air temperature at the end of each hour stays within the
+    heating and cooling set points of UseConditions.schedules. All states
+    start at ThermalZone.t_inside.
+
+    Parameters
+    ----------
+    thermal_zones : list
+        List of calculated TEASER instances of ThermalZone
+    state_matrix : np.array
+        Numpy array of shape (number of zones, number of states, number of
+        states) with the state matrix A of each zone, padded with zeros
+    input_matrix : np.array
+        Numpy array of shape (number of zones, number of states,
+        len(INPUTS)) with the input matrix B of each zone
+    weather : dict
+        Weather data as returned by weather_input.load_weather()
+    time_zone : float
+        Time zone of the time of the weather data in h
+    irradiation : list
+        List with the irradiation of the surfaces of each zone (see
+        calc_inputs()), default is None, which calculates the irradiation of
+        each zone
+
+    Returns
+    ----------
+    t_air : np.array
+        Numpy array of shape (number of hours, number of zones) with the air
+        temperature in K
+    ideal_load : np.array
+        Numpy array of shape (number of hours, number of zones) with the
+        ideal heating (positive) and cooling (negative) load in W
+    """
+
+    nr_of_hours = len(weather["time"])
+    nr_of_zones, nr_of_states = state_matrix.shape[:2]
+    forcing = np.empty((nr_of_hours, nr_of_zones, nr_of_states))
+    heating = np.empty((nr_of_hours, nr_of_zones))
+    cooling = np.empty((nr_of_hours, nr_of_zones))
+    states = np.zeros((nr_of_zones, nr_of_states))
+
+    for count, zone in enumerate(thermal_zones):
+        forcing[:, count] = np.dot(
+            calc_inputs(zone, weather, time_zone=time_zone, irradiation=None
+                        if irradiation is None else irradiation[count]),
+            input_matrix[count].T)
+        use_conditions = zone.use_conditions
+        heating[:, count] = np.resize(np.asarray(
+            use_conditions.schedules["heating_profile"], dtype=float),
+            nr_of_hours) if use_conditions.with_heating else -np.inf
+        cooling[:, count] = np.resize(np.asarray(
+            use_conditions.schedules["cooling_profile"], dtype=float),
+            nr_of_hours) if use_conditions.with_cooling else np.inf
+        states[count] = zone.t_inside
+    heater = input_matrix[:, :, INPUTS.index("q_conv")]
+
+    t_air = np.empty((nr_of_hours, nr_of_zones))
+    ideal_load = np.empty((nr_of_hours, nr_of_zones))
+    for hour in range(nr_of_hours):
+        states = np.matmul(state_matrix, states[:, :, None])[:, :, 0] + \
+            forcing[hour]
+        t_free = states[:, 0]
+        load = (np.clip(t_free, heating[hour], cooling[hour]) - t_free) / \
+            heater[:, 0]
+        states += heater * load[:, None]
+        t_air[hour] = states[:, 0]
+        ideal_load[hour] = load
+
+    return t_air, ideal_load
+
+
+def simulate_zones(thermal_zones, weather_file_path=None, time_zone=None):
+    """Hourly simulation of several thermal zones with ideal heating.
+
+    The networks of all zones are discretized with discretize_network() and
+    stepped together with simulate_discrete().
+
+    Parameters
+    ----------
+    thermal_zones : list
+        List of calculated TEASER instances of ThermalZone
+    weather_file_path : str
+        Path to the weather file in Modelica .mos format, default is None,
+        which uses Project.weather_file_path of the first zone
+    time_zone : float
+        Time zone of the weather data in h, default is None, which uses the
+        time zone of the #LOCATION line of the weather file
+
+    Returns
+    ----------
+    results : collections.OrderedDict
+        Dictionary with the time of the weather data in s (time) and numpy
+        arrays of shape (number of hours, number of zones) with the air
+        temperature in K (t_air) and the ideal heating and cooling loads in
+        W (heating_load, cooling_load, both positive)
+    """
+
+    if weather_file_path is None:
+        weather_file_path = thermal_zones[0].parent.parent.weather_file_path
+    weather = weather_input.load_weather(weather_file_path)
+    if time_zone is None:
+        time_zone = weather_input.load_location(
+            weather_file_path)["time_zone"]
+
+    discrete = [discretize_network(calc_network(zone))
+                for zone in thermal_zones]
+    irradiation, zone_index = solar.calc_zone_irradiation(
+        thermal_zones=thermal_zones,
+        weather_file_path=weather_file_path,
+        time_zone=time_zone)
+    t_air, ideal_load = simulate_discrete(
+        thermal_zones=thermal_zones,
+        state_matrix=stack_matrices([matrices[0] for matrices in discrete]),
+        input_matrix=stack_matrices([matrices[1] for matrices in discrete]),
+        weather=weather,
+        time_zone=time_zone,
+        irradiation=[irradiation[:, index] for index in zone_index])
+
+    results = collections.OrderedDict()
+    results["time"] = weather["time"]
+    results["t_air"] = t_air
+    results["heating_load"] = np.maximum(ideal_load, 0)
+    results["cooling_load"] = np.maximum(-ideal_load, 0)
+    return results
+
+
+def simulate_building(building, weather_file_path=None, time_zone=None):
+    """Hourly simulation of all thermal zones of a building.
+
+    See simulate_zones(), the results have one column per zone of
+    Building.thermal_zones.
+
+    Parameters
+    ----------
+    building : Building()
+        Calculated TEASER instance of Building
+    weather_file_path : str
+        Path to the weather file in Modelica .mos format, default is None,
+        which uses Project.weather_file_path
+    time_zone : float
+        Time zone of the weather data in h, default is None, which uses the
+        time zone of the weather file
+
+    Returns
+    ----------
+    results : collections.OrderedDict
+        Dictionary with time, t_air, heating_load and cooling_load, see
+        simulate_zones()
+    """
+
+    return simulate_zones(
+        thermal_zones=building.thermal_zones,
+        weather_file_path=weather_file_path,
+        time_zone=time_zone)
@@ -62,6 +62,16 @@ def get_default_path():
     return teaser_default_path
 
 
+def get_default_cache_path():
+    """Function to construct default path to the cache folder
+    This function constructs the default path to the folder of precompiled
+    catalogs, which lies next to the OutputData folder
+
+    """
+
+    return os.path.join(os.path.dirname(get_default_path()), 'TEASERCache')
+
+
 def get_full_path(rel_path):
     """Helperfunction to construct pathes to files within teaser.
 
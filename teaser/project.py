@@ -8,6 +8,12 @@ import teaser.data.input.teaserjson_input as tjson_in
 import teaser.data.output.teaserjson_output as tjson_out
 import teaser.data.output.aixlib_output as aixlib_output
 import teaser.data.output.ibpsa_output as ibpsa_output
+import teaser.logic.buildingobjects.calculation.parallel as parallel
+import teaser.logic.buildingobjects.calculation.heat_load as heat_load
+import teaser.logic.buildingobjects.calculation.monthly_demand as \
+    monthly_demand
+import teaser.logic.simulation.statespace as statespace
+import teaser.logic.simulation.ideal_loads as ideal_loads
 from teaser.data.dataclass import DataClass
 from teaser.logic.archetypebuildings.bmvbs.office import Office
 from teaser.logic.archetypebuildings.bmvbs.custom.institute import Institute
@@ -74,6 +80,13 @@ class Project(object):
         List of all buildings in one project, instances of Building()
     data : instance of DataClass
         TEASER instance of DataClass containing JSON binding classes
+    data_classes : dict
+        All DataClass instances of the project by their used_statistic
+        ('iwu', 'tabula_de', 'tabula_dk'), including data. Each building
+        uses the DataClass of the statistic of its archetype method (see
+        get_data_class() and Building.data), thus projects with buildings of
+        several archetype methods keep all type element catalogs loaded side
+        by side.
     weather_file_path : str
         Absolute path to weather file used for Modelica simulation. Default
         weather file can be find in inputdata/weatherdata.
@@ -112,11 +125,44 @@ class Project(object):
         self._merge_windows_calc = False
         self._used_library_calc = "AixLib"
 
+        self.data_classes = {}
         if load_data is True:
             self.data = self.instantiate_data_class()
         else:
             self.data = None
 
+    def get_data_class(self, used_statistic=None):
+        """Return the DataClass of a statistic of type elements.
+
+        The DataClass is created on first use and kept in data_classes. It
+        uses the material and use condition catalogs of data.
+
+        Parameters
+        ----------
+        used_statistic : str
+            Statistic of type elements ('iwu', 'tabula_de' or 'tabula_dk').
+            Default is None, which returns data.
+
+        Returns
+        ----------
+        data_class : DataClass()
+            DataClass of the statistic, None if used_statistic is None and
+            data is not set
+
+        """
+        if used_statistic is None:
+            return self.data
+        if self.data is None:
+            self.data = DataClass(used_statistic=used_statistic)
+            return self.data
+        data_class = self.data_classes.get(used_statistic)
+        if data_class is None:
+            data_class = DataClass(used_statistic=used_statistic)
+            data_class.path_mat = self.data.path_mat
+            data_class.path_uc = self.data.path_uc
+            self.data_classes[used_statistic] = data_class
+        return data_class
+
     @staticmethod
     def instantiate_data_class():
         """Initialization of DataClass
@@ -129,7 +175,7 @@ class Project(object):
         """
         return DataClass()
 
-    def calc_all_buildings(self, raise_errors=False):
+    def calc_all_buildings(self, raise_errors=False, processes=1, chunk_size=None):
         """Calculates values for all project buildings
 
         You need to set the following parameters in the Project class.
@@ -147,30 +193,225 @@ class Project(object):
         used_library_calc : str
             used library (AixLib and IBPSA are supported)
 
+        Buildings that can't be calculated are removed from the buildings
+        list after all buildings are calculated, unless raise_errors is True.
+
+        Parameters
+        ----------
+        raise_errors : bool
+            If True, errors of the calculation are raised and no building is
+            removed, default is False
+        processes : int
+            Number of worker processes used to calculate the buildings,
+            default is 1 (no worker processes). None uses the number of CPUs
+            (see calculation.parallel.calc_buildings())
+        chunk_size : int
+            Number of buildings calculated by a worker process per task,
+            default is None, which gives each worker about four chunks
+
+        Returns
+        ----------
+        failed : list
+            List of tuples (building, error) of all buildings that could not
+            be calculated and were removed from the buildings list
         """
-        if raise_errors is True:
-            for bldg in reversed(self.buildings):
+        if processes != 1:
+            failed = parallel.calc_buildings(
+                project=self,
+                processes=processes,
+                chunk_size=chunk_size,
+                raise_errors=raise_errors,
+            )
+        elif raise_errors is True:
+            for bldg in self.buildings:
                 bldg.calc_building_parameter(
                     number_of_elements=self._number_of_elements_calc,
                     merge_windows=self._merge_windows_calc,
                     used_library=self._used_library_calc,
                 )
+            failed = []
         else:
-            for bldg in reversed(self.buildings):
+            failed = []
+            for bldg in self.buildings:
                 try:
                     bldg.calc_building_parameter(
                         number_of_elements=self._number_of_elements_calc,
                         merge_windows=self._merge_windows_calc,
                         used_library=self._used_library_calc,
                     )
-                except (ZeroDivisionError, TypeError):
-                    warnings.warn(
-                        "Following building can't be calculated and is "
-                        "removed from buildings list. Use raise_errors=True "
-                        "to get python errors and stop TEASER from deleting "
-                        "this building:" + bldg.name
-                    )
-                    self.buildings.remove(bldg)
+                except parallel.CALC_ERRORS as err:
+                    failed.append((bldg, err))
+
+        for bldg, err in failed:
+            warnings.warn(
+                "Following building can't be calculated and is "
+                "removed from buildings list. Use raise_errors=True "
+                "to get python errors and stop TEASER from deleting "
+                "this building:" + bldg.name
+            )
+        failed_bldgs = set(id(bldg) for bldg, err in failed)
+        self.buildings[:] = [
+            bldg for bldg in self.buildings if id(bldg) not in failed_bldgs
+        ]
+        return failed
+
+    def calc_design_heat_loads(self, t_outside=None, infiltration_rate=None):
+        """Calculates the static design heat load of all buildings at once
+
+        Evaluates the static heat load of all zones of all calculated
+        buildings in one vectorized pass (see
+        calculation.heat_load.calc_heat_loads()). Outdoor design temperature
+        and infiltration rate can be overridden per building without
+        changing the buildings, e.g. for buildings in different climate
+        zones or sweeps over several design temperatures.
+
+        Parameters
+        ----------
+        t_outside : float or array
+            Outdoor design temperature in K, one value for all buildings or
+            an array with one value per building in the order of
+            Project.buildings, optionally with leading axes (e.g. shape
+            (n, buildings) for n design temperatures). Default is None,
+            which uses ThermalZone.t_outside
+        infiltration_rate : float or array
+            Infiltration rate in 1/h, given like t_outside. Default is
+            None, which uses the infiltration rate of the use conditions
+
+        Returns
+        ----------
+        building_heat_load : np.array
+            Heat load in W of each building, with the leading axes of the
+            overrides
+        zone_heat_load : np.array
+            Heat load in W of each zone of all buildings, in the order of
+            Project.buildings and Building.thermal_zones
+        """
+        return heat_load.calc_heat_loads(
+            inputs=heat_load.collect_heat_load_inputs(self.buildings),
+            t_outside=t_outside,
+            infiltration_rate=infiltration_rate,
+        )
+
+    def calc_monthly_demands(self, weather_file_path=None, time_zone=None):
+        """Calculates the monthly heating demand of all buildings at once
+
+        Estimates the heating demand of each month of all zones of all
+        calculated buildings with the monthly balance method of ISO 13790
+        (see calculation.monthly_demand.calc_monthly_demands()), without
+        time domain simulation.
+
+        Parameters
+        ----------
+        weather_file_path : str
+            Path to the weather file in Modelica .mos format, default is
+            None, which uses Project.weather_file_path
+        time_zone : float
+            Time zone of the weather data in h, default is None, which uses
+            the time zone of the weather file
+
+        Returns
+        ----------
+        demands : collections.OrderedDict
+            Dictionary with the monthly and annual heating demand in kWh of
+            each zone and building, see
+            monthly_demand.calc_monthly_demands()
+        """
+        if weather_file_path is None:
+            weather_file_path = self.weather_file_path
+        return monthly_demand.calc_monthly_demands(
+            inputs=monthly_demand.collect_monthly_inputs(
+                buildings=self.buildings,
+                weather_file_path=weather_file_path,
+                time_zone=time_zone,
+            )
+        )
+
+    def simulate_all_buildings(
+            self, weather_file_path=None, time_zone=None, chunk_size=256):
+        """Hourly simulation of the zone models of all buildings at once
+
+        Translates the zone model of each thermal zone of all calculated
+        buildings into a state space system, discretizes the systems once
+        with the matrix exponential and steps all zones together over the
+        weather data with ideal heating and cooling (see
+        simulation.statespace.simulate_buildings()).
+
+        Parameters
+        ----------
+        weather_file_path : str
+            Path to the weather file in Modelica .mos format, default is
+            None, which uses Project.weather_file_path
+        time_zone : float
+            Time zone of the weather data in h, default is None, which uses
+            the time zone of the weather file
+        chunk_size : int
+            Number of zones that are simulated together (default 256)
+
+        Returns
+        ----------
+        results : collections.OrderedDict
+            Dictionary with time, building_index and zone_position of each
+            zone and arrays of shape (hours, zones) of t_air, heating_load
+            and cooling_load, with the zones of all buildings in the order
+            of Project.buildings and Building.thermal_zones
+        """
+        if weather_file_path is None:
+            weather_file_path = self.weather_file_path
+        return statespace.simulate_buildings(
+            buildings=self.buildings,
+            weather_file_path=weather_file_path,
+            time_zone=time_zone,
+            chunk_size=chunk_size,
+        )
+
+    def calc_ideal_loads(
+        self,
+        weather_file_path=None,
+        time_zone=None,
+        chunk_size=256,
+        duration_steps=101,
+        hourly=False,
+    ):
+        """Calculates ideal loads, peaks and load duration curves
+
+        Simulates the zone models of all calculated buildings hourly with
+        ideal heating and cooling following UseConditions.schedules and
+        derives annual peaks, demands and load duration curves of each zone,
+        coincident peaks of each building and the hourly total load of the
+        project (see simulation.ideal_loads.calc_ideal_loads()).
+
+        Parameters
+        ----------
+        weather_file_path : str
+            Path to the weather file in Modelica .mos format, default is
+            None, which uses Project.weather_file_path
+        time_zone : float
+            Time zone of the weather data in h, default is None, which uses
+            the time zone of the weather file
+        chunk_size : int
+            Minimal number of zones that are simulated together (default
+            256)
+        duration_steps : int
+            Number of values of the load duration curves (default 101)
+        hourly : bool
+            If True, the hourly loads of all zones are returned as well
+
+        Returns
+        ----------
+        loads : collections.OrderedDict
+            Dictionary with the sizing values of all zones and buildings,
+            see ideal_loads.calc_ideal_loads()
+        """
+        if weather_file_path is None:
+            weather_file_path = self.weather_file_path
+        return ideal_loads.calc_ideal_loads(
+            buildings=self.buildings,
+            weather_file_path=weather_file_path,
+            time_zone=time_zone,
+            chunk_size=chunk_size,
+            duration_steps=duration_steps,
+            hourly=hourly,
+        )
 
     def retrofit_all_buildings(
         self,
@@ -227,7 +468,7 @@ class Project(object):
         iwu_buildings = []
 
         for bldg in self.buildings:
-            if isinstance(bldg, SingleFamilyHouse):
+            if bldg.used_statistic in ["tabula_de", "tabula_dk"]:
                 if type_of_retrofit is None:
                     raise ValueError(
                         "you need to set type_of_retrofit for " "TABULA retrofit"
@@ -238,27 +479,14 @@ class Project(object):
                     raise ValueError("you need to set year_of_retrofit for " "retrofit")
                 iwu_buildings.append(bldg)
 
-        if self.data.used_statistic == "iwu":
-            for bld_iwu in iwu_buildings:
-                bld_iwu.retrofit_building(
-                    year_of_retrofit=year_of_retrofit,
-                    window_type=window_type,
-                    material=material,
-                )
-            self.data = DataClass(used_statistic="tabula_de")
-            for bld_tabula in tabula_buildings:
-                bld_tabula.retrofit_building(type_of_retrofit=type_of_retrofit)
-
-        else:
-            for bld_tabula in tabula_buildings:
-                bld_tabula.retrofit_building(type_of_retrofit=type_of_retrofit)
-            self.data = DataClass(used_statistic="iwu")
-            for bld_iwu in iwu_buildings:
-                bld_iwu.retrofit_building(
-                    year_of_retrofit=year_of_retrofit,
-                    window_type=window_type,
-                    material=material,
-                )
+        for bld_iwu in iwu_buildings:
+            bld_iwu.retrofit_building(
+                year_of_retrofit=year_of_retrofit,
+                window_type=window_type,
+                material=material,
+            )
+        for bld_tabula in tabula_buildings:
+            bld_tabula.retrofit_building(type_of_retrofit=type_of_retrofit)
 
     def add_non_residential(
         self,
@@ -366,8 +594,6 @@ class Project(object):
 
         if self.data is None:
             self.data = DataClass(used_statistic="iwu")
-        elif self.data.used_statistic != "iwu":
-            self.data = DataClass(used_statistic="iwu")
 
         if usage == "office":
 
@@ -588,8 +814,6 @@ class Project(object):
 
             if self.data is None:
                 self.data = DataClass(used_statistic=method)
-            elif self.data.used_statistic != "tabula_de":
-                self.data = DataClass(used_statistic=method)
 
             ass_error_usage_tabula = "only 'single_family_house',"
             "'terraced_house', 'multi_family_house', 'apartment_block' are"
@@ -670,8 +894,6 @@ class Project(object):
 
             if self.data is None:
                 self.data = DataClass(used_statistic=method)
-            elif self.data.used_statistic != "tabula_dk":
-                self.data = DataClass(used_statistic=method)
 
             ass_error_usage_tabula = "only 'single_family_house',"
             "'terraced_house', 'apartment_block' are"
@@ -734,8 +956,6 @@ class Project(object):
 
             if self.data is None:
                 self.data = DataClass(used_statistic=method)
-            elif self.data.used_statistic != "iwu":
-                self.data = DataClass(used_statistic=method)
 
             ass_error_usage_iwu = (
                 "only 'single_family_dwelling' is a valid "
@@ -766,8 +986,6 @@ class Project(object):
 
             if self.data is None:
                 self.data = DataClass(used_statistic="iwu")
-            elif self.data.used_statistic != "iwu":
-                self.data = DataClass(used_statistic="iwu")
 
             ass_error_usage_urn = (
                 "only 'est1a', 'est1b', 'est2', 'est3', "
@@ -1159,6 +1377,16 @@ class Project(object):
         self._merge_windows_calc = False
         self._used_library_calc = "AixLib"
 
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        if value is not None and value.used_statistic is not None:
+            self.data_classes[value.used_statistic] = value
+
     @property
     def number_of_elements_calc(self):
         return self._number_of_elements_calc
@@ -2235,6 +2235,30 @@ class Test_teaser(object):
             1988, "Kunststofffenster, Isolierverglasung", prj.data
         )
 
+    def test_find_type_elements(self):
+        """test of find_type_elements against a scan of element_bind"""
+        from teaser.data.dataclass import DataClass
+
+        dat = DataClass(used_statistic="tabula_de")
+        for year in [1850, 1918, 1919, 1990, 2016]:
+            keys = [
+                key
+                for key, element_in in dat.element_bind.items()
+                if key != "version"
+                and key.startswith("OuterWall")
+                and element_in["construction_type"] == "tabula_standard_1_SFH"
+                and element_in["building_age_group"][0]
+                <= year
+                <= element_in["building_age_group"][1]
+            ]
+            assert dat.find_type_elements(
+                "OuterWall", year, "tabula_standard_1_SFH"
+            ) == keys
+        assert dat.find_type_elements("OuterWall", 1990, "unknown") == []
+
+        dat.element_bind = dat.element_bind
+        assert dat.element_index is None
+
     def test_save_type_element(self):
         """test of save_type_element, no parameter checking"""
         import os
@@ -2331,6 +2355,8 @@ class Test_teaser(object):
     def test_load_save_material(self):
         """test of load_material_template and save_material_template,
         no parameter checking"""
+        import shutil
+        import tempfile
 
         from teaser.logic.buildingobjects.buildingphysics.material import Material
 
@@ -2342,10 +2368,1293 @@ class Test_teaser(object):
         from teaser.data.dataclass import DataClass
 
         dat = DataClass()
+        dat.cache_path = tempfile.mkdtemp()
         dat.path_mat = path
         dat.load_mat_binding()
 
         mat.save_material_template(data_class=dat)
+        shutil.rmtree(dat.cache_path)
+
+    def test_material_index(self):
+        """test of find_material_id, find_material and modify_material"""
+        import shutil
+        import tempfile
+        from teaser.logic.buildingobjects.buildingphysics.material import Material
+        from teaser.data.dataclass import DataClass
+
+        dat = DataClass()
+        mat_id = dat.find_material_id("EPS_040_15")
+        assert dat.material_bind[mat_id]["name"] == "EPS_040_15"
+        assert dat.find_material(mat_id) is dat.material_bind[mat_id]
+        assert dat.find_material_id("NotAMaterial") is None
+
+        mat = Material(parent=None)
+        mat.load_material_template(mat_name="EPS_040_15", data_class=dat)
+        assert mat.material_id == mat_id
+
+        path = os.path.join(utilities.get_default_path(), "MatModUT.json")
+        dat.cache_path = tempfile.mkdtemp()
+        dat.path_mat = path
+        dat.load_mat_binding()
+        mat.save_material_template(data_class=dat)
+        assert dat.find_material_id(mat.name) == mat_id
+        mat.thermal_conduc = 0.5
+        mat.modify_material_template(data_class=dat)
+        assert dat.find_material(mat_id)["thermal_conduc"] == 0.5
+        os.remove(path)
+        shutil.rmtree(dat.cache_path)
+
+    def test_shared_bindings(self):
+        """test of sharing bindings between DataClass instances"""
+        import tempfile
+        import shutil
+        from teaser.data.dataclass import DataClass
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import OuterWall
+
+        dat_1 = DataClass()
+        dat_2 = DataClass()
+        assert dat_1.material_bind is dat_2.material_bind
+        assert dat_1.conditions_bind is dat_2.conditions_bind
+
+        path = os.path.join(utilities.get_default_path(), "TypeElementsShare.json")
+        cache_path = tempfile.mkdtemp()
+        shutil.copyfile(dat_1.path_tb, path)
+        for dat in [dat_1, dat_2]:
+            dat.cache_path = cache_path
+            dat.path_tb = path
+            dat.load_tb_binding()
+        assert dat_1.element_bind is dat_2.element_bind
+
+        key = dat_1.find_type_elements("OuterWall", 1960, "heavy")[0]
+        wall = OuterWall()
+        wall.load_type_element(year=1960, construction="heavy", data_class=dat_1)
+        wall.delete_type_element(data_class=dat_1)
+        assert "element_bind" not in dat_1.shared_bindings
+        assert key not in dat_1.element_bind
+        assert key in dat_2.element_bind
+
+        dat_3 = DataClass()
+        dat_3.cache_path = cache_path
+        dat_3.path_tb = path
+        dat_3.load_tb_binding()
+        assert key not in dat_3.element_bind
+        os.remove(path)
+        shutil.rmtree(cache_path)
+
+    def test_lazy_bindings(self):
+        """test of loading bindings on first access"""
+        import pickle
+        import threading
+        from teaser.data.dataclass import DataClass
+
+        prj_lazy = Project(load_data=True)
+        assert len(prj_lazy.data.load_times) == 0
+
+        dat = DataClass(used_statistic="tabula_de")
+        assert "TypeElements_TABULA_DE" in dat.path_tb
+        assert dat.material_index is None
+        assert dat.find_material_id("EPS_040_15") is not None
+        assert list(dat.load_times.keys()) == ["material_bind"]
+
+        threads = [
+            threading.Thread(target=lambda: dat.element_bind) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert list(dat.load_times.keys()) == ["material_bind", "element_bind"]
+        assert "conditions_bind" not in dat.load_times
+
+        dat.conditions_bind = None
+        assert dat.conditions_bind is None
+        assert "conditions_bind" not in dat.load_times
+
+        dat_copy = pickle.loads(pickle.dumps(dat))
+        assert dat_copy.element_bind == dat.element_bind
+
+    def test_catalog_cache(self):
+        """test of compiling and loading the binary catalog cache"""
+        import json
+        import shutil
+        import collections
+        from teaser.data import catalog_cache
+        from teaser.data.dataclass import DataClass
+
+        cache_path = os.path.join(utilities.get_default_path(), "CacheUT")
+        for name in ["TypeElements_TABULA_DE.json", "UseConditions.json"]:
+            path = utilities.get_full_path(
+                os.path.join("data", "input", "inputdata", name)
+            )
+            catalog_cache.compile_catalog(path, cache_path=cache_path)
+            with open(path, "r") as f:
+                binding = json.load(f, object_pairs_hook=collections.OrderedDict)
+            assert catalog_cache.load_catalog(path, cache_path) == binding
+
+        cached = catalog_cache.load_catalog(path, cache_path)
+        assert type(cached["Single office"]["with_heating"]) is bool
+        assert type(cached["Single office"]["heating_profile"][0]) is float
+        assert type(cached["Single office"]["fixed_heat_flow_rate_persons"]) is int
+
+        path = os.path.join(cache_path, "MaterialsUT.json")
+        shutil.copyfile(DataClass().path_mat, path)
+        binding = catalog_cache.load_or_compile_catalog(path, cache_path)
+        assert catalog_cache.load_catalog(path, cache_path) == binding
+        with open(path, "w") as f:
+            f.write('{"version": "0.7"}')
+        assert catalog_cache.load_catalog(path, cache_path) is None
+        assert catalog_cache.load_or_compile_catalog(path, cache_path) == {
+            "version": "0.7"
+        }
+        assert catalog_cache.load_catalog(path, cache_path) == {"version": "0.7"}
+
+        # only shipped catalogs are cached by default
+        assert catalog_cache.is_shipped_catalog(DataClass().path_mat)
+        assert not catalog_cache.is_shipped_catalog(path)
+        assert catalog_cache.is_default_catalog(DataClass().path_mat)
+        assert not catalog_cache.is_default_catalog(DataClass().path_uc)
+        assert not catalog_cache.is_default_catalog(path)
+        dat = DataClass()
+        dat.cache_path = os.path.join(cache_path, "Default")
+        dat.path_mat = path
+        dat.load_mat_binding()
+        assert not os.path.exists(dat.cache_path)
+
+        # caches of removed catalogs are evicted
+        os.remove(path)
+        removed = catalog_cache.clear_cache(cache_path, outdated_only=True)
+        assert removed == [catalog_cache.get_cache_dir(path, cache_path)]
+        assert len(catalog_cache.clear_cache(cache_path)) == 2
+        assert catalog_cache.clear_cache(cache_path) == []
+        shutil.rmtree(cache_path)
+
+    def test_material_record(self):
+        """test of materials sharing interned catalog records"""
+        from teaser.data.dataclass import DataClass
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import OuterWall
+
+        dat = DataClass()
+        wall_1 = OuterWall()
+        wall_1.load_type_element(year=1960, construction="heavy", data_class=dat)
+        wall_2 = OuterWall()
+        wall_2.load_type_element(year=1960, construction="heavy", data_class=dat)
+        mat_1 = wall_1.layer[0].material
+        mat_2 = wall_2.layer[0].material
+        assert mat_1 is not mat_2
+        assert mat_1._record is mat_2._record
+        assert mat_1._record is dat.find_material_record(mat_1.material_id)
+
+        record = dat.find_material(mat_1.material_id)
+        assert mat_1.density == record["density"]
+        assert mat_1.thickness_list == record["thickness_list"]
+        mat_1.thickness_list.append(1.0)
+        assert mat_2.thickness_list == record["thickness_list"]
+
+        thermal_conduc = mat_2.thermal_conduc
+        mat_1.thermal_conduc = thermal_conduc * 2
+        assert mat_1.thermal_conduc == thermal_conduc * 2
+        assert mat_2.thermal_conduc == thermal_conduc
+
+        material_id = mat_2.material_id
+        assert material_id == mat_1._record.material_id
+        mat_1.material_id = "MaterialIdUT"
+        assert mat_1.material_id == "MaterialIdUT"
+        assert mat_2.material_id == material_id
+
+        mat_2.detach_record()
+        assert mat_2._record is None
+        assert mat_2.thermal_conduc == thermal_conduc
+        assert mat_2.material_id == material_id
+        assert "_density" in vars(mat_2)
+
+    def test_write_session(self):
+        """test of writing catalogs once in a write session"""
+        import tempfile
+        import shutil
+        from teaser.data.dataclass import DataClass
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import OuterWall
+
+        dat = DataClass()
+        dat.cache_path = tempfile.mkdtemp()
+        path = os.path.join(utilities.get_default_path(), "TypeElementsSession.json")
+        shutil.copyfile(dat.path_tb, path)
+        os.chmod(path, 0o644)
+        dat.path_tb = path
+        dat.load_tb_binding()
+        with open(path, "r") as f:
+            content = f.read()
+
+        walls = []
+        for year in [1800, 1810, 1820]:
+            wall = OuterWall()
+            wall.load_type_element(year=1960, construction="heavy", data_class=dat)
+            wall.building_age_group = [year, year + 9]
+            walls.append(wall)
+
+        with dat.write_session():
+            for wall in walls:
+                wall.save_type_element(data_class=dat)
+            with open(path, "r") as f:
+                assert f.read() == content
+        assert dat.pending_writes is None
+        if os.name == "posix":
+            assert os.stat(path).st_mode & 0o777 == 0o644
+        dat_check = DataClass()
+        dat_check.cache_path = dat.cache_path
+        dat_check.path_tb = path
+        dat_check.load_tb_binding()
+        assert "OuterWall_[1810, 1819]_heavy" in dat_check.find_type_elements(
+            "OuterWall", 1815, "heavy"
+        )
+
+        element_bind = dat.element_bind
+        try:
+            with dat.write_session():
+                walls[0].delete_type_element(data_class=dat)
+                assert "OuterWall_[1800, 1809]_heavy" not in dat.element_bind
+                raise ValueError
+        except ValueError:
+            pass
+        assert dat.element_bind is element_bind
+        assert "OuterWall_[1800, 1809]_heavy" in dat.element_bind
+        dat_check.load_tb_binding()
+        assert "OuterWall_[1800, 1809]_heavy" in dat_check.element_bind
+        os.remove(path)
+        shutil.rmtree(dat.cache_path)
+
+    def test_data_classes(self):
+        """test of DataClass per statistic in a mixed project"""
+        prj_mixed = Project(load_data=False)
+        bldg_iwu = prj_mixed.add_residential(
+            method="iwu",
+            usage="single_family_dwelling",
+            name="ResidentialBuilding",
+            year_of_construction=1988,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200,
+        )
+        data_iwu = prj_mixed.data
+        bldg_de = prj_mixed.add_residential(
+            method="tabula_de",
+            usage="single_family_house",
+            name="ResidentialBuilding",
+            year_of_construction=1988,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200,
+        )
+        assert prj_mixed.data is data_iwu
+        assert bldg_iwu.data is data_iwu
+        assert bldg_de.data is prj_mixed.data_classes["tabula_de"]
+
+        prj_mixed.retrofit_all_buildings(
+            year_of_retrofit=2015, type_of_retrofit="retrofit"
+        )
+        assert prj_mixed.data is data_iwu
+        assert (
+            bldg_de.thermal_zones[0].outer_walls[0].construction_type
+            == "tabula_retrofit_1_SFH"
+        )
+
+        bldg_dk = prj_mixed.add_residential(
+            method="tabula_dk",
+            usage="terraced_house",
+            name="ResidentialBuilding",
+            year_of_construction=1988,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200,
+        )
+        assert bldg_dk.data.used_statistic == "tabula_dk"
+        assert (
+            bldg_dk.thermal_zones[0].outer_walls[0].construction_type
+            == "tabula_standard_1_TH"
+        )
+        assert sorted(prj_mixed.data_classes.keys()) == [
+            "iwu",
+            "tabula_de",
+            "tabula_dk",
+        ]
+
+    def test_equivalent_res_kernel(self):
+        """test of the vectorized equivalent resistance kernel against the
+        layer by layer calculation"""
+        import numpy as np
+        import teaser.logic.buildingobjects.calculation.equivalent_res as \
+            equivalent_res
+
+        prj.set_default(load_data=True)
+        helptest.building_test2(prj)
+        for year in [1900, 1960, 2010]:
+            prj.add_residential(
+                method="tabula_de",
+                usage="single_family_house",
+                name="ResidentialBuilding",
+                year_of_construction=year,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=200,
+            )
+        walls = [
+            wall
+            for bldg in prj.buildings
+            for zone in bldg.thermal_zones
+            for wall in zone.outer_walls + zone.rooftops + zone.ground_floors +
+            zone.inner_walls + zone.floors + zone.ceilings
+        ]
+        assert len(set(len(wall.layer) for wall in walls)) > 1
+
+        omega = 2 * np.pi / (86400 * 5)
+        reference = []
+        for wall in walls:
+            r_layer = [lay.thickness / lay.material.thermal_conduc
+                       for lay in wall.layer]
+            c_layer = [lay.material.heat_capac * lay.material.density *
+                       lay.thickness * 1000 for lay in wall.layer]
+            new_mat = np.diag(np.ones(4))
+            for a_layer in equivalent_res.calc_layer_matrices(
+                    np.array(r_layer), np.array(c_layer), omega):
+                new_mat = np.dot(new_mat, a_layer)
+            m = new_mat
+            r1 = (1 / wall.area) * ((m[3][3] - 1) * m[0][2] + m[2][3] *
+                                    m[0][3]) / ((m[3][3] - 1) ** 2 +
+                                                m[2][3] ** 2)
+            r2 = (1 / wall.area) * ((m[0][0] - 1) * m[0][2] + m[0][1] *
+                                    m[0][3]) / ((m[0][0] - 1) ** 2 +
+                                                m[0][1] ** 2)
+            c2 = wall.area * ((m[0][0] - 1) ** 2 + (m[0][1]) ** 2) / (
+                omega * (m[0][2] * m[0][1] - (m[0][0] - 1) * m[0][3]))
+            r3 = (1 / wall.area) * (np.sum(np.array(r_layer))) - r1 - r2
+            reference.append((r1, r2, r3, c2))
+
+        equivalent_res.calc_equivalent_res(walls, t_bt=5)
+        for wall, (r1, r2, r3, c2) in zip(walls, reference):
+            assert (wall.r1, wall.r2, wall.r3, wall.c2) == (r1, r2, r3, c2)
+            c1 = wall.c1
+            wall.calc_equivalent_res(t_bt=5)
+            assert wall.c1 == c1
+
+        nr_of_layer, density, thermal_conduc, heat_capac, thickness = \
+            equivalent_res.gather_layer_properties(walls)
+        assert thickness.shape == (len(walls), max(nr_of_layer))
+        assert thickness[np.argmin(nr_of_layer), -1] == 0.0
+
+    def test_equivalent_res_cache(self):
+        """test of the cache of the equivalent resistance kernel"""
+        import teaser.logic.buildingobjects.calculation.equivalent_res as \
+            equivalent_res
+
+        prj.set_default(load_data=True)
+        for year in [1900, 1960, 2010]:
+            prj.add_residential(
+                method="tabula_de",
+                usage="single_family_house",
+                name="ResidentialBuilding",
+                year_of_construction=year,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=200,
+            )
+        walls = [
+            wall
+            for bldg in prj.buildings
+            for zone in bldg.thermal_zones
+            for wall in zone.outer_walls + zone.rooftops + zone.ground_floors +
+            zone.inner_walls + zone.floors + zone.ceilings
+        ]
+        attributes = ["r1", "r2", "r3", "c1", "c2", "c1_korr"]
+
+        equivalent_res.clear_cache()
+        equivalent_res.calc_equivalent_res(walls, t_bt=5, use_cache=False)
+        fresh = [[getattr(wall, attr) for attr in attributes] for wall in walls]
+        assert equivalent_res.get_cache_info()["misses"] == 0
+
+        equivalent_res.calc_equivalent_res(walls, t_bt=5)
+        cache_info = equivalent_res.get_cache_info()
+        assert cache_info["misses"] == cache_info["currsize"]
+        assert cache_info["hits"] + cache_info["misses"] == len(walls)
+        assert cache_info["currsize"] < len(walls)
+
+        for wall in walls:
+            wall.area = wall.area * 2
+        equivalent_res.calc_equivalent_res(walls, t_bt=5)
+        assert equivalent_res.get_cache_info()["hits"] == \
+            cache_info["hits"] + len(walls)
+        for wall in walls:
+            wall.area = wall.area / 2
+        equivalent_res.calc_equivalent_res(walls, t_bt=5)
+        assert [
+            [getattr(wall, attr) for attr in attributes] for wall in walls
+        ] == fresh
+
+        equivalent_res.calc_equivalent_res(walls, t_bt=7)
+        assert equivalent_res.get_cache_info()["currsize"] == \
+            2 * cache_info["currsize"]
+
+        equivalent_res.clear_cache(maxsize=2)
+        equivalent_res.calc_equivalent_res(walls, t_bt=5)
+        assert equivalent_res.get_cache_info()["currsize"] == 2
+        equivalent_res.clear_cache(maxsize=4096)
+
+    def test_parallel_connection_zones(self):
+        """test of the parallel connection of several thermal zones at once"""
+        import math
+        import teaser.logic.buildingobjects.calculation.equivalent_res as \
+            equivalent_res
+
+        prj.set_default(load_data=True)
+        helptest.building_test2(prj)
+        prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="OfficeBuilding",
+            year_of_construction=1988,
+            number_of_floors=3,
+            height_of_floors=3.5,
+            net_leased_area=1000,
+        )
+        prj.calc_all_buildings()
+
+        omega = 2 * math.pi / 86400 / 5
+        zones = [zone for bldg in prj.buildings for zone in bldg.thermal_zones]
+        element_lists = [zone.outer_walls + zone.rooftops +
+                         zone.ground_floors + zone.windows for zone in zones]
+        r1, c1 = equivalent_res.calc_parallel_connection_of_elements(
+            element_lists, omega
+        )
+        assert len(r1) == len(zones)
+        for zone, elements, r1_zone, c1_zone in zip(
+            zones, element_lists, r1, c1
+        ):
+            assert (r1_zone, c1_zone) == \
+                zone.model_attr._calc_parallel_connection(elements, omega)
+
+        r1_single, c1_single = equivalent_res.calc_parallel_connection(
+            [element.r1 for element in element_lists[0][:1]],
+            [element.c1 for element in element_lists[0][:1]],
+            omega,
+        )
+        assert r1_single == element_lists[0][0].r1
+        assert c1_single == element_lists[0][0].c1
+
+        wall = zones[0].outer_walls[0]
+        assert equivalent_res.calc_wall_type(
+            [wall.r1], [wall.c1], [wall.c1_korr], omega
+        ) == (wall.r1, wall.c1_korr)
+        zones[0].calc_zone_parameters(number_of_elements=2)
+        model = zones[0].model_attr
+        outer_walls = (zones[0].outer_walls + zones[0].ground_floors +
+                       zones[0].rooftops)
+        assert equivalent_res.calc_r_rest(
+            [element.r_conduc for element in outer_walls], model.r1_ow
+        ) == model.r_rest_ow
+        assert equivalent_res.calc_weighted_g_value(
+            [win.g_value for win in zones[0].windows],
+            [win.area for win in zones[0].windows],
+        ) == model.weighted_g_value
+
+    def test_bulk_edit(self):
+        """test of lazy derived values and bulk edits of a building"""
+        prj.set_default(load_data=True)
+        helptest.building_test2(prj)
+        bldg = prj.buildings[-1]
+        zone = bldg.thermal_zones[-1]
+        wall = zone.outer_walls[0]
+        orientation = wall.orientation
+        outer_area = bldg.outer_area[orientation]
+        assert outer_area == bldg.get_outer_wall_area(orientation)
+        bldg.window_area
+        ua_value = wall.ua_value
+
+        wall.area = wall.area * 2
+        assert wall._ua_dirty is True
+        assert bldg._outer_area_orientations == {orientation}
+        assert round(wall.ua_value, 10) == round(ua_value * 2, 10)
+        assert wall._ua_dirty is False
+        assert bldg.outer_area[orientation] == outer_area + wall.area / 2
+        assert bldg._outer_area_orientations == set()
+
+        with bldg.bulk_edit():
+            for win in zone.windows:
+                win.area = win.area * 2
+            with bldg.bulk_edit():
+                wall.area = wall.area / 2
+            assert bldg._outer_area_orientations == {orientation}
+            assert bldg._window_area_orientations
+        assert bldg._outer_area_orientations == set()
+        assert bldg._window_area_orientations == set()
+        assert wall._ua_dirty is False
+        assert round(wall.ua_value, 10) == round(ua_value, 10)
+        assert bldg.outer_area[orientation] == outer_area
+        for orient, area in bldg.window_area.items():
+            assert area == bldg.get_window_area(orient)
+
+    def test_zone_model_cache(self):
+        """test of keeping the zone models of several model orders"""
+        from teaser.logic.buildingobjects.calculation.four_element import \
+            FourElement
+
+        prj.set_default(load_data=True)
+        helptest.building_test2(prj)
+        zone = prj.buildings[-1].thermal_zones[-1]
+
+        zone.calc_zone_parameters(number_of_elements=2)
+        two_element = zone.model_attr
+        zone.calc_zone_parameters(number_of_elements=4)
+        four_element = zone.model_attr
+        assert isinstance(four_element, FourElement)
+        zone.calc_zone_parameters(number_of_elements=2)
+        assert zone.model_attr is two_element
+        wf_out = [wall.wf_out for wall in zone.outer_walls]
+        zone.calc_zone_parameters(number_of_elements=4)
+        assert zone.model_attr is four_element
+
+        fresh = FourElement(thermal_zone=zone, merge_windows=False, t_bt=5)
+        fresh.calc_attributes()
+        assert fresh.r1_ow == four_element.r1_ow
+        assert fresh.c1_rt == four_element.c1_rt
+        assert fresh.heat_load == four_element.heat_load
+
+        zone.calc_zone_parameters(number_of_elements=2)
+        assert [wall.wf_out for wall in zone.outer_walls] == wf_out
+
+        zone.outer_walls[0].area = zone.outer_walls[0].area * 2
+        zone.calc_zone_parameters(number_of_elements=2, all_orders=True)
+        assert zone.model_attr is not two_element
+        assert zone.model_attr.area_ow > two_element.area_ow
+        assert sorted(zone._model_attr_cache) == [
+            (1, False, 5),
+            (2, False, 5),
+            (3, False, 5),
+            (4, False, 5),
+        ]
+
+    def test_calc_all_buildings_parallel(self):
+        """test of calculating the buildings in worker processes"""
+        from teaser.logic.buildingobjects.building import Building
+        from teaser.logic.buildingobjects.thermalzone import ThermalZone
+        from teaser.logic.buildingobjects.useconditions import UseConditions
+
+        prj.set_default(load_data=True)
+        for year in [1950, 1980, 2010]:
+            prj.add_residential(
+                method="iwu",
+                usage="single_family_dwelling",
+                name="Residential" + str(year),
+                year_of_construction=year,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=219,
+            )
+        prj.number_of_elements_calc = 4
+        for bldg in prj.buildings:
+            bldg.sum_heat_load = 0
+        failed = prj.calc_all_buildings()
+        assert failed == []
+        serial = [
+            (bldg.sum_heat_load,
+             bldg.library_attr.total_surface_area,
+             bldg.thermal_zones[0].model_attr.r1_ow,
+             bldg.thermal_zones[0].model_attr.c1_gf,
+             bldg.thermal_zones[0].outer_walls[0].r2)
+            for bldg in prj.buildings]
+
+        bld = Building(parent=prj)
+        bld.name = "NotCalculable"
+        tz = ThermalZone(parent=bld)
+        tz.use_conditions = UseConditions(parent=tz)
+        for bldg in prj.buildings:
+            bldg.sum_heat_load = 0
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            failed = prj.calc_all_buildings(processes=2, chunk_size=1)
+        assert [bldg for bldg, error in failed] == [bld]
+        assert bld not in prj.buildings
+        assert any("NotCalculable" in str(warn.message) for warn in caught)
+        parallel = [
+            (bldg.sum_heat_load,
+             bldg.library_attr.total_surface_area,
+             bldg.thermal_zones[0].model_attr.r1_ow,
+             bldg.thermal_zones[0].model_attr.c1_gf,
+             bldg.thermal_zones[0].outer_walls[0].r2)
+            for bldg in prj.buildings]
+        assert parallel == serial
+        zone = prj.buildings[0].thermal_zones[0]
+        assert zone.model_attr.thermal_zone is zone
+        assert prj.buildings[0].library_attr.parent is prj.buildings[0]
+
+    def test_element_index(self):
+        """test of the orientation and tilt index of thermal zones"""
+        import pickle
+        from teaser.logic.buildingobjects.buildingphysics.window import Window
+
+        prj.set_default(load_data=True)
+        helptest.building_test2(prj)
+        zone = prj.buildings[-1].thermal_zones[-1]
+
+        def find_linear(elements, orientation, tilt):
+            return [element for element in elements
+                    if element.orientation == orientation and
+                    element.tilt == tilt]
+
+        def assert_index(zone):
+            for elements, find in [
+                    (zone.outer_walls, zone.find_walls),
+                    (zone.rooftops, zone.find_rts),
+                    (zone.ground_floors, zone.find_gfs),
+                    (zone.windows, zone.find_wins)]:
+                for orientation in [-2.0, -1.0, 0.0, 90.0, 180.0, 270.0]:
+                    for tilt in [0.0, 45.0, 90.0]:
+                        found = find(orientation, tilt)
+                        expected = find_linear(elements, orientation, tilt)
+                        assert len(found) == len(expected)
+                        assert all(a is b for a, b in zip(found, expected))
+
+        assert_index(zone)
+        wall = zone.outer_walls[0]
+        wall.orientation = 270.0
+        wall.tilt = 45.0
+        assert_index(zone)
+        zone.outer_walls.remove(zone.outer_walls[1])
+        assert_index(zone)
+
+        area = zone.get_window_area(90.0, 90.0)
+        window = Window(parent=zone)
+        window.area = 2.0
+        window.orientation = 90.0
+        assert_index(zone)
+        assert zone.get_window_area(90.0, 90.0) == area + 2.0
+        window.area = 3.0
+        assert zone.get_window_area(90.0, 90.0) == area + 3.0
+        zone.windows.pop()
+        assert zone.get_window_area(90.0, 90.0) == area
+
+        zone.windows.reverse()
+        assert_index(zone)
+        assert_index(pickle.loads(pickle.dumps(zone)))
+
+    def test_area_aggregates(self):
+        """test of the per orientation area sums of buildings"""
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import \
+            OuterWall
+
+        prj.set_default(load_data=True)
+        prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="TestOffice",
+            year_of_construction=1988,
+            number_of_floors=3,
+            height_of_floors=3.5,
+            net_leased_area=2500,
+        )
+        bldg = prj.buildings[-1]
+
+        def assert_filled(bldg):
+            outer_area = list(bldg.outer_area.items())
+            window_area = list(bldg.window_area.items())
+            bldg.fill_outer_area_dict()
+            bldg.fill_window_area_dict()
+            assert outer_area == list(bldg.outer_area.items())
+            assert window_area == list(bldg.window_area.items())
+
+        assert_filled(bldg)
+        for zone in bldg.thermal_zones:
+            for wall in zone.outer_walls:
+                wall.area = wall.area * 1.5
+            for win in zone.windows:
+                win.area = win.area * 0.5
+        assert bldg._outer_area_dirty is False
+        assert_filled(bldg)
+
+        bldg.outer_area[90.0] = 1.0
+        bldg.thermal_zones[0].outer_walls[0].area = 10.0
+        assert bldg.outer_area[90.0] == bldg.get_outer_wall_area(90.0)
+        assert_filled(bldg)
+
+        wall = OuterWall(parent=bldg.thermal_zones[-1])
+        wall.orientation = 45.0
+        wall.area = 5.0
+        assert bldg.outer_area[45.0] == 5.0
+        assert_filled(bldg)
+        bldg.thermal_zones[-1].outer_walls.remove(wall)
+        assert 45.0 not in bldg.outer_area
+        bldg.thermal_zones[0].outer_walls.append(wall)
+        assert bldg.outer_area[45.0] == 5.0
+        assert_filled(bldg)
+        bldg.thermal_zones[0].outer_walls.remove(wall)
+
+        inner_wall_area = bldg.get_inner_wall_area()
+        assert bldg.get_inner_wall_area() == inner_wall_area
+        bldg.thermal_zones[0].inner_walls[0].area += 1.0
+        assert bldg._inner_wall_area is None
+        assert bldg.get_inner_wall_area() != inner_wall_area
+
+    def test_design_heat_loads(self):
+        """test of the vectorized static heat load of a project"""
+        import numpy as np
+
+        prj.set_default(load_data=True)
+        prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="TestOffice",
+            year_of_construction=1988,
+            number_of_floors=3,
+            height_of_floors=3.5,
+            net_leased_area=2500,
+        )
+        prj.add_residential(
+            method="tabula_de",
+            usage="single_family_house",
+            name="TestHouse",
+            year_of_construction=1970,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=150,
+        )
+        for number_of_elements in [1, 2, 3, 4]:
+            prj.number_of_elements_calc = number_of_elements
+            prj.calc_all_buildings()
+            building_heat_load, zone_heat_load = prj.calc_design_heat_loads()
+            assert list(zone_heat_load) == [
+                zone.model_attr.heat_load
+                for bldg in prj.buildings for zone in bldg.thermal_zones]
+            assert list(building_heat_load) == [
+                sum(zone.model_attr.heat_load for zone in bldg.thermal_zones)
+                for bldg in prj.buildings]
+
+        t_outside = np.array([[258.15, 263.15], [253.15, 268.15]])
+        building_heat_load, zone_heat_load = prj.calc_design_heat_loads(
+            t_outside=t_outside, infiltration_rate=[0.5, 0.2])
+        assert building_heat_load.shape == (2, 2)
+        assert zone_heat_load.shape == (2, len(prj.buildings[0].thermal_zones) +
+                                        len(prj.buildings[1].thermal_zones))
+        assert prj.buildings[0].thermal_zones[0].t_outside == 261.15
+
+        house_zone = prj.buildings[1].thermal_zones[0]
+        house_zone.t_outside = 268.15
+        house_zone.use_conditions.infiltration_rate = 0.2
+        house_zone.calc_zone_parameters(number_of_elements=4)
+        assert building_heat_load[1, 1] == house_zone.model_attr.heat_load
+
+    def test_monte_carlo(self):
+        """Tests the sampling of zone parameters over uncertain inputs"""
+        import numpy as np
+        import pytest
+        from teaser.logic.buildingobjects.calculation import uncertainty
+
+        prj.set_default(load_data=True)
+        prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="TestOffice",
+            year_of_construction=1988,
+            number_of_floors=3,
+            height_of_floors=3.5,
+            net_leased_area=2500,
+        )
+        prj.add_residential(
+            method="tabula_de",
+            usage="single_family_house",
+            name="TestHouse",
+            year_of_construction=1970,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=150,
+        )
+        prj.number_of_elements_calc = 2
+        prj.calc_all_buildings()
+        zones = [zone for bldg in prj.buildings for zone in bldg.thermal_zones]
+
+        nominal = dict(
+            (key, ("uniform", 1.0, 1.0)) for key in uncertainty.PARAMETERS)
+        results = uncertainty.calc_samples(prj, nominal, samples=3)
+        for key in uncertainty.ZONE_RESULTS:
+            assert results[key].shape == (3, len(zones))
+            for sample in results[key]:
+                assert list(sample) == [
+                    getattr(zone.model_attr, key) for zone in zones]
+        assert results["building_heat_load"].shape == (3, 2)
+        assert list(results["building_heat_load"][0]) == [
+            sum(zone.model_attr.heat_load for zone in bldg.thermal_zones)
+            for bldg in prj.buildings]
+
+        distributions = {
+            "thermal_conduc": ("normal", 1.0, 0.1),
+            "thickness": ("triangular", 0.9, 1.0, 1.1),
+            "g_value": ("uniform", 0.9, 1.1),
+            "infiltration_rate": lambda rng, size: rng.lognormal(0, 0.2, size),
+        }
+        results = uncertainty.calc_samples(
+            prj.buildings[1], distributions, samples=50, seed=7, chunk_size=20)
+        again = uncertainty.calc_samples(
+            prj.buildings[1], distributions, samples=50, seed=7)
+        for key in uncertainty.ZONE_RESULTS:
+            assert np.array_equal(results[key], again[key])
+        assert results["heat_load"].std() > 0
+
+        # the samples equal the zone model with the scaled inputs
+        house_zone = prj.buildings[1].thermal_zones[0]
+        factors = dict(
+            (key, value[4]) for key, value in results["factors"].items())
+        materials = {}
+        for element in house_zone.outer_walls + house_zone.ground_floors + \
+                house_zone.rooftops + house_zone.inner_walls + \
+                house_zone.floors + house_zone.ceilings + house_zone.windows:
+            for layer in element.layer:
+                layer.thickness *= factors["thickness"]
+                materials[id(layer.material)] = layer.material
+        for material in materials.values():
+            material.thermal_conduc *= factors["thermal_conduc"]
+        for win in house_zone.windows:
+            win.g_value *= factors["g_value"]
+        house_zone.use_conditions.infiltration_rate *= \
+            factors["infiltration_rate"]
+        house_zone.calc_zone_parameters(number_of_elements=2)
+        for key in uncertainty.ZONE_RESULTS:
+            assert np.isclose(
+                results[key][4, 0], getattr(house_zone.model_attr, key),
+                rtol=1e-10, atol=0)
+
+        results = uncertainty.calc_samples(
+            prj, {"density": ("normal", 1.0, 0.1)}, samples=5, seed=1,
+            independent=True)
+        assert "factors" not in results
+        assert results["c1_ow"].shape == (5, len(zones))
+        assert len(set(results["c1_ow"][:, 0])) == 5
+        assert list(results["ua_value_ow"][0]) == [
+            zone.model_attr.ua_value_ow for zone in zones]
+
+        with pytest.raises(ValueError):
+            uncertainty.calc_samples(prj, {"u_value": ("normal", 1.0, 0.1)})
+        prj.buildings[1].thermal_zones[0].calc_zone_parameters(
+            number_of_elements=4)
+        with pytest.raises(ValueError):
+            uncertainty.calc_samples(prj.buildings[1], nominal, samples=3)
+        prj.buildings[1].thermal_zones[0].calc_zone_parameters(
+            number_of_elements=2)
+        prj.number_of_elements_calc = 3
+        with pytest.raises(ValueError):
+            uncertainty.calc_samples(prj.buildings[0], nominal, samples=3)
+        prj.number_of_elements_calc = 2
+
+    def test_sensitivities(self):
+        """Tests the derivatives of zone parameters to layer properties"""
+        import numpy as np
+        import pytest
+        from teaser.logic.buildingobjects.calculation import sensitivity
+
+        prj.set_default(load_data=True)
+        prj.add_residential(
+            method="iwu",
+            usage="single_family_dwelling",
+            name="TestHouse",
+            year_of_construction=1975,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=150,
+        )
+        zone = prj.buildings[0].thermal_zones[0]
+
+        wall = zone.outer_walls[0]
+        sensitivities = wall.calc_sensitivities()
+        assert list(sensitivities) == list(sensitivity.WALL_RESULTS)
+        assert sensitivities["r1"].shape == (len(wall.layer), 4)
+        layer = wall.layer[-1]
+        conduc = layer.material.thermal_conduc
+        step = conduc * 1e-6
+        values = []
+        for delta in [step, -step]:
+            layer.material.thermal_conduc = conduc + delta
+            wall.calc_equivalent_res()
+            wall.calc_ua_value()
+            values.append((wall.r1, wall.c1, wall.ua_value))
+        layer.material.thermal_conduc = conduc
+        for i, key in enumerate(["r1", "c1", "ua_value"]):
+            assert np.isclose(
+                sensitivities[key][-1, 0],
+                (values[0][i] - values[1][i]) / (2 * step), rtol=1e-5)
+        win_sensitivities = zone.windows[0].calc_sensitivities()
+        assert list(win_sensitivities) == list(sensitivity.WINDOW_RESULTS)
+        assert win_sensitivities["ua_value"][0, 0] > 0
+
+        for number_of_elements in [1, 2, 3, 4]:
+            zone.calc_zone_parameters(number_of_elements=number_of_elements)
+            assert np.allclose(
+                [sum(element.ua_value for element in elements)
+                 for elements in zone.model_attr.get_heat_load_ua_elements()],
+                zone.model_attr.get_heat_load_ua_values())
+            columns, jacobian = zone.model_attr.calc_sensitivities()
+            assert len(columns) == 4 * sum(
+                len(element.layer) for element in
+                zone.outer_walls + zone.rooftops + zone.ground_floors +
+                zone.inner_walls + zone.floors + zone.ceilings + zone.windows)
+            position = columns.index((wall, len(wall.layer) - 1, "thickness"))
+            thickness = layer.thickness
+            step = thickness * 1e-6
+            values = []
+            for delta in [step, -step]:
+                layer.thickness = thickness + delta
+                zone.calc_zone_parameters(
+                    number_of_elements=number_of_elements)
+                values.append(dict(
+                    (key, getattr(zone.model_attr, key)) for key in jacobian))
+            layer.thickness = thickness
+            zone.calc_zone_parameters(number_of_elements=number_of_elements)
+            for key in jacobian:
+                assert len(jacobian[key]) == len(columns)
+                assert np.isclose(
+                    jacobian[key][position],
+                    (values[0][key] - values[1][key]) / (2 * step),
+                    rtol=1e-5, atol=1e-8 * abs(values[0][key]) / thickness)
+            assert jacobian["heat_load"][position] < 0
+
+        zone.calc_zone_parameters(number_of_elements=2, merge_windows=True)
+        with pytest.raises(ValueError):
+            zone.model_attr.calc_sensitivities()
+
+    def test_vdi6007_simulation(self):
+        """Tests the simulation of the reduced order models"""
+        import numpy as np
+        from teaser.data.input import weather_input
+        from teaser.logic.simulation import vdi6007
+
+        weather = weather_input.load_weather(prj.weather_file_path)
+        assert len(weather) == 30
+        assert weather["time"][1] == 3600.0
+        assert len(weather["temp_dry_bulb"]) == 8760
+        location = weather_input.load_location(prj.weather_file_path)
+        assert location["city"] == "Mannheim"
+        assert location["time_zone"] == 1.0
+
+        prj.set_default(load_data=True)
+        prj.add_residential(
+            method="tabula_de",
+            usage="single_family_house",
+            name="TestHouse",
+            year_of_construction=1970,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=150,
+        )
+        zone = prj.buildings[0].thermal_zones[0]
+        zone.use_conditions.with_cooling = True
+        temperatures = [vdi6007.INPUTS.index(name) for name in (
+            "t_eq_wall", "t_eq_win", "t_eq_roof", "t_ground", "t_outside")]
+        for number_of_elements in [1, 2, 3, 4]:
+            prj.number_of_elements_calc = number_of_elements
+            prj.calc_all_buildings()
+            network = vdi6007.calc_network(zone)
+            assert len(network["nodes"]) == 2 * min(
+                number_of_elements, 4) + 2
+            # equal boundary temperatures without gains are kept
+            state_matrix, input_matrix = vdi6007.discretize_network(network)
+            assert np.allclose(
+                state_matrix.sum(axis=1) +
+                input_matrix[:, temperatures].sum(axis=1), 1)
+
+            results = vdi6007.simulate_building(prj.buildings[0])
+            assert results["t_air"].shape == (8760, 1)
+            heating = zone.use_conditions.schedules["heating_profile"].values
+            cooling = zone.use_conditions.schedules["cooling_profile"].values
+            assert np.all(results["t_air"][:, 0] >= heating - 1e-6)
+            assert np.all(results["t_air"][:, 0] <= cooling + 1e-6)
+            assert np.all(results["heating_load"] >= 0)
+            assert np.all(results["heating_load"] * results["cooling_load"]
+                          == 0)
+            assert 0.5 < results["heating_load"].max() / \
+                zone.model_attr.heat_load < 1.5
+            assert results["cooling_load"].sum() > 0
+
+    def test_state_space_simulation(self):
+        """Tests the batched state space simulation of zone models"""
+        import numpy as np
+        from teaser.logic.simulation import statespace
+        from teaser.logic.simulation import vdi6007
+
+        assert np.allclose(
+            statespace.expm(np.array([[0.0, 1.0], [0.0, 0.0]])),
+            [[1.0, 1.0], [0.0, 1.0]])
+        matrices = np.random.RandomState(0).normal(size=(3, 4, 4)) * 4
+        assert np.allclose(
+            np.matmul(statespace.expm(matrices), statespace.expm(-matrices)),
+            np.eye(4))
+
+        prj.set_default(load_data=True)
+        prj.add_residential(
+            method="tabula_de",
+            usage="single_family_house",
+            name="TestHouse",
+            year_of_construction=1970,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=150,
+        )
+        prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="TestOffice",
+            year_of_construction=1988,
+            number_of_floors=3,
+            height_of_floors=3.5,
+            net_leased_area=2500,
+        )
+        for number_of_elements in [2, 4]:
+            prj.number_of_elements_calc = number_of_elements
+            prj.calc_all_buildings()
+            zone = prj.buildings[0].thermal_zones[0]
+            network = vdi6007.calc_network(zone)
+            state_matrix, input_matrix = statespace.calc_state_space(network)
+            assert state_matrix.shape == (number_of_elements + 1,) * 2
+
+            # zero order hold agrees with implicit Euler for small steps
+            exact = statespace.discretize_state_space(
+                state_matrix, input_matrix, time_step=3600)
+            euler = vdi6007.discretize_network(network, time_step=1)
+            mass = network["capacity"] > 0
+            euler_state = np.linalg.matrix_power(
+                euler[0], 3600)[np.ix_(mass, mass)]
+            assert np.allclose(exact[0], euler_state, atol=1e-3)
+
+            results = prj.simulate_all_buildings(chunk_size=4)
+            nr_of_zones = sum(
+                len(bldg.thermal_zones) for bldg in prj.buildings)
+            assert results["t_air"].shape == (8760, nr_of_zones)
+            assert list(results["building_index"][:2]) == [0, 1]
+            assert results["zone_position"][-1] == nr_of_zones - 2
+            assert np.all(results["heating_load"] >= 0)
+            assert np.all(results["cooling_load"] == 0)
+            heating = zone.use_conditions.schedules["heating_profile"].values
+            assert np.all(results["t_air"][:, 0] >= heating - 1e-6)
+            reference = vdi6007.simulate_building(prj.buildings[0])
+            assert np.isclose(
+                results["heating_load"][:, 0].sum(),
+                reference["heating_load"].sum(), rtol=0.01)
+
+    def test_weather_cache(self):
+        """Tests the binary cache of weather files"""
+        import shutil
+        import pytest
+        import numpy as np
+        from teaser.data import catalog_cache
+        from teaser.data.input import weather_input
+
+        cache_path = os.path.join(utilities.get_default_path(), "CacheUT")
+        if not os.path.exists(cache_path):
+            os.makedirs(cache_path)
+        path = os.path.join(cache_path, "WeatherUT.mos")
+        shutil.copyfile(prj.weather_file_path, path)
+
+        parsed = weather_input.parse_weather(path)
+        assert parsed.shape == (8760,)
+        assert parsed.dtype.names == weather_input.MOS_COLUMNS
+        table = weather_input.read_weather(path, cache_path=cache_path)
+        assert isinstance(table, np.memmap) is False
+        table = weather_input.read_weather(path, cache_path=cache_path)
+        assert isinstance(table, np.memmap)
+        assert np.array_equal(table, parsed)
+
+        weather = weather_input.load_weather(path, cache_path=cache_path)
+        assert isinstance(weather["time"], np.memmap)
+        assert weather["time"].strides == (table.dtype.itemsize,)
+        assert weather["temp_dry_bulb"].flags.writeable is False
+        assert np.array_equal(weather["temp_dry_bulb"],
+                              parsed["temp_dry_bulb"])
+
+        with open(path, "a") as f:
+            f.write("0 " * 30 + "\n")
+        with pytest.raises(ValueError):
+            weather_input.read_weather(path, cache_path=cache_path)
+        cache_dir = catalog_cache.get_cache_dir(path, cache_path)
+        assert sorted(os.listdir(cache_dir)) == [
+            weather_input.WEATHER_MANIFEST, weather_input.WEATHER_TABLE]
+        if os.name == "posix":
+            mode = 0o666 & ~catalog_cache._UMASK
+            for name in os.listdir(cache_dir):
+                assert os.stat(os.path.join(
+                    cache_dir, name)).st_mode & 0o777 == mode
+        assert weather_input.clear_weather_cache(
+            cache_path, outdated_only=True) == [cache_dir]
+        assert weather_input.clear_weather_cache(cache_path) == []
+        shutil.rmtree(cache_path)
+
+    def test_solar_irradiation(self):
+        """Tests the irradiation on the surfaces of zone models"""
+        import numpy as np
+        from teaser.data.input import weather_input
+        from teaser.logic.simulation import solar
+        from teaser.logic.simulation import vdi6007
+
+        weather = weather_input.load_weather(prj.weather_file_path)
+        irradiation = solar.calc_irradiation(
+            weather=weather,
+            latitude=[50.0, 50.0, 50.0, 50.0, 40.0],
+            longitude=8.0,
+            time_zone=1.0,
+            orientations=[-1, -2, 180.0, 0.0, 180.0],
+            tilts=[90.0, 0.0, 90.0, 90.0, 90.0])
+        assert irradiation.shape == (8760, 5)
+        # horizontal roof gets the global horizontal irradiation
+        assert np.allclose(
+            irradiation[:, 0].sum(), weather["irr_global_horizontal"].sum(),
+            rtol=0.02)
+        assert np.all(irradiation[:, 1] == 0)
+        assert irradiation[:, 2].sum() > irradiation[:, 3].sum()
+        assert not np.array_equal(irradiation[:, 2], irradiation[:, 4])
+        single = solar.calc_irradiation(
+            weather=weather, latitude=40.0, longitude=8.0, time_zone=1.0,
+            orientations=[180.0], tilts=[90.0])
+        assert np.allclose(single[:, 0], irradiation[:, 4])
+
+        prj.set_default(load_data=True)
+        for name in ["TestHouse1", "TestHouse2"]:
+            prj.add_residential(
+                method="tabula_de",
+                usage="single_family_house",
+                name=name,
+                year_of_construction=1970,
+                number_of_floors=2,
+                height_of_floors=3.2,
+                net_leased_area=150,
+            )
+        prj.calc_all_buildings()
+        solar.clear_irradiation_cache()
+        zones = [bldg.thermal_zones[0] for bldg in prj.buildings]
+        table, zone_index = solar.calc_zone_irradiation(
+            zones, prj.weather_file_path)
+        model = zones[0].model_attr
+        assert table.shape[1] == len(set(zip(
+            model.orientation_facade, model.tilt_facade)))
+        assert np.array_equal(zone_index[0], zone_index[1])
+        again, zone_index = solar.calc_zone_irradiation(
+            zones, prj.weather_file_path)
+        assert again is table
+
+        prj.buildings[1].rotate_building(90)
+        prj.calc_all_buildings()
+        rotated, zone_index = solar.calc_zone_irradiation(
+            zones, prj.weather_file_path)
+        assert rotated is not table
+        assert not np.array_equal(zone_index[0], zone_index[1])
+        inputs = vdi6007.calc_inputs(
+            zones[1], weather, time_zone=1.0,
+            irradiation=rotated[:, zone_index[1]])
+        assert np.allclose(
+            inputs, vdi6007.calc_inputs(zones[1], weather, time_zone=1.0))
+
+    def test_monthly_demand(self):
+        """Tests the monthly heating demand of all buildings"""
+        import numpy as np
+        from teaser.logic.buildingobjects.calculation import monthly_demand
+
+        assert np.allclose(
+            monthly_demand.calc_utilization_factor(
+                np.array([0.0, 0.5, 1.0, 2.0, np.inf]), 15.0),
+            [1.0, 6.0 / 7.0, 2.0 / 3.0, 3.0 / 7.0, 0.0])
+
+        prj.set_default(load_data=True)
+        prj.add_residential(
+            method="tabula_de",
+            usage="single_family_house",
+            name="TestHouse",
+            year_of_construction=1970,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=150,
+        )
+        prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="TestOffice",
+            year_of_construction=1988,
+            number_of_floors=3,
+            height_of_floors=3.5,
+            net_leased_area=2500,
+        )
+        prj.calc_all_buildings()
+        demands = prj.calc_monthly_demands()
+        nr_of_zones = sum(len(bldg.thermal_zones) for bldg in prj.buildings)
+        assert demands["heating_demand"].shape == (12, nr_of_zones)
+        assert demands["building_heating_demand"].shape == (12, 2)
+        assert np.allclose(
+            demands["building_annual_heating_demand"].sum(),
+            demands["heating_demand"].sum())
+        assert np.all(demands["heating_demand"] >= 0)
+        assert np.all(demands["utilization"] <= 1)
+        # more demand in january than in july
+        assert np.all(demands["building_heating_demand"][0] >
+                      demands["building_heating_demand"][6])
+
+        # zero gains give the heat losses as demand
+        inputs = monthly_demand.collect_monthly_inputs(
+            prj.buildings, prj.weather_file_path)
+        inputs["internal_gains"][:] = 0
+        inputs["solar_gains"][:] = 0
+        lossy = monthly_demand.calc_monthly_demands(inputs)
+        assert np.allclose(
+            lossy["heating_demand"][0], lossy["heat_loss"][0])
+        assert np.all(
+            lossy["annual_heating_demand"] >=
+            demands["annual_heating_demand"])
+
+    def test_ideal_loads(self):
+        """Tests ideal loads, peaks and load duration curves"""
+        import numpy as np
+        from teaser.logic.simulation import ideal_loads
+
+        curve, hours = ideal_loads.calc_load_duration_curve(
+            np.array([[1.0, 0.0], [3.0, 2.0], [2.0, 1.0]]))
+        assert np.array_equal(curve, [[3.0, 2.0], [2.0, 1.0], [1.0, 0.0]])
+        assert list(hours) == [1, 2, 3]
+
+        prj.set_default(load_data=True)
+        prj.add_non_residential(
+            method="bmvbs",
+            usage="office",
+            name="TestOffice",
+            year_of_construction=1988,
+            number_of_floors=3,
+            height_of_floors=3.5,
+            net_leased_area=2500,
+        )
+        prj.add_residential(
+            method="tabula_de",
+            usage="single_family_house",
+            name="TestHouse",
+            year_of_construction=1970,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=150,
+        )
+        prj.buildings[0].thermal_zones[0].use_conditions.with_cooling = True
+        prj.calc_all_buildings()
+        loads = prj.calc_ideal_loads(chunk_size=2, hourly=True)
+        nr_of_zones = sum(len(bldg.thermal_zones) for bldg in prj.buildings)
+        assert loads["heating_duration"].shape == (101, nr_of_zones)
+        assert loads["duration_hours"][-1] == 8760
+        assert np.allclose(loads["heating_peak"],
+                           loads["heating_load"].max(axis=0))
+        assert np.allclose(loads["heating_duration"][0],
+                           loads["heating_peak"])
+        assert np.all(np.diff(loads["heating_duration"], axis=0) <= 0)
+        assert np.allclose(loads["heating_demand"],
+                           loads["heating_load"].sum(axis=0) / 1000)
+        assert loads["cooling_demand"][0] > 0
+        assert np.all(loads["cooling_demand"][1:] == 0)
+        assert np.allclose(loads["total_heating_load"],
+                           loads["heating_load"].sum(axis=1))
+        office = loads["building_index"] == 0
+        assert np.isclose(
+            loads["building_heating_peak"][0],
+            loads["heating_load"][:, office].sum(axis=1).max())
+        assert loads["building_heating_peak"][0] <= \
+            loads["heating_peak"][office].sum()
+
+        reference = prj.simulate_all_buildings()
+        assert np.allclose(reference["heating_load"], loads["heating_load"])
 
     def test_properties_project(self):
         """Tests properties of project class"""